@@ -8,8 +8,11 @@ class CompanyAdmin(admin.ModelAdmin):
         "id",
         "name",
         "homepage_url",
+        "homepage_confidence",
         "recruits_url",
         "recruits_url_status",
+        "recruits_url_score",
+        "recruits_url_checked_at",
     )
     search_fields = ("name", "homepage_url", "recruits_url")
     list_filter = ("recruits_url_status",)
@@ -0,0 +1,301 @@
+# api/crawl_runner.py
+"""
+Celery 태스크에서 Scrapy 스파이더를 회사 단위로 실행하는 러너.
+
+settings.CRAWL_RUNNER_MODE
+  - "subprocess": 회사마다 `scrapy crawl` 프로세스 1개 (기존 방식)
+  - "batch"     : 회사 CRAWL_BATCH_SIZE 개씩 묶어서 `scrapy crawl_batch` 프로세스 1개로 실행.
+                  프로세스 안에서는 CRAWL_COMPANIES_IN_FLIGHT 개 회사를 동시에 크롤링한다.
+
+run_spiders(..., multi_tenant_batch=N) 이면 (모드와 상관없이) 회사 N 개를 스파이더 "하나"에 넘긴다
+(`scrapy crawl <spider> -a company_ids=1,2,3`). 스파이더가 회사마다 상태를 따로 들고
+reactor 하나에서 수백 개 사이트를 같이 돈다. 지금은 discover_careers 만 지원한다.
+
+회사당 시간 예산(CRAWL_BUDGET_SECONDS)은 스파이더 안에서 CLOSESPIDER_TIMEOUT 으로 지켜지고,
+그래도 프로세스가 안 끝나면(행 걸림) 여기 watchdog 이 예산 + CRAWL_WATCHDOG_GRACE_SECONDS 뒤에 죽인다.
+
+어느 모드든 회사별 결과는 같은 모양의 dict 로 돌려준다.
+    {"company_id": 1, "exit": 0, "reason": "finished", "stdout": "...", "stderr": "..."}
+batch / multi-tenant 모드는 프로세스 하나의 로그를 여러 회사가 나눠 쓰므로, 실패한 회사의 stderr 에는
+그 회사 줄(`company_id=<id>` 가 들어간 줄)과 배치 stderr 의 마지막 부분을 붙인다 (_BatchLog).
+"""
+
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+RESULT_PREFIX = "CRAWL_RESULT "
+
+# batch / multi-tenant 실패 결과에 붙이는 로그 줄 수 (회사별 / 배치 stderr 꼬리 / 결과가 아닌 stdout)
+COMPANY_LOG_LINES = 40
+BATCH_LOG_TAIL_LINES = 100
+_COMPANY_ID_RE = re.compile(r"company_id=(\d+)")
+
+
+def scrapy_project_path() -> str:
+    return os.path.join(settings.BASE_DIR, "crawler")
+
+
+def scrapy_env() -> dict:
+    env = os.environ.copy()
+    # Scrapy 프로세스 안에서 Django ORM 사용 허용
+    env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    env.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
+    return env
+
+
+def run_spiders(spider_name, targets, on_result=None, capture_output=False, multi_tenant_batch=0):
+    """
+    targets: 스파이더 인자 dict 리스트 (company_id 필수).
+    on_result: 회사 하나가 끝날 때마다 호출되는 콜백 (result dict 1개를 받음).
+    capture_output: subprocess 모드에서 회사별 stdout/stderr 를 잡아둘지 여부.
+    multi_tenant_batch: 0 보다 크면 회사를 이 개수씩 스파이더 하나(company_ids 인자)로 돌린다.
+    """
+    mode = getattr(settings, "CRAWL_RUNNER_MODE", "subprocess")
+    results = []
+
+    def _emit(result):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    if multi_tenant_batch and multi_tenant_batch > 0:
+        for i in range(0, len(targets), multi_tenant_batch):
+            _run_multi_tenant(spider_name, targets[i:i + multi_tenant_batch], _emit)
+    elif mode == "batch":
+        batch_size = max(1, int(getattr(settings, "CRAWL_BATCH_SIZE", 200)))
+        for i in range(0, len(targets), batch_size):
+            _run_batch(spider_name, targets[i:i + batch_size], _emit)
+    else:
+        if mode != "subprocess":
+            logger.warning("crawl_runner: unknown CRAWL_RUNNER_MODE=%r, using subprocess", mode)
+        for t in targets:
+            _emit(_run_single(spider_name, t, capture_output))
+
+    return results
+
+
+def _watchdog_seconds(rounds=1):
+    """회사 rounds 번을 차례로 돌릴 때 허용할 최대 시간 (예산이 없으면 None = 무제한)."""
+    budget = int(getattr(settings, "CRAWL_BUDGET_SECONDS", 0) or 0)
+    if budget <= 0:
+        return None
+    grace = int(getattr(settings, "CRAWL_WATCHDOG_GRACE_SECONDS", 120))
+    return rounds * (budget + grace)
+
+
+def _spider_args(kwargs):
+    args = []
+    for key, value in kwargs.items():
+        args.extend(["-a", f"{key}={value}"])
+    return args
+
+
+def _run_single(spider_name, kwargs, capture_output):
+    company_id = kwargs.get("company_id")
+    cmd = ["scrapy", "crawl", spider_name, *_spider_args(kwargs)]
+
+    try:
+        proc = subprocess.run(
+            cmd,
+            cwd=scrapy_project_path(),
+            env=scrapy_env(),
+            capture_output=capture_output,
+            text=True,
+            check=False,
+            timeout=_watchdog_seconds(),
+        )
+    except subprocess.TimeoutExpired as e:
+        logger.warning("crawl_runner: watchdog killed spider=%s company_id=%s after %ss",
+                       spider_name, company_id, e.timeout)
+        return {
+            "company_id": company_id,
+            "exit": -9,
+            "reason": "watchdog_timeout",
+            "stdout": _as_text(e.stdout),
+            "stderr": _as_text(e.stderr),
+        }
+    except Exception as e:
+        return {"company_id": company_id, "exit": None, "reason": "start_failed", "error": str(e)}
+
+    return {
+        "company_id": company_id,
+        "exit": proc.returncode,
+        "reason": "finished" if proc.returncode == 0 else "error",
+        "stdout": proc.stdout or "",
+        "stderr": proc.stderr or "",
+    }
+
+
+def _as_text(val):
+    if isinstance(val, bytes):
+        return val.decode("utf-8", "ignore")
+    return val or ""
+
+
+def _run_batch(spider_name, batch, emit):
+    """
+    배치 1개를 `scrapy crawl_batch` 프로세스 하나로 실행 (회사마다 스파이더 1개).
+    """
+    concurrency = max(1, int(getattr(settings, "CRAWL_COMPANIES_IN_FLIGHT", 8)))
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False, encoding="utf-8"
+    ) as f:
+        json.dump(batch, f, ensure_ascii=False)
+        targets_path = f.name
+
+    cmd = [
+        "scrapy", "crawl_batch", spider_name,
+        "--targets", targets_path,
+        "--concurrency", str(concurrency),
+    ]
+
+    logger.info(
+        "crawl_runner: batch start spider=%s companies=%s in_flight=%s",
+        spider_name, len(batch), concurrency,
+    )
+
+    # 배치 전체 watchdog: 동시 실행 수 기준으로 몇 바퀴 도는지 계산해서 그만큼만 기다린다
+    rounds = -(-len(batch) // concurrency)
+    try:
+        _stream_results(spider_name, cmd, batch, emit, _watchdog_seconds(rounds))
+    finally:
+        os.unlink(targets_path)
+
+
+def _run_multi_tenant(spider_name, batch, emit):
+    """
+    회사 여러 개를 스파이더 하나(`-a company_ids=...`)로 실행.
+    스파이더가 회사 하나를 끝낼 때마다 stdout 에 CRAWL_RESULT 줄을 찍는다.
+    스파이더가 시간 예산(CLOSESPIDER_TIMEOUT)을 회사 수만큼 늘리므로 watchdog 도 회사 수만큼 기다린다.
+    """
+    ids = ",".join(str(t.get("company_id")) for t in batch)
+    cmd = ["scrapy", "crawl", spider_name, "-a", f"company_ids={ids}"]
+
+    logger.info(
+        "crawl_runner: multi-tenant start spider=%s companies=%s",
+        spider_name, len(batch),
+    )
+    _stream_results(spider_name, cmd, batch, emit, _watchdog_seconds(len(batch)))
+
+
+class _BatchLog:
+    """
+    배치 프로세스의 stdout(결과가 아닌 줄) / stderr(Scrapy 로그)를 모아 둔다.
+    stderr 는 예전처럼 워커 stderr 로도 그대로 흘린다.
+    """
+
+    def __init__(self, batch):
+        self.lock = threading.Lock()
+        self.by_company = {
+            str(t.get("company_id")): deque(maxlen=COMPANY_LOG_LINES) for t in batch
+        }
+        self.tail = deque(maxlen=BATCH_LOG_TAIL_LINES)
+        self.stdout = deque(maxlen=BATCH_LOG_TAIL_LINES)
+
+    def add_stderr(self, line):
+        with self.lock:
+            self.tail.append(line)
+            for company_id in set(_COMPANY_ID_RE.findall(line)):
+                lines = self.by_company.get(company_id)
+                if lines is not None:
+                    lines.append(line)
+
+    def add_stdout(self, line):
+        with self.lock:
+            self.stdout.append(line)
+
+    def pump_stderr(self, stream):
+        for line in stream:
+            sys.stderr.write(line)
+            self.add_stderr(line)
+
+    def attach(self, result):
+        """실패한 결과에 그 회사 로그 줄 + 배치 stderr 꼬리를 붙인다 (성공한 결과는 그대로)."""
+        if result.get("exit") == 0:
+            return result
+        with self.lock:
+            own = "".join(self.by_company.get(str(result.get("company_id")), ()))
+            tail = "".join(self.tail)
+            stdout = "".join(self.stdout)
+        stderr = f"{own}--- batch stderr tail ---\n{tail}"
+        if result.get("error"):
+            stderr = f"{result['error']}\n{stderr}"
+        return {**result, "stdout": result.get("stdout") or stdout, "stderr": result.get("stderr") or stderr}
+
+
+def _stream_results(spider_name, cmd, batch, emit, deadline):
+    """
+    cmd 프로세스의 stdout 에서 CRAWL_RESULT 줄을 읽어 회사별 결과로 바로 넘긴다.
+    Scrapy 로그(stderr)는 별도 스레드가 읽어서 워커 로그로 흘리고, 실패한 회사 결과에 붙인다.
+    deadline 초가 지나도 안 끝나면 프로세스를 죽인다.
+    """
+    reported = set()
+    log = _BatchLog(batch)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=scrapy_project_path(),
+            env=scrapy_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        )
+    except Exception as e:
+        for t in batch:
+            emit({"company_id": t.get("company_id"), "exit": None, "reason": "start_failed", "error": str(e)})
+        return
+
+    # stdout 만 읽고 stderr 를 안 비우면 파이프가 차서 자식 프로세스가 멈춘다
+    pump = threading.Thread(target=log.pump_stderr, args=(proc.stderr,), daemon=True)
+    pump.start()
+
+    killed = threading.Event()
+
+    def _kill():
+        killed.set()
+        logger.warning("crawl_runner: watchdog killed batch spider=%s after %ss", spider_name, deadline)
+        proc.kill()
+
+    timer = threading.Timer(deadline, _kill) if deadline else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+
+    try:
+        for line in proc.stdout:
+            if not line.startswith(RESULT_PREFIX):
+                log.add_stdout(line)
+                continue
+            try:
+                result = json.loads(line[len(RESULT_PREFIX):])
+            except ValueError:
+                continue
+            reported.add(str(result.get("company_id")))
+            emit(log.attach(result))
+        proc.wait()
+        pump.join(timeout=10)
+    finally:
+        if timer:
+            timer.cancel()
+
+    # 프로세스가 중간에 죽으면 결과를 못 받은 회사가 생긴다 -> 실패로 보고
+    for t in batch:
+        if str(t.get("company_id")) not in reported:
+            emit(log.attach({
+                "company_id": t.get("company_id"),
+                "exit": proc.returncode or 1,
+                "reason": "watchdog_timeout" if killed.is_set() else "batch_aborted",
+            }))
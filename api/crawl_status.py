@@ -0,0 +1,346 @@
+# api/crawl_status.py
+"""
+크롤링 사이클의 분산 락 + 진행 상태 (Redis).
+
+- LOCK_KEY   : 사이클 1개만 돌도록 잡는 락. 값 = cycle_id, 만료(CRAWL_LOCK_TTL_SECONDS) 있음.
+               진행 상황을 기록할 때마다 heartbeat 로 만료를 연장한다.
+               워커가 죽어서 heartbeat 가 끊기면 만료 후 자동으로 풀린다.
+- STATUS_KEY : 사이클 메타 정보 JSON (state / cycle_id / mode / started_at / finished_at / stage)
+- PROGRESS_KEY: 카운터 hash
+    "<stage>:total", "<stage>:done", "<stage>:started_at", "<stage>:<기타 카운터>"
+    "postings_created", "postings_updated", "pages_fetched", "pages_not_modified", "bytes_saved"
+    "closed.<finish_reason>" (스파이더 종료 사유별 회사 수)
+
+CrawlStatusView 는 get_status() 로 위 두 개를 합쳐 경과시간/처리속도/ETA 를 계산해서 보여준다.
+
+체크포인트 (재시작/재트리거 시 이어서 돌기)
+- CURRENT_CYCLE_KEY : 끝나지 않은 사이클의 cycle_id. 정상 종료(DONE) 때만 지운다.
+- DONE_KEY          : 사이클/단계별로 처리를 마친 company id set.
+워커가 죽거나 사이클이 FAILED 로 끝나면 CURRENT_CYCLE_KEY 가 남아 있으므로,
+다음 run_full_crawling_cycle 은 같은 cycle_id 로 시작해서 이미 끝난 회사는 건너뛴다.
+- HEARTBEAT_KEY     : 사이클이 마지막으로 진행 상황을 기록한 시각. 락이 만료됐어도 이 값이
+                      CRAWL_CYCLE_STALE_SECONDS 안이면 예전 실행이 아직 돌고 있다고 보고 이어받지 않는다
+                      (이어받으면 같은 cycle_id 의 진행 카운터/pending 수를 초기화해 버린다).
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis 클라이언트: settings.REDIS_URL 을 사용 (예: redis://redis:6379/0)
+# 스파이더 종료 시 add_counters 로도 불리므로 Redis 가 멈추면 REDIS_SOCKET_TIMEOUT_SECONDS 안에 오류로 끝낸다
+_timeout = float(getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 1))
+r = redis.from_url(
+    getattr(settings, "REDIS_URL", "redis://redis:6379/0"),
+    socket_timeout=_timeout,
+    socket_connect_timeout=_timeout,
+)
+
+# 상태/락 키(기존 이름 유지)
+LOCK_KEY = "crawler:lock"
+STATUS_KEY = "crawler:status"
+PROGRESS_KEY = "crawler:progress"
+PENDING_KEY = "crawler:pending:{cycle_id}"
+CURRENT_CYCLE_KEY = "crawler:cycle:current"
+DONE_KEY = "crawler:cycle:{cycle_id}:done:{stage}"
+HEARTBEAT_KEY = "crawler:cycle:{cycle_id}:heartbeat"
+CHECKPOINT_STAGES = ("homepages", "revalidate", "discover", "collect")
+
+# 끝난 사이클의 상태/카운터를 얼마나 남겨둘지
+FINISHED_STATUS_TTL = 7 * 24 * 3600
+
+# 락 주인(cycle_id)일 때만 만료 연장 / 삭제
+_EXTEND_IF_OWNER = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_DELETE_IF_OWNER = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _lock_ttl():
+    return int(getattr(settings, "CRAWL_LOCK_TTL_SECONDS", 1800))
+
+
+def _stale_seconds():
+    return int(getattr(settings, "CRAWL_CYCLE_STALE_SECONDS", 3600))
+
+
+def _checkpoint_ttl():
+    return int(float(getattr(settings, "CRAWL_CHECKPOINT_TTL_HOURS", 48)) * 3600)
+
+
+def _now_iso():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _decode(val):
+    if isinstance(val, bytes):
+        return val.decode("utf-8", "ignore")
+    return val
+
+
+def _safe_json_loads(val):
+    """bytes/str에 대해 안전하게 JSON 디코드, 실패 시 None"""
+    if val is None:
+        return None
+    try:
+        return json.loads(_decode(val))
+    except Exception:
+        return None
+
+
+# ===== 락 =====
+
+def acquire_lock(cycle_id):
+    return bool(r.set(LOCK_KEY, cycle_id, nx=True, ex=_lock_ttl()))
+
+
+def heartbeat(cycle_id):
+    """사이클이 살아 있다고 기록하고, cycle_id 가 락 주인이면 만료 시간을 연장한다."""
+    if not cycle_id:
+        return False
+    r.set(HEARTBEAT_KEY.format(cycle_id=cycle_id), time.time(), ex=_checkpoint_ttl())
+    return bool(r.eval(_EXTEND_IF_OWNER, 1, LOCK_KEY, cycle_id, _lock_ttl()))
+
+
+def last_heartbeat(cycle_id):
+    """cycle_id 가 마지막으로 heartbeat 한 시각 (unix time), 기록이 없으면 None."""
+    try:
+        return float(_decode(r.get(HEARTBEAT_KEY.format(cycle_id=cycle_id))))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_alive(cycle_id):
+    """CRAWL_CYCLE_STALE_SECONDS 안에 heartbeat 가 있었으면 True (락이 만료됐어도 아직 도는 중)."""
+    last = last_heartbeat(cycle_id)
+    return last is not None and time.time() - last < _stale_seconds()
+
+
+def release_lock(cycle_id):
+    return bool(r.eval(_DELETE_IF_OWNER, 1, LOCK_KEY, cycle_id))
+
+
+def is_running():
+    return bool(r.get(LOCK_KEY))
+
+
+def current_cycle_id():
+    return _decode(r.get(LOCK_KEY))
+
+
+# ===== 사이클 상태 =====
+
+def _write_status(payload, ttl=None):
+    r.set(STATUS_KEY, json.dumps(payload, ensure_ascii=False), ex=ttl)
+
+
+def start_cycle(cycle_id, mode, resumed=False):
+    pipe = r.pipeline()
+    pipe.delete(PROGRESS_KEY)
+    pipe.hset(PROGRESS_KEY, "started_at", time.time())
+    pipe.set(CURRENT_CYCLE_KEY, cycle_id, ex=_checkpoint_ttl())
+    # 중단됐던 사이클을 이어받는 경우, 그때 남은 태스크 수는 의미가 없으므로 초기화
+    pipe.delete(PENDING_KEY.format(cycle_id=cycle_id))
+    pipe.set(HEARTBEAT_KEY.format(cycle_id=cycle_id), time.time(), ex=_checkpoint_ttl())
+    pipe.execute()
+    _write_status({
+        "state": "RUNNING",
+        "cycle_id": cycle_id,
+        "mode": mode,
+        "stage": None,
+        "resumed": resumed,
+        "started_at": _now_iso(),
+    })
+
+
+def set_stage(cycle_id, stage):
+    payload = _safe_json_loads(r.get(STATUS_KEY)) or {}
+    if payload.get("cycle_id") != cycle_id:
+        return
+    payload["stage"] = stage
+    _write_status(payload)
+    heartbeat(cycle_id)
+
+
+def finish_cycle(cycle_id, state="DONE", error=None):
+    payload = _safe_json_loads(r.get(STATUS_KEY)) or {}
+    if payload.get("cycle_id") == cycle_id:
+        payload["state"] = state
+        payload["finished_at"] = _now_iso()
+        if error:
+            payload["error"] = str(error)[:1000]
+        _write_status(payload, ttl=FINISHED_STATUS_TTL)
+        pipe = r.pipeline()
+        pipe.hset(PROGRESS_KEY, "finished_at", time.time())
+        pipe.expire(PROGRESS_KEY, FINISHED_STATUS_TTL)
+        pipe.execute()
+    # 끝난(실패 포함) 사이클은 바로 이어받을 수 있게 heartbeat 를 지운다
+    r.delete(PENDING_KEY.format(cycle_id=cycle_id), HEARTBEAT_KEY.format(cycle_id=cycle_id))
+    if state == "DONE":
+        clear_checkpoints(cycle_id)
+    release_lock(cycle_id)
+
+
+# ===== 체크포인트 =====
+
+def unfinished_cycle_id():
+    """끝나지 않은(중단/실패) 사이클이 있으면 그 cycle_id, 없으면 None."""
+    return _decode(r.get(CURRENT_CYCLE_KEY))
+
+
+def mark_done(cycle_id, stage, *company_ids):
+    if not cycle_id or not company_ids:
+        return
+    key = DONE_KEY.format(cycle_id=cycle_id, stage=stage)
+    pipe = r.pipeline()
+    pipe.sadd(key, *(int(cid) for cid in company_ids))
+    pipe.expire(key, _checkpoint_ttl())
+    pipe.execute()
+
+
+def done_ids(cycle_id, stage):
+    if not cycle_id:
+        return set()
+    members = r.smembers(DONE_KEY.format(cycle_id=cycle_id, stage=stage)) or ()
+    return {int(_decode(m)) for m in members}
+
+
+def clear_checkpoints(cycle_id):
+    keys = [DONE_KEY.format(cycle_id=cycle_id, stage=stage) for stage in CHECKPOINT_STAGES]
+    if _decode(r.get(CURRENT_CYCLE_KEY)) == cycle_id:
+        keys.append(CURRENT_CYCLE_KEY)
+    r.delete(*keys)
+
+
+# ===== 진행 카운터 =====
+
+def stage_add_total(cycle_id, stage, n):
+    """stage 에 처리할 회사 n 개가 추가됨 (샤드/streaming 태스크마다 자기 몫만 더한다)."""
+    if not cycle_id:
+        return
+    pipe = r.pipeline()
+    pipe.hsetnx(PROGRESS_KEY, f"{stage}:started_at", time.time())
+    pipe.hincrby(PROGRESS_KEY, f"{stage}:total", int(n))
+    pipe.execute()
+    heartbeat(cycle_id)
+
+
+def stage_done(cycle_id, stage, n=1, **counters):
+    """stage 에서 회사 n 개 처리 완료 + 기타 카운터 증가 (예: updated=1, failed=1)."""
+    if not cycle_id:
+        return
+    pipe = r.pipeline()
+    pipe.hincrby(PROGRESS_KEY, f"{stage}:done", int(n))
+    for key, value in counters.items():
+        if value:
+            pipe.hincrby(PROGRESS_KEY, f"{stage}:{key}", int(value))
+    pipe.execute()
+    heartbeat(cycle_id)
+
+
+def add_counters(**counters):
+    """
+    스파이더(Scrapy 프로세스) 쪽에서 쓰는 사이클 전체 카운터.
+    사이클이 돌고 있지 않으면(수동 실행 등) 기록하지 않는다.
+    스파이더가 오래 도는 동안에도 사이클 heartbeat 가 끊기지 않게 같이 기록한다.
+    """
+    cycle_id = current_cycle_id()
+    if not cycle_id:
+        return
+    pipe = r.pipeline()
+    for key, value in counters.items():
+        if value:
+            pipe.hincrby(PROGRESS_KEY, key, int(value))
+    pipe.execute()
+    heartbeat(cycle_id)
+
+
+# ===== streaming 모드: 남은 태스크 수 =====
+
+def pending_add(cycle_id, n=1):
+    key = PENDING_KEY.format(cycle_id=cycle_id)
+    pipe = r.pipeline()
+    pipe.incrby(key, int(n))
+    pipe.expire(key, FINISHED_STATUS_TTL)
+    pipe.execute()
+
+
+def pending_done(cycle_id):
+    """남은 태스크 수를 1 줄이고 남은 수를 돌려준다."""
+    return int(r.decr(PENDING_KEY.format(cycle_id=cycle_id)))
+
+
+# ===== 조회 =====
+
+def _rate_and_eta(total, done, started_at, now):
+    elapsed = max(0.0, now - started_at) if started_at else 0.0
+    if not done or not elapsed:
+        return elapsed, None, None
+    per_sec = done / elapsed
+    remaining = max(0, total - done)
+    return elapsed, round(per_sec * 60, 2), int(remaining / per_sec)
+
+
+def get_status():
+    payload = _safe_json_loads(r.get(STATUS_KEY)) or {"state": "IDLE"}
+
+    raw = {_decode(k): _decode(v) for k, v in (r.hgetall(PROGRESS_KEY) or {}).items()}
+    if not raw:
+        return payload
+
+    def _num(key, cast=int):
+        try:
+            return cast(raw[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    started_at = _num("started_at", float)
+    now = _num("finished_at", float) or time.time()
+
+    stages = {}
+    for key in raw:
+        if ":" not in key:
+            continue
+        stage, field = key.split(":", 1)
+        info = stages.setdefault(stage, {})
+        if field == "started_at":
+            continue
+        info[field] = _num(key) or 0
+
+    etas = []
+    for stage, info in stages.items():
+        info.setdefault("total", 0)
+        info.setdefault("done", 0)
+        elapsed, per_min, eta = _rate_and_eta(
+            info["total"], info["done"], _num(f"{stage}:started_at", float), now,
+        )
+        info["elapsed_seconds"] = int(elapsed)
+        info["companies_per_minute"] = per_min
+        info["eta_seconds"] = eta
+        if eta is not None:
+            etas.append(eta)
+
+    payload["elapsed_seconds"] = int(now - started_at) if started_at else None
+    payload["eta_seconds"] = max(etas) if etas and payload.get("state") == "RUNNING" else None
+    payload["stages"] = stages
+    for key in ("postings_created", "postings_updated", "pages_fetched", "pages_not_modified", "bytes_saved"):
+        payload[key] = _num(key) or 0
+    # 스파이더 종료 사유별 회사 수 (예산 초과로 끊긴 회사가 몇 개인지 등)
+    payload["close_reasons"] = {
+        key[len("closed."):]: _num(key) or 0 for key in raw if key.startswith("closed.")
+    }
+    return payload
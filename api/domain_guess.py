@@ -0,0 +1,312 @@
+# api/domain_guess.py
+"""
+회사 이름에서 홈페이지 도메인을 추측해서 먼저 찔러보는 빠른 경로.
+
+검색엔진(DuckDuckGo)은 느리고 202 로 자주 막힌다. 그런데 중소 IT 회사 이름은 대부분
+영어 이름을 한글로 적은 것이라 (이노시스아이티 -> innosysit.co.kr, 메가존클라우드 -> megazone...)
+이름만 보고도 도메인을 꽤 맞출 수 있다.
+
+1) 후보 라벨 만들기 (candidate_labels)
+   - (주), 주식회사 같은 법인 표기 제거, 괄호 안 이름(예: 인프런(Inflearn))은 별도 후보
+   - KNOWN_ALIASES: 이름만으로는 알 수 없는 회사 -> 도메인 라벨
+   - LOANWORDS: 외래어 조각 -> 영어 (테크 -> tech, 네트웍스 -> networks ...), 가장 긴 것부터 매칭
+   - 나머지 한글은 국어의 로마자 표기법(음절 단위, 간략)으로 변환
+   - 끝의 코리아/코퍼레이션/컴퍼니 등을 뺀 변형도 후보
+2) 라벨 x HOMEPAGE_GUESS_TLDS(.co.kr, .com, .kr) 를 동시에 GET (리다이렉트 따라감)
+3) 응답 페이지의 <title> / og:site_name / og:title 에 회사 이름이 들어있을 때만 "확신"으로 본다.
+확신할 수 있는 후보가 없으면 None -> 호출 쪽(homepage_resolver)이 검색엔진으로 넘어간다.
+"""
+
+import asyncio
+import itertools
+import logging
+import re
+
+import httpx
+from django.conf import settings
+
+from .utils import HEADERS, _normalize_url
+
+logger = logging.getLogger(__name__)
+
+# 법인 표기 (이름 앞뒤에서 제거)
+LEGAL_MARKERS = (
+    "주식회사", "유한책임회사", "유한회사", "합자회사", "합명회사", "사단법인", "재단법인",
+    "(주)", "(유)", "(사)", "(재)", "㈜", "㈔",
+)
+
+# 끝에 붙어 있으면 뺀 이름도 후보로 쓰는 단어 (센드버드코리아 -> sendbird)
+TRAILING_WORDS = ("코리아", "코퍼레이션", "컴퍼니", "그룹", "홀딩스")
+
+# 이름만으로는 도메인을 알 수 없는 회사 (정규화한 이름 -> 라벨)
+KNOWN_ALIASES = {
+    "한글과컴퓨터": ["hancom"],
+    "더존비즈온": ["douzone"],
+    "안랩": ["ahnlab"],
+    "다우기술": ["daou"],
+    "다우데이타": ["daoudata"],
+    "영림원소프트랩": ["ksystem"],
+    "엑셈": ["ex-em"],
+    "엔에이치엔": ["nhn"],
+    "배달의민족": ["baemin"],
+    "우아한형제들": ["woowahan"],
+    "당근마켓": ["daangn"],
+    "마켓컬리": ["kurly"],
+    "오늘의집": ["ohou"],
+    "하이퍼커넥트": ["hpcnt"],
+    "한국사이버결제": ["kcp"],
+    "케이지이니시스": ["inicis"],
+    "kg이니시스": ["inicis"],
+    "빗썸코리아": ["bithumbcorp", "bithumb"],
+    "넥슨코리아": ["nexon"],
+    "엔씨소프트": ["ncsoft"],
+    "컴투스": ["com2us"],
+    "야놀자": ["yanolja"],
+    "직방": ["zigbang"],
+    "무신사": ["musinsa"],
+}
+
+# 외래어 조각 -> 영어 철자 (앞의 것이 우선). 긴 조각부터 매칭한다.
+LOANWORDS = {
+    "테크놀로지스": ["technologies"], "테크놀로지": ["technology"], "테크": ["tech"], "텍": ["tech", "tec"],
+    "소프트랩": ["softlab"], "소프트": ["soft"], "시스템즈": ["systems"], "시스템": ["system", "systems"],
+    "시스": ["sys"], "솔루션즈": ["solutions"], "솔루션": ["solution"], "솔루": ["solu"],
+    "네트웍스": ["networks"], "네트워크스": ["networks"], "네트워크": ["network"], "네트웍": ["network"],
+    "넷": ["net"], "웍스": ["works"], "워크스": ["works"], "웨어": ["ware"],
+    "데이타": ["data"], "데이터": ["data"], "클라우드": ["cloud"], "코리아": ["korea"],
+    "글로벌": ["global"], "랩스": ["labs"], "랩": ["lab"], "아이씨티": ["ict"], "아이티": ["it"],
+    "에이아이": ["ai"], "이노": ["inno"], "네오": ["neo"], "디지털": ["digital"], "미디어": ["media"],
+    "바이오": ["bio"], "에너지": ["energy"], "엔지니어링": ["engineering"], "컴퍼니": ["company"],
+    "코퍼레이션": ["corp"], "커뮤니케이션즈": ["communications"], "커뮤니케이션": ["communication"],
+    "시큐리티": ["security"], "시큐어": ["secure"], "시큐": ["secu"], "인포": ["info"], "링크": ["link"],
+    "플랫폼": ["platform"], "게임즈": ["games"], "게임": ["game"], "엔터테인먼트": ["entertainment"],
+    "모바일": ["mobile"], "커머스": ["commerce"], "페이먼츠": ["payments"], "페이": ["pay"],
+    "뱅크": ["bank"], "마켓": ["market"], "센터": ["center"], "그룹": ["group"], "파트너스": ["partners"],
+    "컨설팅": ["consulting"], "에듀": ["edu"], "스마트": ["smart"], "로보틱스": ["robotics"],
+    "모빌리티": ["mobility"], "헬스케어": ["healthcare"], "케어": ["care"], "매틱스": ["matics"],
+    "포인트": ["point"], "베이스": ["base"], "오픈": ["open"], "드림": ["dream"], "웨이브": ["wave"],
+    "센스": ["sense"], "뉴로": ["neuro"], "라인": ["line"], "플러스": ["plus"], "브리지": ["bridge"],
+    "브릿지": ["bridge"], "그리드": ["grid"], "핸즈": ["hands"], "캠퍼스": ["campus"], "스쿨": ["school"],
+    "클래스": ["class"], "버추얼": ["virtual"], "버츄얼": ["virtual"], "사인": ["sign"], "맥스": ["max"],
+    "나인": ["nine", "9"], "투": ["2", "two"], "원": ["one"], "스타": ["star"], "코인": ["coin"],
+    "에이치": ["h"], "에스": ["s"], "에이": ["a"], "케이": ["k"], "엘": ["l"], "엠": ["m"], "엔": ["n"],
+    "티": ["t"], "씨": ["c"], "비": ["b"], "디": ["d"], "제이": ["j"], "알": ["r"], "피": ["p"],
+}
+_LOANWORD_KEYS = sorted(LOANWORDS, key=len, reverse=True)
+
+# 국어의 로마자 표기법 (음절 단위 간략판: 연음/자음동화는 무시)
+_INITIALS = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+_MEDIALS = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo", "u", "wo", "we",
+            "wi", "yu", "eu", "ui", "i"]
+_FINALS = ["", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l", "p", "l", "m", "p", "p",
+           "t", "t", "ng", "t", "t", "k", "t", "p", "t"]
+
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.I | re.S)
+_META_RE = re.compile(
+    rb"<meta[^>]+property=[\"']og:(?:site_name|title)[\"'][^>]*content=[\"']([^\"']*)[\"']", re.I,
+)
+_CHARSET_RE = re.compile(rb"charset=[\"']?([\w-]+)", re.I)
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+
+# 제목 확인에는 앞부분만 있으면 된다
+MAX_PROBE_BYTES = 64 * 1024
+
+
+def _setting(name, default, cast=int):
+    return cast(getattr(settings, name, default))
+
+
+def _tlds():
+    raw = getattr(settings, "HOMEPAGE_GUESS_TLDS", "co.kr,com,kr")
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    return [t.strip().lstrip(".") for t in raw if t.strip()]
+
+
+def strip_legal_markers(name):
+    name = (name or "").strip()
+    for marker in LEGAL_MARKERS:
+        name = name.replace(marker, " ")
+    return re.sub(r"[\s_]+", " ", name).strip()
+
+
+def compact(text):
+    return _NON_WORD_RE.sub("", (text or "").lower())
+
+
+def romanize(hangul):
+    out = []
+    for ch in hangul:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_INITIALS[code // 588] + _MEDIALS[(code % 588) // 28] + _FINALS[code % 28])
+        elif ch.isascii() and ch.isalnum():
+            out.append(ch.lower())
+    return "".join(out)
+
+
+def _spellings(word):
+    """이름 한 덩어리 -> 가능한 라벨들 (조각별 철자 조합)."""
+    pieces = []
+    i = 0
+    while i < len(word):
+        ch = word[i]
+        if ch.isascii():
+            j = i
+            while j < len(word) and word[j].isascii():
+                j += 1
+            latin = re.sub(r"[^0-9a-z]", "", word[i:j].lower())
+            if latin:
+                pieces.append([latin])
+            i = j
+            continue
+        for key in _LOANWORD_KEYS:
+            if word.startswith(key, i):
+                pieces.append(LOANWORDS[key])
+                i += len(key)
+                break
+        else:
+            pieces.append([romanize(ch)])
+            i += 1
+    return ["".join(p) for p in itertools.product(*pieces)] if pieces else []
+
+
+def candidate_labels(name):
+    """회사 이름 -> 도메인 라벨 후보 (우선순위 순, 최대 HOMEPAGE_GUESS_MAX_LABELS 개)."""
+    base = strip_legal_markers(name)
+    # 괄호 안 이름은 따로 후보로 (예: 인프런(Inflearn), 오늘의집(버킷플레이스))
+    inner = re.findall(r"\(([^)]*)\)", base)
+    outer = re.sub(r"\([^)]*\)", " ", base).strip()
+
+    words = []
+    for w in [outer, *inner]:
+        w = re.sub(r"\s+", "", w)
+        if not w:
+            continue
+        words.append(w)
+        for tail in TRAILING_WORDS:
+            if w.endswith(tail) and len(w) > len(tail) + 1:
+                words.append(w[: -len(tail)])
+
+    labels = []
+    for w in words:
+        labels.extend(KNOWN_ALIASES.get(w.lower(), []))
+        labels.extend(_spellings(w))
+
+    seen = set()
+    result = []
+    for label in labels:
+        label = label.strip("-")
+        if len(label) < 2 or label in seen:
+            continue
+        seen.add(label)
+        result.append(label)
+    return result[: max(1, _setting("HOMEPAGE_GUESS_MAX_LABELS", 4))]
+
+
+def candidate_urls(name):
+    # http 로 찌른다: https 사이트는 대부분 https 로 리다이렉트하고, http 전용 사이트도 잡을 수 있다
+    return [f"http://{label}.{tld}/" for label in candidate_labels(name) for tld in _tlds()]
+
+
+def decode_body(body, content_type):
+    m = _CHARSET_RE.search(content_type.encode("ascii", "ignore")) or _CHARSET_RE.search(body[:4096])
+    encodings = [m.group(1).decode("ascii", "ignore")] if m else []
+    for enc in [*encodings, "utf-8", "cp949"]:
+        try:
+            return body.decode(enc)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return body.decode("utf-8", "ignore")
+
+
+def page_names(body, content_type=""):
+    """페이지가 스스로 밝히는 이름들: <title>, og:site_name, og:title."""
+    head = body[:MAX_PROBE_BYTES]
+    m = _TITLE_RE.search(head)
+    found = ([m.group(1)] if m else []) + _META_RE.findall(head)
+    return [decode_body(raw, content_type) for raw in found]
+
+
+def name_keys(name):
+    """비교용 회사 이름들: 법인 표기를 뺀 이름 + 괄호 안 이름 (공백/기호 제거, 소문자)."""
+    base = strip_legal_markers(name)
+    keys = [compact(re.sub(r"\([^)]*\)", "", base))]
+    keys += [compact(k) for k in re.findall(r"\(([^)]*)\)", base)]
+    return [k for k in keys if len(k) >= 2]
+
+
+def name_matches(name, texts):
+    """texts(제목 등) 중 하나에 회사 이름(법인 표기 제외)이나 괄호 안 이름이 들어 있으면 True."""
+    keys = name_keys(name)
+    compacted = [compact(t) for t in texts]
+    return any(k in t for k in keys for t in compacted)
+
+
+async def fetch_page(client, url, max_bytes=MAX_PROBE_BYTES):
+    """
+    url 의 앞부분(max_bytes)만 받아온다.
+    리턴: (최종 URL, body bytes, content-type) 또는 None (200 이 아니거나 에러)
+    """
+    try:
+        async with client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                return None
+            body = b""
+            async for chunk in resp.aiter_bytes():
+                body += chunk
+                if len(body) >= max_bytes:
+                    break
+            return str(resp.url), body, resp.headers.get("content-type", "")
+    except (httpx.HTTPError, UnicodeError):
+        return None
+
+
+async def _probe(client, url, name):
+    """url 을 열어서 회사 이름이 확인되면 최종(리다이렉트 후) 홈페이지 URL, 아니면 None."""
+    page = await fetch_page(client, url)
+    if page is None:
+        return None
+    final_url, body, content_type = page
+    if not name_matches(name, page_names(body, content_type)):
+        return None
+    return _normalize_url(final_url)
+
+
+def guess_homepages(companies):
+    """
+    companies: (company_id, company_name) 리스트.
+    리턴: {company_id: 홈페이지 URL} (확신할 수 있는 회사만)
+    """
+    companies = [(cid, name, candidate_urls(name)) for cid, name in companies]
+    companies = [c for c in companies if c[2]]
+    if not companies:
+        return {}
+    return asyncio.run(_guess_all(companies))
+
+
+async def _guess_all(companies):
+    concurrency = max(1, _setting("HOMEPAGE_GUESS_CONCURRENCY", 32))
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+    timeout = httpx.Timeout(_setting("HOMEPAGE_GUESS_TIMEOUT_SECONDS", 5, float))
+
+    # 중소기업 사이트는 인증서가 깨진 경우가 많다. 제목만 확인하는 용도라 검증은 끈다.
+    async with httpx.AsyncClient(
+        headers=HEADERS, limits=limits, timeout=timeout, follow_redirects=True, verify=False,
+    ) as client:
+
+        async def _one(url, name):
+            async with sem:
+                return await _probe(client, url, name)
+
+        async def _company(cid, name, urls):
+            # 후보는 동시에 찌르되, 결과는 후보 우선순위대로 고른다
+            found = await asyncio.gather(*(_one(u, name) for u in urls))
+            picked = next((u for u in found if u), None)
+            if picked:
+                logger.info("[domain_guess] %s -> %s", name, picked)
+            return cid, picked
+
+        pairs = await asyncio.gather(*(_company(*c) for c in companies))
+    return {cid: url for cid, url in pairs if url}
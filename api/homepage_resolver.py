@@ -0,0 +1,196 @@
+# api/homepage_resolver.py
+"""
+회사 홈페이지 검색을 비동기로 여러 개 동시에 처리하는 리졸버.
+
+utils.find_homepage_for_company 는 회사 1개씩 requests.get 으로 검색하고
+재시도 사이에 time.sleep(3) 을 하기 때문에, 회사 수천 개면 대부분의 시간을 잠자면서 보낸다.
+여기서는
+  - httpx.AsyncClient 하나(커넥션 풀 공유)로
+  - 최대 HOMEPAGE_RESOLVE_CONCURRENCY 개 회사를 동시에 검색하고
+  - 202/에러 때는 asyncio.sleep 으로 (다른 회사 검색을 막지 않고) 지수 백오프 후 재시도한다.
+  - SEARCH_THROTTLE_ENABLED 면 검색 요청 간격은 모든 워커가 공유하는 AIMD 스로틀
+    (api/search_throttle.py)이 정하고, 응답마다 200/202 를 기록해서 속도를 조절하게 한다.
+HOMEPAGE_DOMAIN_GUESS 가 켜져 있으면 검색 전에 이름으로 도메인을 추측해서 먼저 확인한다
+(api/domain_guess.py). 확인된 회사는 검색하지 않는다.
+
+검색은 SEARCH_PROVIDERS 순서의 여러 백엔드(api/search_providers.py)를 hedging 으로 부른다.
+  - 첫 provider 를 부르고, SEARCH_HEDGE_DELAY_SECONDS 안에 답이 없거나 후보 없이 끝나면 다음 provider 도 시작
+  - 먼저 후보를 돌려준 provider 의 답을 쓰고, 나머지는 취소
+  - cache provider 의 빈 결과(negative)는 그대로 "없음" 으로 끝낸다
+새로 검색한 결과(후보 리스트)는 api/search_cache.py 에 저장해서 다음 사이클의 cache provider 가 쓴다.
+
+HOMEPAGE_VERIFY 가 켜져 있으면 (추측/검색으로 나온) 상위 후보들을 실제로 열어서 점수를 매기고
+가장 그럴듯한 것을 confidence 와 함께 고른다 (api/homepage_verify.py).
+꺼져 있으면 utils 와 같이 첫 번째 후보를 쓴다 (confidence 없음).
+
+사용:
+    resolve_homepages([(company_id, company_name), ...])
+        ->  {company_id: (url 또는 None, confidence 또는 None)}
+"""
+
+import asyncio
+import logging
+from collections import Counter
+
+import httpx
+from django.conf import settings
+
+from . import domain_guess, homepage_verify, search_cache
+from .search_providers import build_providers
+from .utils import HEADERS
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default, cast=int):
+    return cast(getattr(settings, name, default))
+
+
+def homepage_query(company_name):
+    return f"{company_name} 공식 홈페이지"
+
+
+def resolve_homepages(companies, bypass_cache=False):
+    """
+    companies: (company_id, company_name) 리스트.
+    bypass_cache: True 면 캐시를 읽지 않고 전부 새로 검색한다 (결과는 캐시에 다시 저장).
+    리턴: {company_id: (홈페이지 URL 또는 None, confidence 또는 None)}
+    Celery 워커(동기 코드)에서 부르는 입구. 안에서 이벤트 루프를 하나 돌린다.
+    """
+    companies = list(companies)
+    if not companies:
+        return {}
+
+    guessed = {}
+    if getattr(settings, "HOMEPAGE_DOMAIN_GUESS", True):
+        guessed = domain_guess.guess_homepages(companies)
+
+    # 같은 이름의 회사는 검색 1번으로 끝내도록 정규화한 검색어 기준으로 묶는다
+    queries = {}
+    names = {}
+    for cid, name in companies:
+        if cid in guessed:
+            continue
+        query = search_cache.normalize_query(homepage_query(name))
+        queries[cid] = query
+        names.setdefault(query, name)
+    if not queries:
+        return _pick(companies, {cid: [url] for cid, url in guessed.items()})
+
+    providers = build_providers(bypass_cache=bypass_cache)
+    for provider in providers:
+        # cache provider 는 여기서 배치 전체를 MGET 1번으로 읽어 둔다
+        provider.prefetch(list(names))
+    answers = asyncio.run(_search_all(list(names.items()), providers))
+
+    # cache 가 준 답은 다시 저장하지 않는다
+    search_cache.set_many({
+        query: candidates for query, (source, candidates) in answers.items() if source != "cache"
+    })
+
+    sources = Counter(source or "none" for source, _ in answers.values())
+    logger.info(
+        "[homepage_resolver] companies=%s guessed=%s queries=%s answered_by=%s",
+        len(companies), len(guessed), len(names), dict(sources),
+    )
+
+    candidates = {cid: [url] for cid, url in guessed.items()}
+    for cid, query in queries.items():
+        candidates[cid] = answers.get(query, (None, None))[1] or []
+    return _pick(companies, candidates)
+
+
+def _pick(companies, candidates):
+    """회사별 후보 리스트 -> (고른 URL, confidence)."""
+    if getattr(settings, "HOMEPAGE_VERIFY", True):
+        names = dict(companies)
+        verified = homepage_verify.verify_homepages(
+            {cid: (names[cid], urls) for cid, urls in candidates.items()}
+        )
+        return {cid: verified.get(cid, (None, None)) for cid, _ in companies}
+    return {
+        cid: (candidates[cid][0], None) if candidates.get(cid) else (None, None)
+        for cid, _ in companies
+    }
+
+
+async def _search_all(items, providers):
+    """items: (검색어, 회사명) 리스트 -> {검색어: (답한 provider 이름, 후보 리스트 또는 None)}"""
+    concurrency = max(1, _setting("HOMEPAGE_RESOLVE_CONCURRENCY", 4))
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency)
+    timeout = httpx.Timeout(_setting("HOMEPAGE_RESOLVE_TIMEOUT_SECONDS", 10, float))
+
+    async with httpx.AsyncClient(
+        headers=HEADERS, limits=limits, timeout=timeout, follow_redirects=True,
+    ) as client:
+
+        async def _one(query, name):
+            async with sem:
+                return query, await hedged_search(client, providers, name, query)
+
+        pairs = await asyncio.gather(*(_one(q, n) for q, n in items))
+    return dict(pairs)
+
+
+async def _call(provider, client, name, query):
+    try:
+        return await provider.search(client, name, query)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        # provider 하나의 예외 때문에 배치 전체가 날아가지 않도록
+        logger.warning("[homepage_resolver] %s failed for %r: %s", provider.name, query, e)
+        return None
+
+
+async def hedged_search(client, providers, company_name, query, delay=None):
+    """
+    providers 를 순서대로, 앞의 것이 느리면(delay 초) 겹쳐서 부른다.
+    리턴: (provider 이름, 후보 리스트)
+      - 후보가 있으면 그 provider 의 답
+      - 검색엔진이 모두 빈 결과면 ("", [])  -> "검색해봤는데 없음" (캐시에 negative 로 저장됨)
+      - 검색엔진 중 하나라도 답을 못 받았고 후보도 없으면 (None, None)  -> 캐시하지 않음
+    """
+    if delay is None:
+        delay = _setting("SEARCH_HEDGE_DELAY_SECONDS", 2, float)
+
+    running = {}
+    next_index = 0
+    searched_empty = False
+    search_failed = False
+
+    def _start_next():
+        nonlocal next_index
+        provider = providers[next_index]
+        next_index += 1
+        task = asyncio.ensure_future(_call(provider, client, company_name, query))
+        running[task] = provider
+
+    try:
+        while running or next_index < len(providers):
+            if not running:
+                _start_next()
+            more = next_index < len(providers)
+            done, _ = await asyncio.wait(
+                set(running), timeout=delay if more else None, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                # 앞의 provider 가 느리다 -> 다음 provider 도 같이 시작
+                _start_next()
+                continue
+            for task in done:
+                provider = running.pop(task)
+                candidates = task.result()
+                if candidates or (candidates is not None and provider.authoritative):
+                    return provider.name, candidates
+                if provider.searches_web:
+                    if candidates is None:
+                        search_failed = True
+                    else:
+                        searched_empty = True
+    finally:
+        for task in running:
+            task.cancel()
+
+    return ("", []) if searched_empty and not search_failed else (None, None)
@@ -0,0 +1,127 @@
+# api/homepage_verify.py
+"""
+검색/추측으로 나온 홈페이지 후보를 실제로 열어보고 점수를 매긴다.
+
+검색 결과 첫 번째 후보를 그대로 쓰면, 엉뚱한 사이트가 걸렸을 때
+discover_careers 가 그 사이트를 depth 3 까지 통째로 도는 낭비가 생긴다.
+그래서 상위 HOMEPAGE_VERIFY_TOP_N 개 후보를 동시에 받아서(앞부분만) 다음으로 점수를 낸다.
+
+  confidence = 0.5 * 이름 유사도  (<title> / og:site_name / og:title 와 회사 이름, 포함되면 1.0.
+                                  영문 제목도 있으니 이름에서 만든 로마자 라벨과도 비교한다)
+             + 0.2 * 본문에 회사 이름이 있음
+             + 0.2 * 도메인이 이름에서 나온 라벨과 같음 (api/domain_guess.candidate_labels)
+             + 0.1 * 사업자등록번호(000-00-00000)가 페이지에 있음
+
+가장 높은 후보를 고르되 (동점이면 검색 순위가 앞선 것),
+HOMEPAGE_VERIFY_MIN_CONFIDENCE 보다 낮으면 "확인 실패"로 보고 저장하지 않는다.
+"""
+
+import asyncio
+import logging
+import re
+from difflib import SequenceMatcher
+from urllib.parse import urlparse
+
+import httpx
+from django.conf import settings
+
+from .domain_guess import (
+    candidate_labels, compact, decode_body, fetch_page, name_keys, page_names,
+)
+from .utils import HEADERS, _normalize_url
+
+logger = logging.getLogger(__name__)
+
+BIZNO_RE = re.compile(r"(?<!\d)\d{3}\s?-\s?\d{2}\s?-\s?\d{5}(?!\d)")
+_SCRIPT_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _setting(name, default, cast=int):
+    return cast(getattr(settings, name, default))
+
+
+def name_similarity(keys, texts):
+    """회사 이름과 제목들의 유사도 (0~1). 제목 안에 이름이 그대로 있으면 1."""
+    best = 0.0
+    for text in (compact(t) for t in texts):
+        if not text:
+            continue
+        for key in keys:
+            if key in text:
+                return 1.0
+            # 제목이 길어도 비교가 되도록, 이름 길이만큼의 구간들과 비교해서 가장 비슷한 값
+            width = min(len(key), len(text))
+            for i in range(0, len(text) - width + 1):
+                best = max(best, SequenceMatcher(None, key, text[i:i + width]).ratio())
+    return best
+
+
+def score_page(company_name, url, body, content_type=""):
+    keys = name_keys(company_name)
+    if not keys:
+        return 0.0
+    text = compact(_TAG_RE.sub(" ", _SCRIPT_RE.sub(" ", decode_body(body, content_type))))
+
+    labels = candidate_labels(company_name)
+    title = name_similarity(keys + [l for l in labels if len(l) >= 3], page_names(body, content_type))
+    in_body = any(k in text for k in keys)
+    host = (urlparse(url).hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    domain = host.split(".")[0] in labels
+    bizno = bool(BIZNO_RE.search(decode_body(body, content_type)))
+
+    return round(0.5 * title + 0.2 * in_body + 0.2 * domain + 0.1 * bizno, 3)
+
+
+def verify_homepages(items):
+    """
+    items: {key: (company_name, [후보 URL, ...])}
+    리턴: {key: (고른 URL, confidence)}  (기준 미달이면 (None, 최고 점수))
+    """
+    items = {k: (name, list(urls)[: max(1, _setting("HOMEPAGE_VERIFY_TOP_N", 3))])
+             for k, (name, urls) in items.items() if urls}
+    if not items:
+        return {}
+    return asyncio.run(_verify_all(items))
+
+
+async def _verify_all(items):
+    concurrency = max(1, _setting("HOMEPAGE_VERIFY_CONCURRENCY", 16))
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+    timeout = httpx.Timeout(_setting("HOMEPAGE_VERIFY_TIMEOUT_SECONDS", 8, float))
+    min_conf = _setting("HOMEPAGE_VERIFY_MIN_CONFIDENCE", 0.3, float)
+
+    # 점수만 보는 용도라 인증서 검증은 끈다 (api/domain_guess.py 와 같은 이유)
+    async with httpx.AsyncClient(
+        headers=HEADERS, limits=limits, timeout=timeout, follow_redirects=True, verify=False,
+    ) as client:
+
+        async def _score(name, url):
+            async with sem:
+                page = await fetch_page(client, url)
+            if page is None:
+                return url, 0.0
+            final_url, body, content_type = page
+            # 리다이렉트된 최종 주소 기준으로 저장/채점 (BLOCK_DOMAINS 로 가면 탈락)
+            final = _normalize_url(final_url)
+            if not final:
+                return url, 0.0
+            return final, score_page(name, final_url, body, content_type)
+
+        async def _company(key, name, urls):
+            scored = await asyncio.gather(*(_score(name, u) for u in urls))
+            # 동점이면 검색 순위가 앞선 후보
+            best_url, best = max(scored, key=lambda pair: pair[1])
+            logger.info(
+                "[homepage_verify] %s: %s",
+                name, ", ".join(f"{u}={s}" for u, s in scored),
+            )
+            if best < min_conf:
+                return key, (None, best)
+            return key, (best_url, best)
+
+        pairs = await asyncio.gather(*(_company(k, n, u) for k, (n, u) in items.items()))
+    return dict(pairs)
@@ -0,0 +1,110 @@
+# api/html_parsing.py
+"""
+검색 결과 페이지에서 필요한 링크(<a>, <cite> 등)만 뽑아내는 HTML 파서 백엔드.
+
+BeautifulSoup(html, "html.parser") 는 순수 파이썬 파서라서 전체 트리를 만드는 데 시간이 오래 걸린다.
+검색 결과에서 필요한 건 a.result__url / a.result__a 같은 링크 몇 개뿐이므로
+C 로 된 파서를 쓰고 필요한 노드만 고른다.
+
+HTML_PARSER_BACKEND
+  - "auto"      : selectolax -> lxml -> bs4 순서로 설치된 것 (기본)
+  - "selectolax": selectolax lexbor 파서 (requirements.txt, 없으면 다음 것)
+  - "lxml"      : lxml.html + cssselect (Scrapy 의존성이라 항상 있음)
+  - "bs4"       : BeautifulSoup html.parser (예전 방식)
+
+select_links(html, ["a.result__url", ...]) -> {selector: [(href, text), ...]}
+벤치마크: python manage.py bench_result_parsing <저장한 결과 페이지.html ...>
+"""
+
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("selectolax", "lxml", "bs4")
+
+
+def _select_selectolax(html, selectors):
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    return {
+        sel: [(node.attributes.get("href") or "", node.text() or "") for node in tree.css(sel)]
+        for sel in selectors
+    }
+
+
+@lru_cache(maxsize=64)
+def _lxml_selector(selector):
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(selector)
+
+
+def _select_lxml(html, selectors):
+    import lxml.html
+    from lxml.etree import ParserError
+
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (ParserError, ValueError):
+        return {sel: [] for sel in selectors}
+    return {
+        sel: [(el.get("href") or "", el.text_content() or "") for el in _lxml_selector(sel)(doc)]
+        for sel in selectors
+    }
+
+
+def _select_bs4(html, selectors):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    return {
+        sel: [(a.get("href") or "", a.get_text() or "") for a in soup.select(sel)]
+        for sel in selectors
+    }
+
+
+_IMPLS = {
+    "selectolax": _select_selectolax,
+    "lxml": _select_lxml,
+    "bs4": _select_bs4,
+}
+
+
+def available_backends():
+    found = []
+    for name, module in (("selectolax", "selectolax.lexbor"), ("lxml", "lxml.cssselect"), ("bs4", "bs4")):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        found.append(name)
+    return found
+
+
+@lru_cache(maxsize=None)
+def _resolve_backend(name):
+    available = available_backends()
+    if name in available:
+        return name
+    if name != "auto":
+        logger.warning("html_parsing: backend %r is not installed, falling back", name)
+    return available[0] if available else "bs4"
+
+
+def backend_name():
+    return _resolve_backend(getattr(settings, "HTML_PARSER_BACKEND", "auto"))
+
+
+def select_links(html, selectors, backend=None):
+    """
+    selectors 마다 맞는 요소들의 (href, 텍스트) 리스트를 문서 순서대로 돌려준다.
+    backend 를 주면 그 백엔드로 (벤치마크용), 없으면 HTML_PARSER_BACKEND 설정대로.
+    """
+    selectors = tuple(selectors)
+    if not html:
+        return {sel: [] for sel in selectors}
+    return _IMPLS[backend or backend_name()](html, selectors)
@@ -0,0 +1,84 @@
+# api/management/commands/bench_result_parsing.py
+
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from api.html_parsing import BACKENDS, available_backends
+from api.search_providers import PROVIDERS
+
+ENGINES = ("duckduckgo", "bing")
+
+
+class Command(BaseCommand):
+    help = (
+        "저장해 둔 검색 결과 페이지(.html)로 HTML 파서 백엔드별 후보 추출 속도를 잽니다. "
+        "백엔드끼리 추출 결과가 다르면 같이 알려줍니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="결과 페이지 .html 파일 또는 그런 파일이 있는 폴더",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=ENGINES,
+            default="duckduckgo",
+            help="어느 검색엔진 결과 페이지인지 (기본: duckduckgo)",
+        )
+        parser.add_argument(
+            "--repeat",
+            "-n",
+            type=int,
+            default=20,
+            help="페이지마다 반복 횟수 (기본: 20)",
+        )
+
+    def handle(self, *args, **options):
+        files = []
+        for raw in options["paths"]:
+            path = Path(raw)
+            if path.is_dir():
+                files.extend(sorted(path.glob("*.html")))
+            elif path.exists():
+                files.append(path)
+            else:
+                raise CommandError(f"없는 경로: {raw}")
+        if not files:
+            raise CommandError("벤치마크할 .html 파일이 없습니다.")
+
+        pages = [f.read_text(encoding="utf-8", errors="replace") for f in files]
+        parse = PROVIDERS[options["engine"]]().parse
+        repeat = max(1, options["repeat"])
+        backends = [b for b in BACKENDS if b in available_backends()]
+
+        self.stdout.write(
+            f"{len(pages)} pages ({sum(len(p) for p in pages) // 1024} KiB), "
+            f"repeat={repeat}, backends={', '.join(backends)}"
+        )
+
+        results = {}
+        for backend in backends:
+            with override_settings(HTML_PARSER_BACKEND=backend):
+                results[backend] = [parse(html) for html in pages]
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    for html in pages:
+                        parse(html)
+                elapsed = time.perf_counter() - started
+            per_page = elapsed / (repeat * len(pages)) * 1000
+            self.stdout.write(f"  {backend:<11} {per_page:8.3f} ms/page  ({elapsed:.2f}s total)")
+
+        reference = backends[-1]
+        for backend in backends[:-1]:
+            for f, got, expected in zip(files, results[backend], results[reference]):
+                if got != expected:
+                    self.stdout.write(self.style.WARNING(
+                        f"  {backend} != {reference} for {f.name}: {got} vs {expected}"
+                    ))
+
+        self.stdout.write(self.style.SUCCESS("Done."))
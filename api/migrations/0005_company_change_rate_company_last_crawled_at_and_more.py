@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_trainee_jobposting_first_seen_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='change_rate',
+            field=models.FloatField(blank=True, help_text='하루당 관측된 공고 변화 수(신규+수정+비활성화)의 지수이동평균', null=True, verbose_name='공고 변화율'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='last_crawled_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마지막 수집일'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='next_crawl_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='다음 수집 예정일'),
+        ),
+    ]
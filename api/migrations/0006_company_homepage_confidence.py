@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_company_change_rate_company_last_crawled_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='homepage_confidence',
+            field=models.FloatField(blank=True, help_text='자동으로 찾은 홈페이지의 검증 점수(0~1, api/homepage_verify.py). 직접 입력/시딩한 경우 비어 있음', null=True, verbose_name='홈페이지 신뢰도'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_company_homepage_confidence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='recruits_url_checked_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='채용 URL 확인일'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='recruits_url_etag',
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name='채용 URL ETag'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='recruits_url_fingerprint',
+            field=models.CharField(blank=True, help_text='태그/클래스 구조의 64bit simhash (텍스트는 보지 않음)', max_length=16, null=True, verbose_name='채용 URL 구조 지문'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='recruits_url_last_modified',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='채용 URL Last-Modified'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='recruits_url_redirect',
+            field=models.URLField(blank=True, max_length=2083, null=True, verbose_name='채용 URL 리다이렉트 주소'),
+        ),
+    ]
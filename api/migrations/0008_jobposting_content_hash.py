@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_company_recruits_url_revalidate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=32, null=True, verbose_name='내용 해시'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='field_hashes',
+            field=models.JSONField(blank=True, default=dict, verbose_name='필드별 해시'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='last_seen_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='마지막 확인일'),
+        ),
+    ]
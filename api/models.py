@@ -20,6 +20,12 @@ class Company(models.Model):
 
     name = models.CharField(unique=True, max_length=255, verbose_name="회사명")
     homepage_url = models.URLField(max_length=2083, blank=True, null=True, verbose_name="홈페이지 URL")
+    homepage_confidence = models.FloatField(
+        blank=True,
+        null=True,
+        verbose_name="홈페이지 신뢰도",
+        help_text="자동으로 찾은 홈페이지의 검증 점수(0~1, api/homepage_verify.py). 직접 입력/시딩한 경우 비어 있음",
+    )
     recruits_url = models.URLField(max_length=2083, blank=True, null=True, verbose_name="채용 페이지 URL")
     page_type = models.CharField(
         max_length=20,
@@ -41,6 +47,22 @@ class Company(models.Model):
     )
     recruits_url_status = models.CharField(max_length=20, blank=True, null=True, verbose_name="채용 URL 상태")
     recruits_url_score = models.IntegerField(blank=True, null=True, verbose_name="채용 URL 신뢰도 점수")
+    # 저장된 recruits_url 재확인 (api/recruits_revalidate.py)
+    recruits_url_checked_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="채용 URL 확인일")
+    recruits_url_redirect = models.URLField(
+        max_length=2083, blank=True, null=True, verbose_name="채용 URL 리다이렉트 주소",
+    )
+    recruits_url_etag = models.CharField(max_length=255, blank=True, null=True, verbose_name="채용 URL ETag")
+    recruits_url_last_modified = models.CharField(
+        max_length=64, blank=True, null=True, verbose_name="채용 URL Last-Modified",
+    )
+    recruits_url_fingerprint = models.CharField(
+        max_length=16,
+        blank=True,
+        null=True,
+        verbose_name="채용 URL 구조 지문",
+        help_text="태그/클래스 구조의 64bit simhash (텍스트는 보지 않음)",
+    )
     logo_url = models.URLField(max_length=2083, blank=True, null=True, verbose_name="회사 로고 URL")
     industry = models.CharField(max_length=100, blank=True, null=True, verbose_name="산업 분야")
     address = models.CharField(max_length=255, blank=True, null=True, verbose_name="회사 주소")
@@ -55,6 +77,15 @@ class Company(models.Model):
         null=True,
         help_text="외부채용사이트 주소",
     )
+    # 적응형 재방문 스케줄 (api/revisit.py)
+    last_crawled_at = models.DateTimeField(blank=True, null=True, verbose_name="마지막 수집일")
+    next_crawl_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="다음 수집 예정일")
+    change_rate = models.FloatField(
+        blank=True,
+        null=True,
+        verbose_name="공고 변화율",
+        help_text="하루당 관측된 공고 변화 수(신규+수정+비활성화)의 지수이동평균",
+    )
     # auto_now_add=True: 객체가 처음 생성될 때만 현재 시간 저장
     # auto_now=True: 객체가 저장될 때마다 현재 시간으로 업데이트
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
@@ -94,6 +125,11 @@ class JobPosting(models.Model):
     first_seen_at = models.DateTimeField(auto_now_add=True, verbose_name="최초수집일")
     is_active = models.BooleanField(default=True, verbose_name="활성 공고")
 
+    # 변경 감지 (crawler/crawler/pipelines.py): 마지막 수집 결과의 정규화 해시 / 필드별 해시
+    content_hash = models.CharField(max_length=32, blank=True, null=True, verbose_name="내용 해시")
+    field_hashes = models.JSONField(default=dict, blank=True, verbose_name="필드별 해시")
+    last_seen_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="마지막 확인일")
+
     def __str__(self):
         return f"[{self.company.name}] {self.title}"
 
@@ -0,0 +1,79 @@
+# api/ratelimit.py
+"""
+Redis 기반 토큰 버킷 (여러 프로세스/컨테이너가 같은 버킷을 공유).
+
+버킷 1개 = Redis hash 1개 {tokens, ts}. 초당 rate 개씩 채워지고 최대 burst 개까지 쌓인다.
+try_acquire() 는 여러 버킷(예: 호스트 + IP)을 한 번에(원자적으로) 확인해서
+  - 모두 토큰이 있으면 전부 1개씩 쓰고 0 을 리턴
+  - 하나라도 부족하면 아무것도 쓰지 않고, 기다려야 하는 초(가장 긴 것)를 리턴
+시간은 Redis 서버 시간(TIME)을 쓰므로 워커들 사이 시계 차이에 영향받지 않는다.
+try_acquire() 는 블로킹 호출이다: reactor 에서는 스레드로 넘겨서 부른다 (crawler.middlewares 참고).
+연결 / 응답은 REDIS_SOCKET_TIMEOUT_SECONDS 안에 끝나지 않으면 redis.RedisError 로 끝난다.
+"""
+
+import logging
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ratelimit:"
+
+# KEYS: 버킷 키들, ARGV: rate1, burst1, rate2, burst2, ...
+_TOKEN_BUCKET = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local tokens = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local burst = tonumber(ARGV[i * 2])
+    local data = redis.call('HMGET', key, 'tokens', 'ts')
+    local tk = tonumber(data[1]) or burst
+    local ts = tonumber(data[2]) or now
+    tk = math.min(burst, tk + math.max(0, now - ts) * rate)
+    tokens[i] = tk
+    if tk < 1 then
+        wait = math.max(wait, (1 - tk) / rate)
+    end
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local burst = tonumber(ARGV[i * 2])
+    local tk = tokens[i]
+    if wait == 0 then
+        tk = tk - 1
+    end
+    redis.call('HSET', key, 'tokens', tostring(tk), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.ceil(burst / rate) + 60)
+end
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    def __init__(self, client=None):
+        if client is None:
+            timeout = float(getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 1))
+            client = redis.from_url(
+                getattr(settings, "REDIS_URL", "redis://redis:6379/0"),
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+            )
+        self.r = client
+        self._script = self.r.register_script(_TOKEN_BUCKET)
+
+    def try_acquire(self, buckets):
+        """
+        buckets: [(name, rate_per_sec, burst), ...]
+        리턴: 0 이면 통과, 아니면 기다려야 할 초.
+        """
+        buckets = [b for b in buckets if b and b[1] and b[1] > 0]
+        if not buckets:
+            return 0.0
+        keys = [KEY_PREFIX + name for name, _, _ in buckets]
+        args = []
+        for _, rate, burst in buckets:
+            args.extend([float(rate), max(1.0, float(burst))])
+        return float(self._script(keys=keys, args=args))
@@ -0,0 +1,261 @@
+# api/recruits_revalidate.py
+"""
+저장된 recruits_url 을 가볍게 다시 확인한다 (discover_careers 를 다시 돌리기 전에).
+
+채용 페이지가 옮겨지거나 없어지면 지금까지는 recruits_url 을 손으로 지우고
+discover_careers 를 통째로 다시 돌리는 수밖에 없었다.
+여기서는 회사마다 요청 1개(조건부 GET, 앞부분 RECRUITS_REVALIDATE_MAX_BYTES 만)로 확인하고
+Company.recruits_url_* 필드를 갱신한다.
+
+  - If-None-Match / If-Modified-Since 를 보내고, 304 면 본문 없이 "그대로"
+  - 200 이면 태그/클래스 구조로 simhash 지문(64bit)을 만들어 지난번 지문과 비교한다.
+    텍스트는 보지 않으므로 공고가 바뀌는 것만으로는 지문이 크게 변하지 않는다.
+  - 리다이렉트되면 최종 주소를 recruits_url_redirect 에 남긴다.
+
+상태 (recruits_url_status)
+  CONFIRMED  : 그대로 있음 (304, 또는 지문 차이가 RECRUITS_REVALIDATE_SHAPE_BITS 이하)
+  REDIRECTED : 다른 주소로 리다이렉트됐지만 그 페이지도 채용 페이지로 보임
+  ERROR      : 타임아웃/5xx/403/429/연결 실패 (일시적일 수 있으니 점수만 깎는다)
+  UNKNOWN    : 200 이 아닌 2xx(204, 206 ...), 본문 없는 200 등 비교할 근거가 없는 응답 (점수/지문은 그대로)
+  CHANGED    : 채용 키워드가 사라졌거나, 구조가 크게 바뀌었거나, 사이트 첫 페이지로 리다이렉트됨
+  GONE       : 404/410, 또는 ERROR 가 반복돼서 점수가 0 이 됨
+CHANGED / GONE 인 회사만 다시 discover 대상이 되고(api.tasks.discover_targets_qs), 수집에서는 빠진다.
+discover 가 새 페이지를 못 찾으면 GONE 인 채로 남으므로, GONE 은 RECRUITS_REVALIDATE_GONE_BACKOFF_HOURS 가
+지나면 다시 확인한다 (페이지가 돌아왔으면 CONFIRMED 로 돌아가서 다시 수집된다).
+
+신선도 점수 (recruits_url_score, 0~100)
+  304 / 지문 같음 = 100, 지문 차이 d 비트면 100 - 50 * d / SHAPE_BITS (50~100),
+  ERROR 면 이전 점수 - RECRUITS_REVALIDATE_ERROR_PENALTY, CHANGED / GONE = 0.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from datetime import timedelta
+from urllib.parse import urlparse
+
+import httpx
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .domain_guess import decode_body
+from .utils import HEADERS
+
+logger = logging.getLogger(__name__)
+
+STATUS_CONFIRMED = "CONFIRMED"
+STATUS_REDIRECTED = "REDIRECTED"
+STATUS_ERROR = "ERROR"
+STATUS_CHANGED = "CHANGED"
+STATUS_GONE = "GONE"
+STATUS_UNKNOWN = "UNKNOWN"
+# 다시 discover 로 보내는 상태
+REDISCOVER_STATUSES = (STATUS_CHANGED, STATUS_GONE)
+
+# 갱신하는 Company 필드 (bulk_update 용)
+FIELDS = [
+    "recruits_url_status",
+    "recruits_url_score",
+    "recruits_url_checked_at",
+    "recruits_url_redirect",
+    "recruits_url_etag",
+    "recruits_url_last_modified",
+    "recruits_url_fingerprint",
+]
+
+# 페이지에 이 중 하나도 없으면 더 이상 채용 페이지가 아니라고 본다
+RECRUIT_KEYWORDS = ("채용", "인재", "모집", "입사", "recruit", "career", "job", "employment", "hiring")
+
+_SCRIPT_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.I | re.S)
+_TAG_RE = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)([^>]*)>")
+_CLASS_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def _setting(name, default, cast=int):
+    return cast(getattr(settings, name, default))
+
+
+def _checked_before(cutoff):
+    return Q(recruits_url_checked_at__isnull=True) | Q(recruits_url_checked_at__lte=cutoff)
+
+
+def targets_filter(now=None):
+    """
+    재확인할 회사: recruits_url 이 있고, 확인한 지 오래된 회사.
+    rediscover 대기 중(CHANGED / GONE)인 회사는 빼되, GONE 은 백오프 시간이 지나면 다시 본다.
+    """
+    now = now or timezone.now()
+    stale = now - timedelta(hours=_setting("RECRUITS_REVALIDATE_HOURS", 24, float))
+    gone_stale = now - timedelta(hours=_setting("RECRUITS_REVALIDATE_GONE_BACKOFF_HOURS", 168, float))
+    return (
+        Q(recruits_url__isnull=False)
+        & ~Q(recruits_url="")
+        & (
+            (~Q(recruits_url_status__in=REDISCOVER_STATUSES) & _checked_before(stale))
+            | (Q(recruits_url_status=STATUS_GONE) & _checked_before(gone_stale))
+        )
+    )
+
+
+def shape_fingerprint(html):
+    """
+    태그 구조의 simhash (16자리 hex).
+    연속된 시작 태그 3개(tag.class...)를 특징으로 쓰고, 같은 특징은 한 번만 센다
+    (공고 행이 늘거나 줄어도 같은 모양의 행이라 지문이 거의 그대로다).
+    class 안의 숫자는 빼서 자동 생성 id 에 흔들리지 않게 한다.
+    """
+    tokens = []
+    for m in _TAG_RE.finditer(_SCRIPT_RE.sub(" ", html)):
+        tag = m.group(1).lower()
+        cm = _CLASS_RE.search(m.group(2))
+        classes = ""
+        if cm:
+            raw = next(g for g in cm.groups() if g is not None)
+            classes = ".".join(sorted({_DIGITS_RE.sub("", c) for c in raw.lower().split()}))
+        tokens.append(f"{tag}.{classes}" if classes else tag)
+
+    features = {" ".join(tokens[i:i + 3]) for i in range(max(1, len(tokens) - 2))}
+    features.discard("")
+    if not features:
+        return None
+
+    weights = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    value = sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+    return f"{value:016x}"
+
+
+def shape_distance(a, b):
+    """두 지문의 다른 비트 수 (0~64)."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def _is_site_root(url):
+    return urlparse(url).path in ("", "/")
+
+
+def judge(company, result, now):
+    """
+    fetch 결과로 company 의 recruits_url_* 필드를 바꾼다 (저장은 호출하는 쪽에서).
+    result: (status_code | None, 최종 URL, body, headers)
+    리턴: 새 상태
+    """
+    status_code, final_url, body, headers = result
+    shape_bits = max(1, _setting("RECRUITS_REVALIDATE_SHAPE_BITS", 12))
+    previous = company.recruits_url_score if company.recruits_url_score is not None else 100
+
+    company.recruits_url_checked_at = now
+
+    if status_code is None or (status_code >= 400 and status_code not in (404, 410)):
+        # 타임아웃/5xx 뿐 아니라 403/429(봇 차단, 속도 제한)도 일시적인 것으로 본다
+        score = previous - _setting("RECRUITS_REVALIDATE_ERROR_PENALTY", 25)
+        company.recruits_url_score = max(0, score)
+        company.recruits_url_status = STATUS_ERROR if score > 0 else STATUS_GONE
+        return company.recruits_url_status
+
+    redirected = final_url and final_url != company.recruits_url
+    company.recruits_url_redirect = final_url if redirected else None
+
+    if status_code == 304:
+        company.recruits_url_score = 100
+        company.recruits_url_status = STATUS_REDIRECTED if redirected else STATUS_CONFIRMED
+        return company.recruits_url_status
+
+    if status_code in (404, 410):
+        company.recruits_url_score = 0
+        company.recruits_url_status = STATUS_GONE
+        return STATUS_GONE
+
+    if status_code != 200 or not body:
+        # 204 / 206 / 본문 없는 200 등은 비교할 근거가 아니다 -> 점수/지문/검증값은 그대로 두고 다음에 다시 본다
+        company.recruits_url_status = STATUS_UNKNOWN
+        return STATUS_UNKNOWN
+
+    html = decode_body(body, headers.get("content-type", ""))
+    fingerprint = shape_fingerprint(html)
+    lowered = html.lower()
+    changed = (
+        (redirected and _is_site_root(final_url) and not _is_site_root(company.recruits_url))
+        or not any(kw in lowered for kw in RECRUIT_KEYWORDS)
+    )
+
+    distance = 0
+    if not changed and fingerprint and company.recruits_url_fingerprint:
+        distance = shape_distance(fingerprint, company.recruits_url_fingerprint)
+        changed = distance > shape_bits
+
+    company.recruits_url_etag = headers.get("etag") or None
+    company.recruits_url_last_modified = headers.get("last-modified") or None
+    if changed:
+        # 지문은 바꾸지 않는다: discover 가 새 recruits_url 을 저장할 때 비운다
+        company.recruits_url_score = 0
+        company.recruits_url_status = STATUS_CHANGED
+        return STATUS_CHANGED
+
+    company.recruits_url_fingerprint = fingerprint or company.recruits_url_fingerprint
+    company.recruits_url_score = round(100 - 50 * distance / shape_bits)
+    company.recruits_url_status = STATUS_REDIRECTED if redirected else STATUS_CONFIRMED
+    return company.recruits_url_status
+
+
+async def _fetch(client, company, max_bytes):
+    """조건부 GET. 리턴: (status_code | None, 최종 URL, body 앞부분, 응답 헤더)"""
+    headers = {}
+    if company.recruits_url_etag:
+        headers["If-None-Match"] = company.recruits_url_etag
+    if company.recruits_url_last_modified:
+        headers["If-Modified-Since"] = company.recruits_url_last_modified
+    try:
+        async with client.stream("GET", company.recruits_url, headers=headers) as resp:
+            body = b""
+            if resp.status_code == 200:
+                async for chunk in resp.aiter_bytes():
+                    body += chunk
+                    if len(body) >= max_bytes:
+                        break
+            return resp.status_code, str(resp.url), body, resp.headers
+    except (httpx.HTTPError, UnicodeError) as e:
+        logger.info("[revalidate] %s: %s", company.recruits_url, e.__class__.__name__)
+        return None, None, b"", {}
+
+
+def revalidate(companies, now=None):
+    """
+    companies: recruits_url_* 필드를 불러온 Company 리스트 (필드를 바꿔 둔다, 저장은 호출하는 쪽에서)
+    리턴: {company_id: 새 상태}
+    """
+    if not companies:
+        return {}
+    return asyncio.run(_revalidate_all(companies, now or timezone.now()))
+
+
+async def _revalidate_all(companies, now):
+    concurrency = max(1, _setting("RECRUITS_REVALIDATE_CONCURRENCY", 32))
+    max_bytes = max(1024, _setting("RECRUITS_REVALIDATE_MAX_BYTES", 512 * 1024))
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+    timeout = httpx.Timeout(_setting("RECRUITS_REVALIDATE_TIMEOUT_SECONDS", 10, float))
+
+    # 상태만 보는 용도라 인증서 검증은 끈다 (api/domain_guess.py 와 같은 이유)
+    async with httpx.AsyncClient(
+        headers=HEADERS, limits=limits, timeout=timeout, follow_redirects=True, verify=False,
+    ) as client:
+
+        async def _one(company):
+            async with sem:
+                result = await _fetch(client, company, max_bytes)
+            state = judge(company, result, now)
+            logger.info(
+                "[revalidate] company_id=%s %s -> %s (http=%s score=%s)",
+                company.id, company.recruits_url, state, result[0], company.recruits_url_score,
+            )
+            return company.id, state
+
+        pairs = await asyncio.gather(*(_one(c) for c in companies))
+    return dict(pairs)
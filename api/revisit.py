@@ -0,0 +1,119 @@
+# api/revisit.py
+"""
+회사별 적응형 재방문 스케줄.
+
+수집(job_collector)이 끝날 때마다 그 회사의 공고가 실제로 얼마나 바뀌었는지 센다.
+  - 신규    : 이번 수집에서 처음 본 공고 (first_seen_at >= 수집 시작)
+  - 수정    : 이번 수집에서 저장된 기존 공고 (crawled_at >= 수집 시작, auto_now 이므로 변경 시에만 갱신)
+  - 비활성화: 이번 수집에서 한 번도 보지 못해 내려간 공고 (crawler/crawler/pipelines.py close_unseen 이
+              깨끗하게 끝난 수집 뒤에 is_active=False, status=closed, crawled_at 을 넣는다)
+하루당 변화 수를 지수이동평균(change_rate)으로 유지하고,
+"변화 1건이 기대되는 시간"(= 1 / change_rate)을 [REVISIT_MIN_HOURS, REVISIT_MAX_HOURS] 로 잘라서
+next_crawl_at 을 정한다.
+
+run_job_collector_spiders 는 next_crawl_at 이 지난 회사만, 기대 수확량이 큰 순서로 돌린다.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Company, JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+def _hours_setting(name, default):
+    return float(getattr(settings, name, default))
+
+
+def count_changes(company_id, since):
+    """since 이후 company_id 의 공고 변화 수 (신규 + 수정 + 비활성화)."""
+    qs = JobPosting.objects.filter(company_id=company_id)
+    new = qs.filter(first_seen_at__gte=since).count()
+    updated = qs.filter(crawled_at__gte=since, first_seen_at__lt=since, is_active=True).count()
+    deactivated = qs.filter(crawled_at__gte=since, first_seen_at__lt=since, is_active=False).count()
+    return new + updated + deactivated
+
+
+def next_interval_hours(change_rate):
+    min_h = _hours_setting("REVISIT_MIN_HOURS", 4)
+    max_h = _hours_setting("REVISIT_MAX_HOURS", 168)
+    if not change_rate or change_rate <= 0:
+        return max_h
+    return max(min_h, min(max_h, 24.0 / change_rate))
+
+
+def record_crawl_outcome(company_id, started_at, now=None):
+    """
+    수집 1회가 끝난 뒤 호출. change_rate / last_crawled_at / next_crawl_at 갱신.
+    started_at: 이번 수집 시작 시각 (이 시각 이후 바뀐 공고를 변화로 센다)
+    """
+    now = now or timezone.now()
+    company = Company.objects.filter(id=company_id).only(
+        "id", "last_crawled_at", "change_rate",
+    ).first()
+    if company is None:
+        return None
+
+    changes = count_changes(company_id, started_at)
+
+    # 관측 구간: 마지막 수집 이후 경과 시간 (처음이면 사이클 간격으로 가정)
+    if company.last_crawled_at:
+        interval_days = (now - company.last_crawled_at).total_seconds() / 86400.0
+    else:
+        interval_days = float(getattr(settings, "CRAWL_INTERVAL_HOURS", 8)) / 24.0
+    interval_days = max(interval_days, 1.0 / 24.0)
+
+    observed = changes / interval_days
+    alpha = float(getattr(settings, "REVISIT_EWMA_ALPHA", 0.3))
+    if company.change_rate is None:
+        rate = observed
+    else:
+        rate = alpha * observed + (1 - alpha) * company.change_rate
+
+    hours = next_interval_hours(rate)
+    next_at = now + timedelta(hours=hours)
+
+    Company.objects.filter(id=company_id).update(
+        change_rate=rate,
+        last_crawled_at=now,
+        next_crawl_at=next_at,
+    )
+    logger.info(
+        "revisit: company_id=%s changes=%s rate=%.3f/day next_in=%.1fh",
+        company_id, changes, rate, hours,
+    )
+    return next_at
+
+
+def due_filter(now=None):
+    """
+    지금 수집할 차례인 회사 조건.
+    다음 사이클이 살짝 늦게 도는 바람에 한 바퀴를 통째로 건너뛰지 않도록
+    사이클 간격의 절반만큼 여유를 둔다.
+    """
+    now = now or timezone.now()
+    slack = timedelta(hours=float(getattr(settings, "CRAWL_INTERVAL_HOURS", 8)) / 2)
+    return Q(next_crawl_at__isnull=True) | Q(next_crawl_at__lte=now + slack)
+
+
+def expected_yield(target, now=None):
+    """
+    마지막 수집 이후 기대되는 변화 수 = change_rate * 경과 일수.
+    한 번도 수집하지 않은 회사는 가장 먼저 돈다.
+    """
+    now = now or timezone.now()
+    last = target.get("last_crawled_at")
+    rate = target.get("change_rate")
+    if last is None or rate is None:
+        return float("inf")
+    return rate * (now - last).total_seconds() / 86400.0
+
+
+def order_by_expected_yield(targets, now=None):
+    now = now or timezone.now()
+    return sorted(targets, key=lambda t: (-expected_yield(t, now), t["id"]))
@@ -0,0 +1,95 @@
+# api/search_cache.py
+"""
+검색 결과 캐시 (Redis).
+
+홈페이지 검색은 사이클마다 homepage_url 이 비어있는 회사 전부를 다시 검색한다.
+지난번에 후보가 하나도 없었던 회사도 마찬가지라서, 회사 목록이 그대로면 같은 검색을 계속 반복하게 된다.
+그래서 정규화한 검색어 -> 후보 URL 리스트(파싱 결과 그대로)를 저장해 둔다.
+
+- 후보가 있는 결과 : SEARCH_CACHE_TTL_HOURS 동안 유지
+- 빈 결과(negative): SEARCH_CACHE_EMPTY_TTL_HOURS 동안 유지 (보통 더 짧게 잡는다)
+- 202/네트워크 에러처럼 결과 자체를 못 받은 경우는 저장하지 않는다.
+SEARCH_CACHE_ENABLED=0 이거나 호출 쪽에서 bypass 를 주면 캐시를 읽지 않고 새로 검색한다
+(새 결과는 그래도 저장해서 다음 번에 쓴다).
+Redis 에 문제가 있으면 캐시 없이 진행한다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "search:cache:"
+
+r = redis.from_url(getattr(settings, "REDIS_URL", "redis://redis:6379/0"))
+
+
+def enabled():
+    return bool(getattr(settings, "SEARCH_CACHE_ENABLED", True))
+
+
+def normalize_query(query):
+    """대소문자/전각/공백 차이만 있는 검색어는 같은 키가 되도록."""
+    q = unicodedata.normalize("NFKC", query or "").lower()
+    return re.sub(r"\s+", " ", q).strip()
+
+
+def _key(query):
+    digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+    return KEY_PREFIX + digest
+
+
+def _ttl(candidates):
+    if candidates:
+        hours = float(getattr(settings, "SEARCH_CACHE_TTL_HOURS", 168))
+    else:
+        hours = float(getattr(settings, "SEARCH_CACHE_EMPTY_TTL_HOURS", 24))
+    return max(1, int(hours * 3600))
+
+
+def get_many(queries):
+    """
+    queries: 검색어 리스트.
+    리턴: {검색어: 후보 리스트} (캐시에 있는 것만, 빈 리스트 = negative hit)
+    """
+    queries = list(queries)
+    if not queries:
+        return {}
+    try:
+        values = r.mget([_key(q) for q in queries])
+    except redis.RedisError as e:
+        logger.warning("search_cache: redis unavailable, skip lookup (%s)", e)
+        return {}
+
+    found = {}
+    for query, raw in zip(queries, values):
+        if raw is None:
+            continue
+        try:
+            found[query] = list(json.loads(raw)["candidates"])
+        except (ValueError, KeyError, TypeError):
+            continue
+    return found
+
+
+def set_many(results):
+    """results: {검색어: 후보 리스트}. None 값(검색 실패)은 저장하지 않는다."""
+    results = {q: c for q, c in results.items() if c is not None}
+    if not results:
+        return
+    now = time.time()
+    try:
+        pipe = r.pipeline()
+        for query, candidates in results.items():
+            payload = {"query": normalize_query(query), "candidates": candidates, "cached_at": now}
+            pipe.set(_key(query), json.dumps(payload, ensure_ascii=False), ex=_ttl(candidates))
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("search_cache: redis unavailable, results not cached (%s)", e)
@@ -0,0 +1,251 @@
+# api/search_providers.py
+"""
+홈페이지 검색 백엔드(provider) 모음.
+
+provider 는 회사 1개에 대해 홈페이지 후보 URL 리스트를 돌려준다.
+    async def search(client, company_name, query) -> list[str] | None
+      - 리스트: 후보 (비어 있으면 "찾아봤는데 없음")
+      - None  : 답을 못 받음 (검색엔진 차단/에러, cache/registry 에 없음)
+모든 provider 의 결과는 utils._normalize_url 을 거쳐서 BLOCK_DOMAINS 가 똑같이 걸러진다.
+배치를 시작하기 전에 prefetch(검색어 리스트)가 한 번 불린다 (cache 는 여기서 MGET 1번으로 다 읽어 둔다).
+
+SEARCH_PROVIDERS 순서대로 쓴다 (이름은 PROVIDERS 참고).
+  - cache      : 지난 검색 결과 (api/search_cache.py). 빈 결과(negative)도 답으로 인정한다.
+  - registry   : 로컬 회사 목록 CSV (COMPANY_REGISTRY_CSV, company_name/homepage_url 컬럼)
+  - duckduckgo : html.duckduckgo.com
+  - bing       : www.bing.com
+여러 provider 를 어떻게 섞어 부르는지(hedging)는 api/homepage_resolver.py 참고.
+"""
+
+import asyncio
+import csv
+import logging
+import random
+import re
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+from django.conf import settings
+
+from . import search_cache
+from .html_parsing import select_links
+from .search_throttle import OK, THROTTLED, SearchThrottle
+from .utils import _extract_candidates_from_html, _normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default, cast=int):
+    return cast(getattr(settings, name, default))
+
+
+def _clean(urls):
+    """_normalize_url(BLOCK_DOMAINS 포함) 적용 + 순서 유지 중복 제거."""
+    seen = []
+    for url in urls:
+        norm = _normalize_url(url)
+        if norm and norm not in seen:
+            seen.append(norm)
+    return seen
+
+
+class SearchProvider:
+    name = "base"
+    # True 면 빈 결과도 최종 답으로 본다 (다른 provider 로 넘어가지 않음)
+    authoritative = False
+    # 실제로 웹 검색을 하는 provider 인지 ("검색했는데 없음" 판단은 검색엔진 결과로만 한다)
+    searches_web = False
+
+    def prefetch(self, queries):
+        """배치 시작 전에 (이벤트 루프 밖에서) 한 번 불린다. 기본은 아무것도 안 한다."""
+
+    async def search(self, client, company_name, query):
+        raise NotImplementedError
+
+
+class CacheProvider(SearchProvider):
+    """
+    지난 검색 결과. 값이 있으면(빈 리스트 포함) 그대로 답이다.
+    Redis 는 prefetch 에서 배치 전체를 MGET 1번으로 읽고, search 는 그 결과만 본다
+    (이벤트 루프 안에서 검색어마다 동기 Redis 호출을 하면 다른 검색이 그동안 다 멈춘다).
+    """
+
+    name = "cache"
+    authoritative = True
+
+    def __init__(self):
+        self.hits = {}
+
+    def prefetch(self, queries):
+        self.hits = search_cache.get_many(queries)
+
+    async def search(self, client, company_name, query):
+        if query not in self.hits:
+            return None
+        return _clean(self.hits[query])
+
+
+class RegistryProvider(SearchProvider):
+    """로컬 회사 목록 CSV 에서 이름으로 찾는다 (법인 표기/공백/대소문자 무시)."""
+
+    name = "registry"
+    _index = None
+
+    @staticmethod
+    def key(name):
+        from .domain_guess import strip_legal_markers
+
+        return re.sub(r"[^0-9a-z가-힣]+", "", strip_legal_markers(name).lower())
+
+    @classmethod
+    def index(cls):
+        if cls._index is None:
+            from .management.commands.seed_companies_from_csv import open_csv_safely
+
+            paths = getattr(settings, "COMPANY_REGISTRY_CSV", []) or []
+            if isinstance(paths, str):
+                paths = paths.split(",")
+            index = {}
+            for raw in paths:
+                path = Path(raw.strip())
+                if not raw.strip() or not path.exists():
+                    continue
+                with open_csv_safely(path) as f:
+                    for row in csv.DictReader(f):
+                        name = (row.get("company_name") or "").strip()
+                        url = (row.get("homepage_url") or "").strip()
+                        if name and url:
+                            index.setdefault(cls.key(name), url)
+            logger.info("[search_providers] registry loaded: %s companies", len(index))
+            cls._index = index
+        return cls._index
+
+    async def search(self, client, company_name, query):
+        url = self.index().get(self.key(company_name))
+        return _clean([url]) if url else None
+
+
+class HtmlSearchProvider(SearchProvider):
+    """
+    HTML 검색엔진 공통: 전역 스로틀(api/search_throttle.py, 엔진별) 안에서 요청하고,
+    200 이 아니거나 네트워크 에러면 지수 백오프 후 재시도한다.
+    """
+
+    url = None
+    setting_url = None
+    searches_web = True
+
+    def __init__(self):
+        self.url = getattr(settings, self.setting_url, None) or self.url
+        self.throttle = (
+            SearchThrottle(name=f"search:{self.name}")
+            if getattr(settings, "SEARCH_THROTTLE_ENABLED", True) else None
+        )
+
+    def params(self, query):
+        return {"q": query}
+
+    def parse(self, html):
+        raise NotImplementedError
+
+    async def search(self, client, company_name, query):
+        max_attempts = max(1, _setting("HOMEPAGE_RESOLVE_RETRIES", 3))
+        backoff = _setting("HOMEPAGE_RESOLVE_BACKOFF_SECONDS", 3, float)
+
+        last = None
+        for attempt in range(1, max_attempts + 1):
+            if self.throttle:
+                await self.throttle.wait()
+            try:
+                resp = await client.get(self.url, params=self.params(query))
+            except httpx.HTTPError as e:
+                last = f"error={e!r}"
+                logger.info(
+                    "[%s] request error (%s/%s) for %r: %s",
+                    self.name, attempt, max_attempts, query, e,
+                )
+            else:
+                if self.throttle:
+                    await self.throttle.arecord(OK if resp.status_code == 200 else THROTTLED)
+                if resp.status_code == 200:
+                    candidates = _clean(self.parse(resp.text))
+                    logger.info(
+                        "[%s] %s candidates for %r (attempt %s)",
+                        self.name, len(candidates), query, attempt,
+                    )
+                    return candidates
+
+                last = f"status={resp.status_code}"
+                logger.info(
+                    "[%s] status=%s for %r (attempt %s/%s)",
+                    self.name, resp.status_code, query, attempt, max_attempts,
+                )
+
+            if attempt < max_attempts:
+                # 지수 백오프 + 지터 (동시에 막힌 요청들이 한꺼번에 다시 몰리지 않도록)
+                delay = backoff * (2 ** (attempt - 1))
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+        logger.info(
+            "[%s] giving up for %r after %s attempts (last %s)",
+            self.name, query, max_attempts, last,
+        )
+        return None
+
+
+class DuckDuckGoProvider(HtmlSearchProvider):
+    name = "duckduckgo"
+    url = "https://html.duckduckgo.com/html/"
+    setting_url = "SEARCH_DUCKDUCKGO_URL"
+
+    def parse(self, html):
+        return _extract_candidates_from_html(html)
+
+
+class BingProvider(HtmlSearchProvider):
+    name = "bing"
+    url = "https://www.bing.com/search"
+    setting_url = "SEARCH_BING_URL"
+
+    def params(self, query):
+        return {"q": query, "setlang": "ko"}
+
+    def parse(self, html):
+        links = select_links(html, ("li.b_algo h2 a[href]", "li.b_algo cite"))
+        urls = []
+        for href, _ in links["li.b_algo h2 a[href]"]:
+            # bing 이 /ck/a?... 로 감싼 링크는 건너뛰고 표시 URL(cite)을 쓴다
+            if urlparse(href).netloc and "bing.com" not in urlparse(href).netloc:
+                urls.append(href)
+        for _, text in links["li.b_algo cite"]:
+            urls.append(text.split(" ")[0])
+        return urls
+
+
+PROVIDERS = {
+    "cache": CacheProvider,
+    "registry": RegistryProvider,
+    "duckduckgo": DuckDuckGoProvider,
+    "bing": BingProvider,
+}
+
+
+def build_providers(names=None, bypass_cache=False):
+    """SEARCH_PROVIDERS(이름 리스트) 순서대로 provider 인스턴스를 만든다."""
+    if names is None:
+        names = getattr(settings, "SEARCH_PROVIDERS", ["cache", "duckduckgo"])
+    if isinstance(names, str):
+        names = names.split(",")
+
+    providers = []
+    for name in (n.strip() for n in names):
+        if not name:
+            continue
+        if name == "cache" and (bypass_cache or not search_cache.enabled()):
+            continue
+        if name not in PROVIDERS:
+            logger.warning("[search_providers] unknown provider %r (ignored)", name)
+            continue
+        providers.append(PROVIDERS[name]())
+    return providers
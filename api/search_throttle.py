@@ -0,0 +1,174 @@
+# api/search_throttle.py
+"""
+검색엔진 요청 속도를 모든 워커가 같이 조절하는 AIMD 스로틀 (Redis).
+
+DuckDuckGo 는 요청이 많으면 200 대신 202(차단)를 준다. 워커마다 고정 대기(3초)로 재시도하면
+서로 모르는 채로 다 같이 두드리다가 다 같이 막히고, 다 같이 쉬는 것을 반복한다.
+
+- 응답 결과(ok=200 / throttled=202 등)를 BUCKET_SECONDS 단위 슬라이딩 윈도우
+  (SEARCH_THROTTLE_WINDOW_SECONDS)에 모은다.
+- ADJUST_SECONDS 마다 (여러 워커 중 한 번만) 윈도우의 차단 비율을 보고 전역 속도(초당 요청 수)를 바꾼다.
+    차단 비율 >= HIGH_RATIO : 속도 x DECREASE (곱으로 감소), 윈도우 초기화
+    차단 비율 <= LOW_RATIO  : 속도 + INCREASE (더해서 증가)
+  속도는 [SEARCH_RATE_MIN, SEARCH_RATE_MAX] 안에서만 움직인다.
+- 실제 요청 간격은 api.ratelimit 토큰 버킷(이 속도)으로 모든 워커가 공유한다.
+Redis 호출은 동기(블로킹)라서 이벤트 루프에서는 wait() / arecord() 로 스레드에 넘겨서 부른다.
+Redis 가 REDIS_SOCKET_TIMEOUT_SECONDS 안에 답하지 않거나 문제가 있으면 스로틀 없이 통과시킨다.
+"""
+
+import asyncio
+import logging
+import time
+
+import redis
+from django.conf import settings
+
+from .ratelimit import RedisTokenBucket
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "throttle:"
+
+OK = "ok"
+THROTTLED = "throttled"
+
+# KEYS: rate, window, adjust 락
+# ARGV: outcome, bucket_seconds, window_buckets, adjust_seconds, initial, min, max,
+#       increase, decrease, high_ratio, low_ratio, min_samples
+_RECORD = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket_s = tonumber(ARGV[2])
+local nbuckets = tonumber(ARGV[3])
+local b = math.floor(now / bucket_s)
+
+redis.call('HINCRBY', KEYS[2], b .. ':' .. ARGV[1], 1)
+redis.call('EXPIRE', KEYS[2], math.ceil(bucket_s * nbuckets * 2))
+
+local rate = tonumber(redis.call('GET', KEYS[1]) or ARGV[5])
+if not redis.call('SET', KEYS[3], 1, 'NX', 'EX', ARGV[4]) then
+    return tostring(rate)
+end
+
+local ok, thr = 0, 0
+for i = b - nbuckets + 1, b do
+    ok = ok + (tonumber(redis.call('HGET', KEYS[2], i .. ':ok')) or 0)
+    thr = thr + (tonumber(redis.call('HGET', KEYS[2], i .. ':throttled')) or 0)
+end
+-- 윈도우 밖의 오래된 칸은 정리
+if redis.call('HLEN', KEYS[2]) > nbuckets * 4 then
+    for _, field in ipairs(redis.call('HKEYS', KEYS[2])) do
+        local fb = tonumber(string.match(field, '^(%-?%d+):'))
+        if fb and fb <= b - nbuckets then
+            redis.call('HDEL', KEYS[2], field)
+        end
+    end
+end
+
+local total = ok + thr
+if total >= tonumber(ARGV[12]) then
+    local ratio = thr / total
+    if ratio >= tonumber(ARGV[10]) then
+        rate = math.max(tonumber(ARGV[6]), rate * tonumber(ARGV[9]))
+        -- 줄인 속도의 효과는 새 응답으로 판단한다
+        redis.call('DEL', KEYS[2])
+    elseif ratio <= tonumber(ARGV[11]) then
+        rate = math.min(tonumber(ARGV[7]), rate + tonumber(ARGV[8]))
+    end
+end
+redis.call('SET', KEYS[1], tostring(rate))
+return tostring(rate)
+"""
+
+
+class SearchThrottle:
+    BUCKET_SECONDS = 5
+    ADJUST_SECONDS = 10
+    INCREASE = 0.05
+    DECREASE = 0.5
+    HIGH_RATIO = 0.1
+    LOW_RATIO = 0.02
+    MIN_SAMPLES = 5
+    MAX_SLEEP = 5.0
+    # Redis 오류 후 이 시간(초) 동안은 스로틀 없이 통과
+    REDIS_RETRY_AFTER = 60.0
+
+    def __init__(self, name="search", client=None):
+        if client is None:
+            timeout = float(getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 1))
+            client = redis.from_url(
+                getattr(settings, "REDIS_URL", "redis://redis:6379/0"),
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+            )
+        self.r = client
+        self.bucket = RedisTokenBucket(client=self.r)
+        self.name = name
+        self.keys = [KEY_PREFIX + f"{name}:{k}" for k in ("rate", "window", "adjust")]
+        self._script = self.r.register_script(_RECORD)
+        self._redis_failed_at = None
+
+    def _float(self, name, default):
+        return float(getattr(settings, name, default))
+
+    def _redis_down(self):
+        return self._redis_failed_at and time.monotonic() - self._redis_failed_at < self.REDIS_RETRY_AFTER
+
+    def _redis_error(self, e):
+        logger.warning("search_throttle: redis unavailable, searches are not throttled for %ss (%s)",
+                       int(self.REDIS_RETRY_AFTER), e)
+        self._redis_failed_at = time.monotonic()
+
+    def current_rate(self):
+        raw = self.r.get(self.keys[0])
+        return float(raw) if raw is not None else self._float("SEARCH_RATE_INITIAL", 0.5)
+
+    def try_acquire(self):
+        """0 이면 지금 요청해도 됨, 아니면 기다려야 할 초."""
+        if self._redis_down():
+            return 0.0
+        try:
+            rate = self.current_rate()
+            wait = self.bucket.try_acquire([(f"throttle:{self.name}", rate, 1)])
+        except redis.RedisError as e:
+            self._redis_error(e)
+            return 0.0
+        self._redis_failed_at = None
+        return wait
+
+    async def wait(self):
+        """전역 속도 안에서 요청 1개를 보낼 수 있을 때까지 (이벤트 루프를 막지 않고) 기다린다."""
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire)
+            if wait <= 0:
+                return
+            await asyncio.sleep(min(wait, self.MAX_SLEEP))
+
+    def record(self, outcome):
+        """응답 결과 1건 기록 (OK / THROTTLED). 조정된 현재 속도를 돌려준다."""
+        if self._redis_down():
+            return None
+        window = self._float("SEARCH_THROTTLE_WINDOW_SECONDS", 60)
+        args = [
+            outcome,
+            self.BUCKET_SECONDS,
+            max(1, int(window // self.BUCKET_SECONDS)),
+            self.ADJUST_SECONDS,
+            self._float("SEARCH_RATE_INITIAL", 0.5),
+            self._float("SEARCH_RATE_MIN", 0.05),
+            self._float("SEARCH_RATE_MAX", 5),
+            self.INCREASE,
+            self.DECREASE,
+            self.HIGH_RATIO,
+            self.LOW_RATIO,
+            self.MIN_SAMPLES,
+        ]
+        try:
+            return float(self._script(keys=self.keys, args=args))
+        except redis.RedisError as e:
+            self._redis_error(e)
+            return None
+
+    async def arecord(self, outcome):
+        """record() 를 스레드에서 부른다 (이벤트 루프용)."""
+        return await asyncio.to_thread(self.record, outcome)
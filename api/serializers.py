@@ -5,12 +5,13 @@ class JobPostingSerializer(serializers.ModelSerializer):
     """
     JobPosting용 DRF Serializer.
 
-    - fields='__all__' 이므로 모델에 존재하는 모든 필드가 노출됩니다.
+    - 아래 exclude 를 뺀 모델의 모든 필드가 노출됩니다.
       (여기에는 새로 추가된 is_active(BooleanField), first_seen_at(DateTimeField)도 포함)
     - first_seen_at은 auto_now_add=True(서버가 최초 생성 시각을 지정) 이므로
-      클라이언트가 수정할 수 없도록 read_only로 둡니다.
+      클라이언트가 수정할 수 없도록 read_only로 둡니다. last_seen_at 은 수집기가 채웁니다.
+    - content_hash / field_hashes 는 수집기 내부 변경 감지용이라 노출하지 않습니다.
     """
     class Meta:
         model = JobPosting
-        fields = '__all__'
-        read_only_fields = ('first_seen_at',)
+        exclude = ('content_hash', 'field_hashes')
+        read_only_fields = ('first_seen_at', 'last_seen_at')
@@ -1,28 +1,94 @@
 # api/tasks.py
 
-import os
-import subprocess
 import logging
+import uuid
 
-from celery import shared_task, chain
+from celery import shared_task, chain, chord, group
+from celery.signals import task_postrun
 from django.db import close_old_connections
+from django.db.models import Q
 from django.conf import settings
+from django.utils import timezone
 
+from . import crawl_status, recruits_revalidate, revisit
+from .crawl_runner import run_spiders
 from .models import Company
-from .utils import find_homepage_for_company
+from .homepage_resolver import resolve_homepages
 
 logger = logging.getLogger(__name__)
 
 BASE_DIR = settings.BASE_DIR
 
 
+# ===== 단계별 대상 queryset =====
+
+def homepage_targets_qs():
+    return Company.objects.filter(homepage_url__isnull=True)
+
+
+def revalidate_targets_qs():
+    # 저장된 recruits_url 재확인 (api/recruits_revalidate.py)
+    if not getattr(settings, "RECRUITS_REVALIDATE", False):
+        return Company.objects.none()
+    return Company.objects.filter(recruits_revalidate.targets_filter())
+
+
+def discover_targets_qs():
+    # recruits_url 이 없거나, 재확인에서 없어짐/구조 바뀜(GONE/CHANGED)으로 나온 회사
+    return Company.objects.filter(
+        homepage_url__isnull=False
+    ).filter(
+        Q(recruits_url__isnull=True)
+        | Q(recruits_url="")
+        | Q(recruits_url_status__in=recruits_revalidate.REDISCOVER_STATUSES)
+    )
+
+
+def collector_targets_qs():
+    # (이전 템플릿에서 recruits_url_status='CONFIRMED' 로 너무 좁게 잡혀 있던 부분을 완화한 것.
+    #  필드는 그대로 두되, 지금은 조건에서 빼서 실제로 돌도록 한다.)
+    qs = Company.objects.filter(
+        recruits_url__isnull=False,
+    ).exclude(
+        recruits_url="",
+    ).exclude(
+        # 재확인에서 없어졌거나 바뀐 페이지는 discover 가 새로 찾을 때까지 수집하지 않는다
+        recruits_url_status__in=recruits_revalidate.REDISCOVER_STATUSES,
+    ).filter(
+        page_type__in=["listing", "one_page", "main"],
+        post_type="text",
+    )
+    # 적응형 재방문: next_crawl_at 이 된 회사만 (api/revisit.py)
+    if getattr(settings, "REVISIT_ADAPTIVE", False):
+        qs = qs.filter(revisit.due_filter())
+    return qs
+
+
+def skip_checkpointed(qs, cycle_id, stage):
+    """재개된 사이클이면 이 단계에서 이미 끝낸 회사는 뺀다."""
+    done = crawl_status.done_ids(cycle_id, stage)
+    if done:
+        logger.info("checkpoint: stage=%s skip %s companies already done (cycle_id=%s)", stage, len(done), cycle_id)
+        qs = qs.exclude(id__in=done)
+    return qs
+
+
 @shared_task
-def find_missing_homepages(limit=None):
+def find_missing_homepages(limit=None, company_ids=None, forward=False, cycle_id=None, bypass_cache=False):
     """
     homepage_url 이 비어있는 회사들에 대해 검색으로 홈페이지를 찾아 채워 넣는다.
+    회사 HOMEPAGE_RESOLVE_BATCH_SIZE 개씩 비동기로 동시에 검색/검증하고(api/homepage_resolver.py),
+    배치마다 찾은 홈페이지(+ confidence)를 bulk_update 한 번으로 저장한다.
     limit: 개발 단계에서 상위 N개만 시도하고 싶을 때 사용 (None이면 전체)
+    company_ids: 샤드 실행 시 이 회사들만 대상으로 한다.
+    forward: True 면 홈페이지를 찾은 회사의 discover 를 바로 큐에 넣는다 (streaming 모드).
+    cycle_id: 전체 사이클에서 호출된 경우, 진행 상황을 crawl_status 에 기록한다.
+    bypass_cache: True 면 검색 결과 캐시(api/search_cache.py)를 무시하고 새로 검색한다.
     """
-    qs_all = Company.objects.filter(homepage_url__isnull=True).order_by("id")
+    qs_all = homepage_targets_qs().order_by("id")
+    if company_ids is not None:
+        qs_all = qs_all.filter(id__in=company_ids)
+    qs_all = skip_checkpointed(qs_all, cycle_id, "homepages")
     total_all = qs_all.count()
 
     if limit:
@@ -39,13 +105,31 @@ def find_missing_homepages(limit=None):
         total_all,
         limit,
     )
-
-    for company in qs:
-        homepage = find_homepage_for_company(company.name)
-        if homepage:
-            company.homepage_url = homepage
-            company.save(update_fields=["homepage_url"])
-            updated += 1
+    crawl_status.stage_add_total(cycle_id, "homepages", total)
+
+    batch_size = max(1, int(getattr(settings, "HOMEPAGE_RESOLVE_BATCH_SIZE", 50)))
+    companies = list(qs.only("id", "name"))
+
+    for i in range(0, len(companies), batch_size):
+        batch = companies[i:i + batch_size]
+        found = resolve_homepages([(c.id, c.name) for c in batch], bypass_cache=bypass_cache)
+
+        changed = []
+        for company in batch:
+            homepage, confidence = found.get(company.id, (None, None))
+            if homepage:
+                company.homepage_url = homepage
+                company.homepage_confidence = confidence
+                changed.append(company)
+        if changed:
+            Company.objects.bulk_update(changed, ["homepage_url", "homepage_confidence"])
+        updated += len(changed)
+
+        crawl_status.stage_done(cycle_id, "homepages", n=len(batch), updated=len(changed))
+        crawl_status.mark_done(cycle_id, "homepages", *(c.id for c in batch))
+        if forward:
+            for company in changed:
+                _forward(run_discover_careers_spiders, cycle_id, company.id)
 
     logger.info(
         "find_missing_homepages: done (updated=%s, scanned=%s, total_pending=%s)",
@@ -53,64 +137,114 @@ def find_missing_homepages(limit=None):
         total,
         total_all,
     )
+    return {"stage": "homepages", "scanned": total, "updated": updated}
 
 
 @shared_task
-def run_discover_careers_spiders(limit=None):
+def revalidate_recruits_urls(limit=None, company_ids=None, forward=False, cycle_id=None):
     """
-    homepage_url은 있지만 recruits_url이 없는 회사들에 대해
-    discover_careers 스파이더를 실행.
+    저장된 recruits_url 을 조건부 요청 1개씩으로 다시 확인하고 recruits_url_status / score 등을 갱신한다.
+    RECRUITS_REVALIDATE_BATCH_SIZE 개씩 비동기로 확인하고, 배치마다 bulk_update 한 번으로 저장한다.
+    없어졌거나(GONE) 구조가 바뀐(CHANGED) 회사만 discover 대상이 된다 (discover_targets_qs).
     limit: 개발용 옵션. None이면 전체, 숫자면 상위 N개만.
+    company_ids: 샤드 실행 시 이 회사들만 대상으로 한다.
+    forward: True 면 GONE/CHANGED 회사는 discover 로, 나머지 수집 대상은 collect 로 바로 넘긴다 (streaming 모드).
+    cycle_id: 전체 사이클에서 호출된 경우, 진행 상황을 crawl_status 에 기록한다.
     """
-    from django.db.models import Q
-
-    qs = Company.objects.filter(
-        homepage_url__isnull=False
-    ).filter(
-        Q(recruits_url__isnull=True) | Q(recruits_url="")
-    ).order_by("id")
-
+    qs = revalidate_targets_qs().order_by("id")
+    if company_ids is not None:
+        qs = qs.filter(id__in=company_ids)
+    qs = skip_checkpointed(qs, cycle_id, "revalidate")
     if limit:
         qs = qs[:int(limit)]
 
-    scrapy_project_path = os.path.join(settings.BASE_DIR, "crawler")
+    companies = list(qs.only("id", "recruits_url", *recruits_revalidate.FIELDS))
+    logger.info("revalidate_recruits_urls: start (targets=%s)", len(companies))
+    crawl_status.stage_add_total(cycle_id, "revalidate", len(companies))
 
-    for company in qs:
-        close_old_connections()
+    batch_size = max(1, int(getattr(settings, "RECRUITS_REVALIDATE_BATCH_SIZE", 200)))
+    counts = {}
+    for i in range(0, len(companies), batch_size):
+        batch = companies[i:i + batch_size]
+        states = recruits_revalidate.revalidate(batch)
+        Company.objects.bulk_update(batch, recruits_revalidate.FIELDS)
 
-        env = os.environ.copy()
-        # Scrapy 프로세스 안에서 Django ORM 사용 허용
-        env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
-        env.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
+        rediscover = [cid for cid, state in states.items() if state in recruits_revalidate.REDISCOVER_STATUSES]
+        for state in states.values():
+            counts[state.lower()] = counts.get(state.lower(), 0) + 1
+        crawl_status.stage_done(cycle_id, "revalidate", n=len(batch), rediscover=len(rediscover))
+        crawl_status.mark_done(cycle_id, "revalidate", *(c.id for c in batch))
 
-        cmd = [
-            "scrapy", "crawl", "discover_careers",
-            "-a", f"company_id={company.id}",
-            "-a", f"company_name={company.name}",
-            "-a", f"homepage_url={company.homepage_url}",
-        ]
+        if forward:
+            for company_id in rediscover:
+                _forward(run_discover_careers_spiders, cycle_id, company_id)
+            collectable = collector_targets_qs().filter(id__in=[c.id for c in batch])
+            for company_id in collectable.values_list("id", flat=True):
+                _forward(run_job_collector_spiders, cycle_id, company_id)
 
+    logger.info("revalidate_recruits_urls: done %s", counts)
+    return {"stage": "revalidate", "scanned": len(companies), **counts}
+
+
+@shared_task
+def run_discover_careers_spiders(limit=None, company_ids=None, forward=False, cycle_id=None):
+    """
+    homepage_url은 있지만 recruits_url이 없는 회사들에 대해
+    discover_careers 스파이더를 실행.
+    limit: 개발용 옵션. None이면 전체, 숫자면 상위 N개만.
+    company_ids: 샤드 실행 시 이 회사들만 대상으로 한다.
+    forward: True 면 recruits_url 이 저장된 회사의 수집을 바로 큐에 넣는다 (streaming 모드).
+    cycle_id: 전체 사이클에서 호출된 경우, 진행 상황을 crawl_status 에 기록한다.
+    """
+    qs = discover_targets_qs().order_by("id")
+    if company_ids is not None:
+        qs = qs.filter(id__in=company_ids)
+    qs = skip_checkpointed(qs, cycle_id, "discover")
+
+    if limit:
+        qs = qs[:int(limit)]
+
+    targets = []
+    for company in qs:
         logger.info(
             "run_discover_careers_spiders: company_id=%s name=%s url=%s",
             company.id, company.name, company.homepage_url,
         )
-
-        result = subprocess.run(
-            cmd,
-            cwd=scrapy_project_path,
-            env=env,
-        )
-
-        if result.returncode != 0:
+        targets.append({
+            "company_id": company.id,
+            "company_name": company.name,
+            "homepage_url": company.homepage_url,
+        })
+    crawl_status.stage_add_total(cycle_id, "discover", len(targets))
+
+    def _on_result(result):
+        close_old_connections()
+        failed = result["exit"] != 0
+        crawl_status.stage_done(cycle_id, "discover", failed=failed)
+        if failed:
             logger.warning(
                 "discover_careers spider failed for company_id=%s (exit=%s)",
-                company.id, result.returncode
+                result["company_id"], result["exit"]
             )
-
+            return
+        crawl_status.mark_done(cycle_id, "discover", result["company_id"])
+        # 배치 러너는 회사 하나가 끝날 때마다 결과를 주므로, 나머지 회사를 기다리지 않고 넘긴다.
+        if forward and collector_targets_qs().filter(id=result["company_id"]).exists():
+            _forward(run_job_collector_spiders, cycle_id, result["company_id"])
+
+    results = run_spiders(
+        "discover_careers", targets, on_result=_on_result,
+        multi_tenant_batch=getattr(settings, "DISCOVER_MULTI_TENANT_BATCH", 0),
+    )
+    return {
+        "stage": "discover",
+        "scanned": len(results),
+        "failed": sum(1 for r in results if r["exit"] != 0),
+    }
 
 
 @shared_task
-def run_job_collector_spiders(limit=None):
+def run_job_collector_spiders(limit=None, company_ids=None, forward=False, cycle_id=None):
     """
     Company에 저장된 recruits_url 정보를 기반으로
     job_collector 스파이더를 회사별로 실행한다.
@@ -121,44 +255,43 @@ def run_job_collector_spiders(limit=None):
     - page_type in ('listing', 'one_page', 'main') 만 대상.
     - recruits_url 이 비어있지 않은 회사만 대상.
     - limit 가 주어지면, id 기준 상위 N개 회사만 실행 (디버그/부분 실행용).
-    - 각 회사는 별도 Scrapy 프로세스로 실행.
+    - company_ids 가 주어지면 그 회사들만 실행 (샤드 실행용).
+    - REVISIT_ADAPTIVE 면 재방문 시점이 된 회사만, 기대 수확량 순으로 실행 (api/revisit.py).
+    - forward: streaming 모드에서 호출됨 (마지막 단계라 넘길 곳은 없고, 사이클 종료 집계에만 쓰인다).
+    - cycle_id 가 주어지면 진행 상황을 crawl_status 에 기록.
+    - 실행 방식은 settings.CRAWL_RUNNER_MODE 를 따른다 (crawl_runner 참고).
     """
 
     # queryset: "지금 우리가 진짜 돌리고 싶은 회사들"
-    qs = Company.objects.filter(
-        recruits_url__isnull=False,
-    ).exclude(
-        recruits_url="",
-    ).filter(
-        page_type__in=["listing", "one_page", "main"],
-        post_type="text",
-    )
-
-    # (이전 템플릿에서 recruits_url_status='CONFIRMED' 로 너무 좁게 잡혀 있던 부분을 완화한 것.
-    #  필드는 그대로 두되, 지금은 조건에서 빼서 실제로 돌도록 한다.)
-
-    qs = qs.order_by("id")
+    qs = collector_targets_qs().order_by("id")
+    if company_ids is not None:
+        qs = qs.filter(id__in=company_ids)
+    qs = skip_checkpointed(qs, cycle_id, "collect")
+
+    targets = list(qs.values(
+        "id", "name", "recruits_url", "page_type", "post_type",
+        "last_crawled_at", "change_rate",
+    ))
+    # 기대 수확량(변화율 x 경과시간)이 큰 회사부터
+    if getattr(settings, "REVISIT_ADAPTIVE", False):
+        targets = revisit.order_by_expected_yield(targets)
 
     if limit is not None:
         try:
             limit = int(limit)
             if limit > 0:
-                qs = qs[:limit]
+                targets = targets[:limit]
         except (TypeError, ValueError):
             logger.warning("run_job_collector_spiders: invalid limit=%r (ignored)", limit)
 
-    targets = list(qs.values("id", "name", "recruits_url", "page_type", "post_type"))
     logger.info("run_job_collector_spiders: start (targets=%s)", len(targets))
+    crawl_status.stage_add_total(cycle_id, "collect", len(targets))
 
     if not targets:
         logger.info("run_job_collector_spiders: no targets (nothing to run)")
-        return
-
-    # Scrapy 실행 환경 설정
-    base_env = os.environ.copy()
-    base_env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
-    base_env.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
+        return {"stage": "collect", "scanned": 0, "failed": 0}
 
+    spider_targets = []
     for t in targets:
         company_id = t["id"]
         name = t["name"]
@@ -175,75 +308,302 @@ def run_job_collector_spiders(limit=None):
             url,
         )
 
-        # company 개별 실행
-        cmd = [
-            "scrapy",
-            "crawl",
-            "job_collector",
-            "-a",
-            f"company_id={company_id}",
-            "-a",
-            f"recruits_url={url}",
-            "-a",
-            f"page_type={page_type or 'listing'}",
-            "-a",
-            f"post_type={post_type or 'text'}",
-        ]
+        spider_targets.append({
+            "company_id": company_id,
+            "recruits_url": url,
+            "page_type": page_type or "listing",
+            "post_type": post_type or "text",
+        })
 
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd="/app/crawler",
-                env=base_env,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-        except Exception as e:
+    started_at = timezone.now()
+
+    def _on_result(result):
+        company_id = result["company_id"]
+        crawl_status.stage_done(cycle_id, "collect", failed=result["exit"] != 0)
+        close_old_connections()
+
+        if result["exit"] is None:
             logger.warning(
                 "run_job_collector_spiders: failed to start spider for company_id=%s (%s)",
                 company_id,
-                e,
+                result.get("error"),
             )
-            continue
-
-        if result.returncode != 0:
+        elif result["exit"] != 0:
             logger.warning(
                 "run_job_collector_spiders: spider failed for company_id=%s (exit=%s)\nstdout=%s\nstderr=%s",
                 company_id,
-                result.returncode,
-                (result.stdout or "")[:4000],
-                (result.stderr or "")[:4000],
+                result["exit"],
+                (result.get("stdout") or "")[:4000],
+                (result.get("stderr") or result.get("error") or "")[:4000],
             )
         else:
             logger.info(
-                "run_job_collector_spiders: spider done for company_id=%s",
+                "run_job_collector_spiders: spider done for company_id=%s (reason=%s)",
                 company_id,
+                result.get("reason"),
             )
+            revisit.record_crawl_outcome(company_id, started_at)
+            crawl_status.mark_done(cycle_id, "collect", company_id)
+
+    results = run_spiders("job_collector", spider_targets, on_result=_on_result, capture_output=True)
 
     logger.info("run_job_collector_spiders: finished all targets")
+    return {
+        "stage": "collect",
+        "scanned": len(results),
+        "failed": sum(1 for r in results if r["exit"] != 0),
+    }
+
+
+# ===== 샤드 분산 실행 =====
+
+# stage 이름 -> (대상 queryset, 실행 태스크)
+STAGES = {
+    "homepages": (homepage_targets_qs, find_missing_homepages),
+    "revalidate": (revalidate_targets_qs, revalidate_recruits_urls),
+    "discover": (discover_targets_qs, run_discover_careers_spiders),
+    "collect": (collector_targets_qs, run_job_collector_spiders),
+}
+
+
+def split_into_shards(ids, max_shards, min_shard_size=1):
+    """
+    id 리스트를 연속 구간(id range)으로 최대 max_shards 개 샤드로 나눈다.
+    샤드가 너무 잘게 쪼개지지 않도록 샤드 하나당 최소 min_shard_size 개는 담는다.
+    """
+    if not ids:
+        return []
+    min_shard_size = max(1, int(min_shard_size))
+    n = max(1, min(int(max_shards), -(-len(ids) // min_shard_size)))
+    size = -(-len(ids) // n)
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+@shared_task(bind=True)
+def run_stage_sharded(self, totals, stage, cycle_id=None):
+    """
+    stage 대상 회사들을 샤드로 나눠 group 으로 뿌리고,
+    모든 샤드가 끝나면 aggregate_stage_results 로 합산한다 (chord).
+    이 태스크 자체는 chord 로 replace 되므로, chain 다음 단계는 chord 가 끝난 뒤에 시작된다.
+
+    totals: 앞 단계까지의 합산 결과 (chain 에서 넘어옴)
+    """
+    targets_qs, task = STAGES[stage]
+    qs = skip_checkpointed(targets_qs(), cycle_id, stage)
+    ids = list(qs.order_by("id").values_list("id", flat=True))
+
+    max_shards = settings.CRAWL_STAGE_MAX_SHARDS.get(stage, 1)
+    shards = split_into_shards(ids, max_shards, settings.CRAWL_SHARD_MIN_SIZE)
+
+    logger.info(
+        "full_cycle: stage=%s targets=%s shards=%s (max_shards=%s)",
+        stage, len(ids), len(shards), max_shards,
+    )
+    crawl_status.set_stage(cycle_id, stage)
+
+    if not shards:
+        return aggregate_stage_results([], totals, stage)
+
+    header = group(task.si(company_ids=shard, cycle_id=cycle_id) for shard in shards)
+    return self.replace(chord(header, aggregate_stage_results.s(totals, stage)))
+
+
+@shared_task
+def aggregate_stage_results(results, totals, stage):
+    """샤드 결과(dict 리스트)의 숫자 필드를 합산해서 totals[stage] 에 넣는다."""
+    summary = {"shards": len(results)}
+    for r in results or []:
+        for key, value in (r or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                summary[key] = summary.get(key, 0) + value
+
+    logger.info("full_cycle: stage=%s done %s", stage, summary)
+
+    totals = dict(totals or {})
+    totals[stage] = summary
+    return totals
+
+
+@shared_task
+def report_cycle_totals(totals, cycle_id=None):
+    logger.info("full_cycle: finished totals=%s", totals)
+    if cycle_id:
+        crawl_status.finish_cycle(cycle_id)
+    return totals
+
+
+@shared_task
+def mark_stage(stage, cycle_id):
+    """chain 모드에서 다음 단계로 넘어갈 때 상태의 stage 를 바꾼다."""
+    crawl_status.set_stage(cycle_id, stage)
+
+
+@shared_task
+def finish_crawling_cycle(cycle_id):
+    crawl_status.finish_cycle(cycle_id)
+    logger.info("full_cycle: finished cycle_id=%s", cycle_id)
+
+
+@shared_task
+def fail_crawling_cycle(cycle_id):
+    """chain 중간 태스크가 실패하면 호출 (link_error). 락을 풀고 FAILED 로 남긴다."""
+    crawl_status.finish_cycle(cycle_id, state="FAILED")
+    logger.warning("full_cycle: failed cycle_id=%s", cycle_id)
+
+
+# ===== 회사 단위 streaming 실행 =====
+
+def _forward(task, cycle_id, company_id):
+    """streaming 모드: 회사 1개를 다음 단계 태스크로 넘긴다 (남은 태스크 수 +1)."""
+    if cycle_id:
+        crawl_status.pending_add(cycle_id)
+    task.delay(company_ids=[company_id], forward=True, cycle_id=cycle_id)
+
+
+STREAMING_TASK_NAMES = {
+    find_missing_homepages.name,
+    revalidate_recruits_urls.name,
+    run_discover_careers_spiders.name,
+    run_job_collector_spiders.name,
+}
+
+
+@task_postrun.connect
+def _streaming_task_done(sender=None, kwargs=None, **_):
+    """
+    streaming 사이클의 태스크가 (성공/실패 상관없이) 끝날 때마다 남은 태스크 수를 줄이고,
+    0 이 되면 사이클을 종료(락 해제)한다.
+    """
+    kwargs = kwargs or {}
+    if not (kwargs.get("forward") and kwargs.get("cycle_id")):
+        return
+    if getattr(sender, "name", None) not in STREAMING_TASK_NAMES:
+        return
+    cycle_id = kwargs["cycle_id"]
+    if crawl_status.pending_done(cycle_id) <= 0:
+        crawl_status.finish_cycle(cycle_id)
+        logger.info("full_cycle: streaming finished cycle_id=%s", cycle_id)
+
+
+def dispatch_streaming_cycle(cycle_id=None):
+    """
+    단계 사이의 barrier 없이 회사 단위로 다음 단계를 이어서 큐에 넣는다.
+      - 재확인할 때가 된 회사      -> revalidate (그대로면 collect, 없어졌거나 바뀌었으면 discover 로 넘김)
+      - 이미 수집 가능한 회사      -> 바로 collect
+      - 홈페이지만 있는 회사       -> discover (끝나는 회사부터 collect 로 넘김)
+      - 홈페이지가 없는 회사       -> homepages (찾는 회사부터 discover 로 넘김)
+    backlog 는 CRAWL_STREAM_CHUNK_SIZE 개씩 잘라서 여러 태스크로 뿌린다.
+    """
+    chunk = max(1, settings.CRAWL_STREAM_CHUNK_SIZE)
+
+    def _chunks(qs, stage):
+        qs = skip_checkpointed(qs, cycle_id, stage)
+        ids = list(qs.order_by("id").values_list("id", flat=True))
+        return [ids[i:i + chunk] for i in range(0, len(ids), chunk)]
+
+    revalidate_qs = revalidate_targets_qs()
+    revalidate_chunks = _chunks(revalidate_qs, "revalidate")
+    # 재확인할 회사는 revalidate 가 끝난 뒤에 collect / discover 로 넘어온다
+    # (GONE 으로 back-off 가 지난 회사는 discover 대상이기도 해서 둘 다에서 뺀다)
+    collect_chunks = _chunks(collector_targets_qs().exclude(id__in=revalidate_qs.values("id")), "collect")
+    discover_chunks = _chunks(discover_targets_qs().exclude(id__in=revalidate_qs.values("id")), "discover")
+    homepage_chunks = _chunks(homepage_targets_qs(), "homepages")
+
+    if cycle_id:
+        crawl_status.set_stage(cycle_id, "streaming")
+        n = len(revalidate_chunks) + len(collect_chunks) + len(discover_chunks) + len(homepage_chunks)
+        if not n:
+            crawl_status.finish_cycle(cycle_id)
+            return
+        crawl_status.pending_add(cycle_id, n)
+
+    for ids in revalidate_chunks:
+        revalidate_recruits_urls.delay(company_ids=ids, forward=True, cycle_id=cycle_id)
+    for ids in collect_chunks:
+        run_job_collector_spiders.delay(company_ids=ids, forward=True, cycle_id=cycle_id)
+    for ids in discover_chunks:
+        run_discover_careers_spiders.delay(company_ids=ids, forward=True, cycle_id=cycle_id)
+    for ids in homepage_chunks:
+        find_missing_homepages.delay(company_ids=ids, forward=True, cycle_id=cycle_id)
+
+    logger.info(
+        "full_cycle: streaming dispatched (revalidate=%s, collect=%s, discover=%s, homepages=%s chunks)",
+        len(revalidate_chunks), len(collect_chunks), len(discover_chunks), len(homepage_chunks),
+    )
+
 
 @shared_task(name="api.tasks.run_full_crawling_cycle")
 def run_full_crawling_cycle():
     """
     전체 파이프라인:
       1) find_missing_homepages    - homepage_url 채우기
-      2) run_discover_careers_spiders - recruits_url / page_type / post_type 등 찾기 (스파이더 책임)
-      3) run_job_collector_spiders - 실제 채용공고 수집
+      2) revalidate_recruits_urls  - 저장된 recruits_url 이 그대로인지 가볍게 확인 (바뀐 회사만 discover 로)
+      3) run_discover_careers_spiders - recruits_url / page_type / post_type 등 찾기 (스파이더 책임)
+      4) run_job_collector_spiders - 실제 채용공고 수집
 
     여기서는 limit 사용하지 않고 전체 대상 기준으로 돈다.
     (개발용 limit 테스트는 각 task를 개별 호출할 때만 사용)
+
+    settings.CRAWL_CYCLE_MODE
+      - "chain"  : 단계별 태스크 1개씩 순서대로 (기존 방식)
+      - "sharded": 단계마다 대상 회사를 샤드로 나눠 여러 워커에 group/chord 로 분산
+      - "streaming": 회사마다 앞 단계가 끝나는 즉시 다음 단계를 큐에 넣음 (barrier 없음)
+
+    사이클은 crawl_status 락(crawler:lock)을 잡은 경우에만 시작한다.
+    락은 마지막 태스크(또는 실패 시 link_error)에서 풀리고, 워커가 죽으면 만료로 풀린다.
+    정상 종료되지 않은 사이클이 있으면 그 cycle_id 를 이어받아 끝난 회사는 건너뛴다.
     """
-    logger.info("full_cycle: dispatch chain")
+    mode = getattr(settings, "CRAWL_CYCLE_MODE", "chain")
+
+    # 중단된 사이클이 있으면 같은 cycle_id 로 이어서 돈다 (체크포인트된 회사는 각 단계에서 건너뜀)
+    resumed_id = crawl_status.unfinished_cycle_id()
+    if resumed_id and crawl_status.is_alive(resumed_id):
+        # 락은 만료됐어도 예전 실행이 아직 진행 상황을 기록하고 있다 -> 이어받으면 카운터를 덮어쓴다
+        logger.warning(
+            "full_cycle: unfinished cycle_id=%s still sends heartbeats (lock expired?), skip",
+            resumed_id,
+        )
+        return
+    cycle_id = resumed_id or uuid.uuid4().hex
+    if not crawl_status.acquire_lock(cycle_id):
+        logger.warning(
+            "full_cycle: another cycle is running (cycle_id=%s), skip",
+            crawl_status.current_cycle_id(),
+        )
+        return
+    crawl_status.start_cycle(cycle_id, mode, resumed=bool(resumed_id))
+    logger.info("full_cycle: lock acquired cycle_id=%s resumed=%s", cycle_id, bool(resumed_id))
 
-    workflow = chain(
-        find_missing_homepages.s(),          # limit=None
-        run_discover_careers_spiders.s(),    # limit=None
-        run_job_collector_spiders.s(),       # limit=None
-    )
-    workflow.apply_async()
+    if mode == "streaming":
+        dispatch_streaming_cycle(cycle_id)
+        return
+
+    if mode == "sharded":
+        logger.info("full_cycle: dispatch sharded chain")
+        workflow = chain(
+            run_stage_sharded.s({}, "homepages", cycle_id=cycle_id),
+            run_stage_sharded.s("revalidate", cycle_id=cycle_id),
+            run_stage_sharded.s("discover", cycle_id=cycle_id),
+            run_stage_sharded.s("collect", cycle_id=cycle_id),
+            report_cycle_totals.s(cycle_id=cycle_id),
+        )
+    else:
+        logger.info("full_cycle: dispatch chain")
+        # 각 태스크가 결과 dict 를 리턴하므로 .si() 로 앞 결과가 limit 으로 넘어가지 않게 한다.
+        workflow = chain(
+            mark_stage.si("homepages", cycle_id),
+            find_missing_homepages.si(cycle_id=cycle_id),          # limit=None
+            mark_stage.si("revalidate", cycle_id),
+            revalidate_recruits_urls.si(cycle_id=cycle_id),        # limit=None
+            mark_stage.si("discover", cycle_id),
+            run_discover_careers_spiders.si(cycle_id=cycle_id),    # limit=None
+            mark_stage.si("collect", cycle_id),
+            run_job_collector_spiders.si(cycle_id=cycle_id),       # limit=None
+            finish_crawling_cycle.si(cycle_id),
+        )
+    workflow.apply_async(link_error=fail_crawling_cycle.si(cycle_id))
 
-    logger.info("full_cycle: chain dispatched")
+    logger.info("full_cycle: chain dispatched (mode=%s)", mode)
 
 
 @shared_task
@@ -0,0 +1,105 @@
+"""
+crawl_status 의 사이클 락: 주인만 연장 / 해제할 수 있고, heartbeat 로 살아 있는지 판단한다 (fakeredis).
+"""
+
+import time
+
+import fakeredis
+import pytest
+from django.test import override_settings
+
+from api import crawl_status
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = fakeredis.FakeRedis()
+    monkeypatch.setattr(crawl_status, "r", fake)
+    return fake
+
+
+@override_settings(CRAWL_LOCK_TTL_SECONDS=600)
+def test_only_one_cycle_holds_the_lock(redis):
+    assert crawl_status.acquire_lock("cycle-a")
+    assert not crawl_status.acquire_lock("cycle-b")
+    assert crawl_status.is_running()
+    assert crawl_status.current_cycle_id() == "cycle-a"
+    assert 0 < redis.ttl(crawl_status.LOCK_KEY) <= 600
+
+
+@override_settings(CRAWL_LOCK_TTL_SECONDS=600)
+def test_heartbeat_extends_only_the_owners_lock(redis):
+    crawl_status.acquire_lock("cycle-a")
+    redis.expire(crawl_status.LOCK_KEY, 5)
+
+    assert not crawl_status.heartbeat("cycle-b")
+    assert redis.ttl(crawl_status.LOCK_KEY) <= 5
+
+    assert crawl_status.heartbeat("cycle-a")
+    assert redis.ttl(crawl_status.LOCK_KEY) > 5
+    assert not crawl_status.heartbeat(None)
+
+
+def test_release_by_other_cycle_keeps_the_lock(redis):
+    crawl_status.acquire_lock("cycle-a")
+
+    assert not crawl_status.release_lock("cycle-b")
+    assert crawl_status.current_cycle_id() == "cycle-a"
+
+    assert crawl_status.release_lock("cycle-a")
+    assert not crawl_status.is_running()
+    # 해제된 뒤에는 다른 사이클이 잡을 수 있다
+    assert crawl_status.acquire_lock("cycle-b")
+
+
+def test_heartbeat_keeps_expired_cycle_alive(redis):
+    crawl_status.acquire_lock("cycle-a")
+    crawl_status.start_cycle("cycle-a", mode="chain")
+    # 락이 만료돼도 heartbeat 가 최근이면 아직 도는 중이다
+    redis.delete(crawl_status.LOCK_KEY)
+
+    assert crawl_status.is_alive("cycle-a")
+    assert not crawl_status.is_alive("cycle-b")
+
+
+@override_settings(CRAWL_CYCLE_STALE_SECONDS=60)
+def test_stale_heartbeat_is_not_alive(redis):
+    redis.set(crawl_status.HEARTBEAT_KEY.format(cycle_id="cycle-a"), time.time() - 120)
+
+    assert crawl_status.last_heartbeat("cycle-a") < time.time() - 60
+    assert not crawl_status.is_alive("cycle-a")
+
+
+def test_finish_cycle_releases_lock_and_heartbeat(redis):
+    crawl_status.acquire_lock("cycle-a")
+    crawl_status.start_cycle("cycle-a", mode="chain")
+
+    crawl_status.finish_cycle("cycle-a", state="FAILED", error="boom")
+
+    assert not crawl_status.is_running()
+    assert crawl_status.last_heartbeat("cycle-a") is None
+    assert not crawl_status.is_alive("cycle-a")
+    # 실패한 사이클은 이어받을 수 있게 current 표시를 남긴다
+    assert crawl_status.unfinished_cycle_id() == "cycle-a"
+    assert crawl_status.get_status()["state"] == "FAILED"
+
+
+def test_finish_cycle_of_a_stale_owner_does_not_release_new_lock(redis):
+    crawl_status.acquire_lock("cycle-b")
+
+    crawl_status.finish_cycle("cycle-a")
+
+    assert crawl_status.current_cycle_id() == "cycle-b"
+
+
+@override_settings(CRAWL_LOCK_TTL_SECONDS=600)
+def test_spider_counters_heartbeat_the_running_cycle(redis):
+    crawl_status.acquire_lock("cycle-a")
+    redis.expire(crawl_status.LOCK_KEY, 5)
+
+    crawl_status.add_counters(pages_fetched=3, postings_created=0)
+
+    assert redis.ttl(crawl_status.LOCK_KEY) > 5
+    assert crawl_status.is_alive("cycle-a")
+    assert redis.hget(crawl_status.PROGRESS_KEY, "pages_fetched") == b"3"
+    assert redis.hget(crawl_status.PROGRESS_KEY, "postings_created") is None
@@ -0,0 +1,179 @@
+"""
+crawler.pipelines.write_postings: 새 공고 / 그대로 / 바뀜 / 해시만 새로 씀(rehashed) 구분과
+close_unseen(이번 수집에서 못 본 공고 내리기)을 테스트 DB 로 확인한다.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from api.models import Company, JobPosting
+from crawler import pipelines
+from crawler.items import JobPostingItem, PostingsSeenItem
+from crawler.pipelines import close_unseen, content_hash, field_hash, write_postings
+
+URL = "https://example.co.kr/jobs/1"
+
+
+@pytest.fixture
+def company(db):
+    return Company.objects.create(name="테스트")
+
+
+def item(company, url=URL, **fields):
+    fields.setdefault("title", "백엔드 개발자")
+    return JobPostingItem(company_id=company.id, post_url=url, **fields)
+
+
+def row(url=URL):
+    return JobPosting.objects.get(post_url=url)
+
+
+def age(url=URL, **delta):
+    """저장된 공고의 crawled_at / last_seen_at 을 과거로 돌린다 (이번 저장에서 바뀌었는지 보려고)."""
+    past = timezone.now() - timedelta(**(delta or {"days": 1}))
+    JobPosting.objects.filter(post_url=url).update(crawled_at=past, last_seen_at=past)
+    return past
+
+
+def test_new_posting_is_created_with_hashes(company):
+    assert write_postings([item(company, location="서울")]) == (1, 0)
+
+    obj = row()
+    assert obj.status == "active" and obj.is_active
+    assert obj.content_hash == content_hash(item(company, location="서울"))
+    assert obj.field_hashes == {"title": field_hash("백엔드 개발자"), "location": field_hash("서울")}
+    assert obj.last_seen_at is not None
+
+
+def test_same_content_only_touches_last_seen(company):
+    write_postings([item(company, salary="협의")])
+    past = age()
+
+    # 공백만 다른 것도 그대로로 본다
+    assert write_postings([item(company, title="  백엔드   개발자 ", salary="협의")]) == (0, 0)
+
+    obj = row()
+    assert obj.crawled_at == past
+    assert obj.last_seen_at > past
+    assert obj.title == "백엔드 개발자"
+
+
+def test_changed_field_is_updated_and_counted(company):
+    write_postings([item(company, salary="협의", location="서울")])
+    past = age()
+
+    assert write_postings([item(company, salary="5000만원", location="서울")]) == (0, 1)
+
+    obj = row()
+    assert obj.salary == "5000만원"
+    assert obj.crawled_at > past
+    assert obj.field_hashes["salary"] == field_hash("5000만원")
+
+
+def test_emptied_field_is_rehashed_not_changed(company):
+    write_postings([item(company, salary="협의", location="서울")])
+    past = age()
+
+    # 값이 빠진 필드는 지우지 않고, 변경으로 세지도 않는다 (해시만 새로 씀)
+    assert write_postings([item(company, location="서울")]) == (0, 0)
+
+    obj = row()
+    assert obj.salary == "협의"
+    assert obj.crawled_at == past
+    assert obj.last_seen_at > past
+    assert obj.content_hash == content_hash(item(company, location="서울"))
+
+
+def test_legacy_row_is_rehashed_when_text_matches(company):
+    JobPosting.objects.create(company=company, post_url=URL, title="백엔드 개발자", location="서울", status="active")
+    past = age()
+
+    assert write_postings([item(company, location="서울")]) == (0, 0)
+
+    obj = row()
+    assert obj.content_hash == content_hash(item(company, location="서울"))
+    assert obj.field_hashes == {"title": field_hash("백엔드 개발자"), "location": field_hash("서울")}
+    assert obj.crawled_at == past
+
+
+def test_legacy_row_with_different_text_is_changed(company):
+    JobPosting.objects.create(company=company, post_url=URL, title="백엔드 개발자", location="부산", status="active")
+
+    assert write_postings([item(company, location="서울")]) == (0, 1)
+    assert row().location == "서울"
+
+
+def test_closed_posting_that_reappears_is_reopened(company):
+    write_postings([item(company)])
+    JobPosting.objects.filter(post_url=URL).update(is_active=False, status="closed")
+
+    assert write_postings([item(company)]) == (0, 1)
+
+    obj = row()
+    assert obj.is_active and obj.status == "active"
+
+
+def test_last_item_for_a_url_wins(company):
+    assert write_postings([item(company, salary="협의"), item(company, salary="4000만원")]) == (1, 0)
+    assert row().salary == "4000만원"
+
+
+def test_not_modified_pages_touch_last_seen(company):
+    other = "https://example.co.kr/jobs/2"
+    write_postings([item(company), item(company, url=other)])
+    age()
+    past = age(url=other)
+
+    write_postings([PostingsSeenItem(company_id=company.id, post_url=URL)])
+    assert row().last_seen_at > past
+    assert row(other).last_seen_at == past
+
+    # listing 이 304 면 그 회사의 활성 공고 전부
+    write_postings([PostingsSeenItem(company_id=company.id, post_url=None)])
+    assert row(other).last_seen_at > past
+    assert row(other).crawled_at == past
+
+
+def test_insert_conflict_is_compared_not_counted(company, monkeypatch):
+    # SELECT 와 INSERT 사이에 다른 프로세스가 같은 post_url 을 먼저 넣은 경우
+    racing = "https://example.co.kr/jobs/racing"
+    fill = pipelines._fill_legacy_hashes
+
+    def _insert_first(objs):
+        objs = list(objs)
+        if not JobPosting.objects.filter(post_url=racing).exists():
+            theirs = item(company, url=racing, salary="협의")
+            JobPosting.objects.create(
+                company=company, post_url=racing, title=theirs["title"], salary="협의", status="active",
+                content_hash=content_hash(theirs),
+                field_hashes={"title": field_hash(theirs["title"]), "salary": field_hash("협의")},
+                last_seen_at=timezone.now() - timedelta(seconds=5),
+            )
+        return fill(objs)
+
+    monkeypatch.setattr(pipelines, "_fill_legacy_hashes", _insert_first)
+
+    assert write_postings([item(company), item(company, url=racing, salary="5000만원")]) == (1, 1)
+    assert row(racing).salary == "5000만원"
+
+
+def test_close_unseen_closes_only_postings_not_seen_since_start(company):
+    other_company = Company.objects.create(name="다른 회사")
+    seen, unseen, legacy = (f"https://example.co.kr/jobs/{n}" for n in ("seen", "unseen", "legacy"))
+    write_postings([item(company, url=seen), item(company, url=unseen), item(other_company, url=URL)])
+    JobPosting.objects.create(company=company, post_url=legacy, title="예전 공고", status="active")
+    age(url=unseen)
+    age(url=URL)
+    started = timezone.now() - timedelta(minutes=1)
+
+    assert close_unseen(company.id, started) == 2
+
+    assert row(seen).is_active
+    for url in (unseen, legacy):
+        obj = row(url)
+        assert not obj.is_active and obj.status == "closed"
+        assert obj.crawled_at >= started
+    # 다른 회사 공고는 건드리지 않는다
+    assert row(URL).is_active
@@ -0,0 +1,187 @@
+"""
+recruits_revalidate.judge 의 상태 전이와 shape_fingerprint 의 구조 비교를 확인한다 (네트워크 / DB 없이).
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from django.test import override_settings
+
+from api.models import Company
+from api.recruits_revalidate import (
+    STATUS_CHANGED,
+    STATUS_CONFIRMED,
+    STATUS_ERROR,
+    STATUS_GONE,
+    STATUS_REDIRECTED,
+    STATUS_UNKNOWN,
+    judge,
+    shape_distance,
+    shape_fingerprint,
+)
+
+URL = "https://example.co.kr/careers/list"
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def listing(rows, title="채용 공고"):
+    items = "".join(
+        f'<li class="job-item item-{i}"><a class="job-link" href="/careers/{i}">{title} {i}</a>'
+        f'<span class="job-date">2026-01-{i + 1:02d}</span></li>'
+        for i in range(rows)
+    )
+    return (
+        '<html><head><title>채용</title><script>var x = "<div>";</script></head>'
+        '<body><header class="gnb"><nav class="menu"><a href="/">home</a></nav></header>'
+        f'<main class="content"><h1 class="title">{title}</h1><ul class="job-list">{items}</ul></main>'
+        '<footer class="footer"><p class="copy">(c)</p></footer></body></html>'
+    )
+
+
+def redesigned():
+    cells = "".join(
+        f'<tr class="row"><td class="col-title"><div class="wrap"><em>채용 {i}</em></div></td>'
+        f'<td class="col-date"><i class="icon"></i><b>{i}</b></td></tr>'
+        for i in range(5)
+    )
+    return (
+        '<html><body><div id="app"><section class="board"><form class="search"><input type="text">'
+        '<select class="sel"><option>전체</option></select><button class="btn">검색</button></form>'
+        f'<table class="tbl"><thead><tr><th>제목</th><th>날짜</th></tr></thead><tbody>{cells}</tbody></table>'
+        '<div class="paging"><a class="prev"></a><strong>1</strong><a class="next"></a></div>'
+        '</section></div></body></html>'
+    )
+
+
+def company(**fields):
+    fields.setdefault("recruits_url_score", 100)
+    return Company(name="테스트", recruits_url=URL, **fields)
+
+
+def ok(html, final_url=URL, headers=None):
+    return 200, final_url, html.encode(), headers or {"content-type": "text/html; charset=utf-8"}
+
+
+def test_not_modified_confirms_and_resets_score():
+    c = company(recruits_url_score=50, recruits_url_status=STATUS_ERROR)
+
+    assert judge(c, (304, URL, b"", {}), NOW) == STATUS_CONFIRMED
+    assert c.recruits_url_score == 100
+    assert c.recruits_url_checked_at == NOW
+    assert c.recruits_url_redirect is None
+
+
+def test_not_modified_after_redirect_is_redirected():
+    moved = "https://example.co.kr/recruit/"
+
+    c = company()
+    assert judge(c, (304, moved, b"", {}), NOW) == STATUS_REDIRECTED
+    assert c.recruits_url_redirect == moved
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_not_found_is_gone(status):
+    c = company(recruits_url_fingerprint="00000000000000ff")
+
+    assert judge(c, (status, URL, b"", {}), NOW) == STATUS_GONE
+    assert c.recruits_url_score == 0
+
+
+@override_settings(RECRUITS_REVALIDATE_ERROR_PENALTY=25)
+@pytest.mark.parametrize("status", [403, 429, 503, None])
+def test_errors_only_lower_the_score_until_gone(status):
+    c = company(recruits_url_score=60)
+
+    assert judge(c, (status, URL, b"", {}), NOW) == STATUS_ERROR
+    assert c.recruits_url_score == 35
+    assert judge(c, (status, URL, b"", {}), NOW) == STATUS_ERROR
+    assert c.recruits_url_score == 10
+    assert judge(c, (status, URL, b"", {}), NOW) == STATUS_GONE
+    assert c.recruits_url_score == 0
+
+
+@pytest.mark.parametrize("result", [
+    (204, URL, b"", {}),
+    (206, URL, b"<html>partial", {"content-type": "text/html"}),
+    (200, URL, b"", {"content-type": "text/html"}),
+])
+def test_responses_without_a_comparable_body_are_unknown(result):
+    c = company(
+        recruits_url_score=75,
+        recruits_url_fingerprint="00000000000000ff",
+        recruits_url_etag='"v1"',
+        recruits_url_status=STATUS_CONFIRMED,
+    )
+
+    assert judge(c, result, NOW) == STATUS_UNKNOWN
+    # 비교할 근거가 없으니 점수 / 지문 / 검증값은 그대로
+    assert c.recruits_url_score == 75
+    assert c.recruits_url_fingerprint == "00000000000000ff"
+    assert c.recruits_url_etag == '"v1"'
+
+
+def test_redirect_to_site_root_is_changed():
+    c = company(recruits_url_fingerprint=shape_fingerprint(listing(5)))
+    before = c.recruits_url_fingerprint
+
+    assert judge(c, ok(listing(5), final_url="https://example.co.kr/"), NOW) == STATUS_CHANGED
+    assert c.recruits_url_score == 0
+    assert c.recruits_url_redirect == "https://example.co.kr/"
+    # 지문은 discover 가 새 recruits_url 을 저장할 때 비운다
+    assert c.recruits_url_fingerprint == before
+
+
+def test_redirect_to_another_recruit_page_is_redirected():
+    moved = "https://recruit.example.co.kr/jobs"
+    c = company(recruits_url_fingerprint=shape_fingerprint(listing(5)))
+
+    assert judge(c, ok(listing(5), final_url=moved), NOW) == STATUS_REDIRECTED
+    assert c.recruits_url_redirect == moved
+
+
+def test_page_without_recruit_keywords_is_changed():
+    c = company()
+
+    assert judge(c, ok("<html><body><p>회사 소개</p></body></html>"), NOW) == STATUS_CHANGED
+
+
+def test_first_check_stores_fingerprint_and_validators():
+    c = company()
+    headers = {"content-type": "text/html", "etag": '"abc"', "last-modified": "Wed, 01 Jan 2026 00:00:00 GMT"}
+
+    assert judge(c, ok(listing(3), headers=headers), NOW) == STATUS_CONFIRMED
+    assert c.recruits_url_fingerprint == shape_fingerprint(listing(3))
+    assert c.recruits_url_etag == '"abc"'
+    assert c.recruits_url_last_modified == "Wed, 01 Jan 2026 00:00:00 GMT"
+    assert c.recruits_url_score == 100
+
+
+def test_fingerprint_ignores_text_rows_and_scripts():
+    base = shape_fingerprint(listing(3))
+
+    assert base == shape_fingerprint(listing(3, title="신입 개발자"))
+    # 같은 모양의 행이 늘거나 줄어도(클래스 안 숫자 포함) 같은 특징이다
+    assert base == shape_fingerprint(listing(12))
+    assert shape_fingerprint("") is None
+
+
+@override_settings(RECRUITS_REVALIDATE_SHAPE_BITS=12)
+def test_small_shape_change_keeps_page_with_lower_score():
+    c = company(recruits_url_fingerprint=shape_fingerprint(listing(5)))
+    tweaked = listing(5).replace('<footer class="footer">', '<aside class="banner"><img></aside><footer class="footer">')
+    distance = shape_distance(shape_fingerprint(tweaked), c.recruits_url_fingerprint)
+    assert 0 < distance <= 12
+
+    assert judge(c, ok(tweaked), NOW) == STATUS_CONFIRMED
+    assert c.recruits_url_score == round(100 - 50 * distance / 12)
+    assert c.recruits_url_fingerprint == shape_fingerprint(tweaked)
+
+
+@override_settings(RECRUITS_REVALIDATE_SHAPE_BITS=12)
+def test_shape_drift_is_changed():
+    c = company(recruits_url_fingerprint=shape_fingerprint(listing(5)))
+    assert shape_distance(shape_fingerprint(redesigned()), c.recruits_url_fingerprint) > 12
+
+    assert judge(c, ok(redesigned()), NOW) == STATUS_CHANGED
+    assert c.recruits_url_score == 0
+    assert c.recruits_url_fingerprint == shape_fingerprint(listing(5))
@@ -0,0 +1,116 @@
+"""
+revisit: 변화 수 세기, EWMA change_rate, 재방문 간격 clamp 를 확인한다 (테스트 DB).
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from api import revisit
+from api.models import Company, JobPosting
+
+
+@pytest.fixture(autouse=True)
+def revisit_settings():
+    with override_settings(
+        REVISIT_MIN_HOURS=4, REVISIT_MAX_HOURS=168, REVISIT_EWMA_ALPHA=0.3, CRAWL_INTERVAL_HOURS=8,
+    ):
+        yield
+
+
+@pytest.fixture
+def company(db):
+    return Company.objects.create(name="테스트")
+
+
+def posting(company, n, first_seen_at, crawled_at, is_active=True):
+    obj = JobPosting.objects.create(
+        company=company, title=f"공고 {n}", post_url=f"https://example.co.kr/jobs/{n}", status="active",
+    )
+    # auto_now / auto_now_add 는 update 로만 바꿀 수 있다
+    JobPosting.objects.filter(id=obj.id).update(
+        first_seen_at=first_seen_at, crawled_at=crawled_at, is_active=is_active,
+    )
+
+
+@pytest.mark.parametrize("rate, hours", [
+    (None, 168),
+    (0, 168),
+    (-1, 168),
+    (0.01, 168),   # 24 / 0.01 = 2400h -> 최대
+    (1, 24),
+    (2, 12),
+    (100, 4),      # 24 / 100 = 0.24h -> 최소
+])
+def test_next_interval_is_clamped(rate, hours):
+    assert revisit.next_interval_hours(rate) == hours
+
+
+def test_count_changes_counts_new_updated_and_closed(company):
+    now = timezone.now()
+    started = now - timedelta(minutes=10)
+    old = now - timedelta(days=3)
+    posting(company, 1, first_seen_at=now, crawled_at=now)                       # 신규
+    posting(company, 2, first_seen_at=old, crawled_at=now)                       # 수정
+    posting(company, 3, first_seen_at=old, crawled_at=now, is_active=False)      # 내려감
+    posting(company, 4, first_seen_at=old, crawled_at=old)                       # 그대로
+    posting(company, 5, first_seen_at=old, crawled_at=old, is_active=False)      # 예전에 내려감
+
+    assert revisit.count_changes(company.id, started) == 3
+
+
+def test_first_outcome_uses_cycle_interval(company):
+    now = timezone.now()
+    started = now - timedelta(minutes=10)
+    posting(company, 1, first_seen_at=now, crawled_at=now)
+    posting(company, 2, first_seen_at=now, crawled_at=now)
+
+    next_at = revisit.record_crawl_outcome(company.id, started, now=now)
+
+    company.refresh_from_db()
+    # 처음이면 관측 구간 = CRAWL_INTERVAL_HOURS(8h): 2건 / (1/3 일) = 6건/일 -> 4시간 뒤
+    assert company.change_rate == pytest.approx(6.0)
+    assert company.last_crawled_at == now
+    assert next_at == company.next_crawl_at == now + timedelta(hours=4)
+
+
+def test_outcome_is_smoothed_with_ewma(company):
+    now = timezone.now()
+    Company.objects.filter(id=company.id).update(change_rate=1.0, last_crawled_at=now - timedelta(days=2))
+
+    revisit.record_crawl_outcome(company.id, now - timedelta(minutes=10), now=now)
+
+    company.refresh_from_db()
+    # 변화 0건: 0.3 * 0 + 0.7 * 1.0
+    assert company.change_rate == pytest.approx(0.7)
+    assert company.next_crawl_at == now + timedelta(hours=24 / 0.7)
+
+
+def test_short_observation_window_is_clamped_to_an_hour(company):
+    now = timezone.now()
+    Company.objects.filter(id=company.id).update(last_crawled_at=now - timedelta(minutes=1))
+    posting(company, 1, first_seen_at=now, crawled_at=now)
+
+    revisit.record_crawl_outcome(company.id, now - timedelta(seconds=30), now=now)
+
+    company.refresh_from_db()
+    # 1분 만에 1건이 아니라 최소 구간 1시간에 1건 = 24건/일로 본다
+    assert company.change_rate == pytest.approx(24.0)
+    assert company.next_crawl_at == now + timedelta(hours=4)
+
+
+@override_settings(REVISIT_MAX_HOURS=72)
+def test_static_company_waits_max_hours(company):
+    now = timezone.now()
+
+    revisit.record_crawl_outcome(company.id, now - timedelta(minutes=10), now=now)
+
+    company.refresh_from_db()
+    assert company.change_rate == 0
+    assert company.next_crawl_at == now + timedelta(hours=72)
+
+
+def test_unknown_company_is_ignored(db):
+    assert revisit.record_crawl_outcome(999999, timezone.now()) is None
@@ -0,0 +1,213 @@
+"""
+hedged_search / resolve_homepages 를 로컬 http.server 로 띄운 DDG / Bing 대역에 붙여서 확인한다.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from django.test import override_settings
+
+from api import homepage_resolver, search_cache
+from api.homepage_resolver import hedged_search, resolve_homepages
+from api.search_providers import BingProvider, DuckDuckGoProvider
+
+DDG_HTML = '<a class="result__url" href="https://www.ddg-answer.co.kr/">www.ddg-answer.co.kr</a>'
+BING_HTML = '<li class="b_algo"><h2><a href="https://www.bing-answer.co.kr/">bing</a></h2></li>'
+EMPTY_HTML = "<html><body>no results</body></html>"
+DDG_ANSWER = "https://www.ddg-answer.co.kr"
+BING_ANSWER = "https://www.bing-answer.co.kr"
+
+
+class StandIn:
+    """검색엔진 대역 서버 하나. status / body / delay 를 테스트마다 바꾼다."""
+
+    def __init__(self, body):
+        self.status = 200
+        self.body = body
+        self.delay = 0.0
+        self.hits = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.hits += 1
+                time.sleep(stand_in.delay)
+                data = stand_in.body.encode()
+                try:
+                    self.send_response(stand_in.status)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    # 클라이언트가 취소하고 연결을 끊은 경우
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}/search"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MemoryRedis:
+    """search_cache 가 쓰는 만큼만 흉내 낸 Redis (mget / pipeline().set / execute)."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+        self.mget_calls = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.ttl[key] = ex
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def engines():
+    ddg, bing = StandIn(DDG_HTML), StandIn(BING_HTML)
+    with override_settings(
+        SEARCH_DUCKDUCKGO_URL=ddg.url,
+        SEARCH_BING_URL=bing.url,
+        SEARCH_THROTTLE_ENABLED=False,
+        HOMEPAGE_RESOLVE_RETRIES=1,
+        HOMEPAGE_RESOLVE_BACKOFF_SECONDS=0,
+        HOMEPAGE_RESOLVE_TIMEOUT_SECONDS=5,
+    ):
+        yield ddg, bing
+    ddg.close()
+    bing.close()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = MemoryRedis()
+    monkeypatch.setattr(search_cache, "r", fake)
+    return fake
+
+
+class RecordingDuckDuckGo(DuckDuckGoProvider):
+    """취소됐는지 기록하는 DDG provider."""
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = False
+
+    async def search(self, client, company_name, query):
+        try:
+            return await super().search(client, company_name, query)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def _hedged(providers, delay):
+    async def _run():
+        async with httpx.AsyncClient(timeout=5) as client:
+            started = time.monotonic()
+            answer = await hedged_search(client, providers, "테스트", "테스트 공식 홈페이지", delay=delay)
+            return answer, time.monotonic() - started
+
+    return asyncio.run(_run())
+
+
+def test_first_provider_answers_before_hedge(engines):
+    ddg, bing = engines
+    (source, candidates), _ = _hedged([DuckDuckGoProvider(), BingProvider()], delay=1.0)
+
+    assert source == "duckduckgo"
+    assert candidates == [DDG_ANSWER]
+    assert bing.hits == 0
+
+
+def test_fast_provider_wins_and_slow_one_is_cancelled(engines):
+    ddg, bing = engines
+    ddg.delay = 2.0
+    slow = RecordingDuckDuckGo()
+
+    (source, candidates), elapsed = _hedged([slow, BingProvider()], delay=0.1)
+
+    assert source == "bing"
+    assert candidates == [BING_ANSWER]
+    assert elapsed < 1.5
+    assert slow.cancelled
+
+
+@pytest.mark.parametrize("status", [202, 500])
+def test_falls_back_when_provider_is_throttled_or_fails(engines, status):
+    ddg, bing = engines
+    ddg.status = status
+
+    # hedge 지연이 길어도 앞 provider 가 답 없이 끝나면 바로 다음 provider 로 넘어간다
+    (source, candidates), elapsed = _hedged([DuckDuckGoProvider(), BingProvider()], delay=10)
+
+    assert source == "bing"
+    assert candidates == [BING_ANSWER]
+    assert elapsed < 5
+    assert ddg.hits == 1
+
+
+def test_falls_back_when_provider_is_unreachable(engines):
+    ddg, bing = engines
+    ddg.close()
+
+    (source, candidates), _ = _hedged([DuckDuckGoProvider(), BingProvider()], delay=10)
+
+    assert source == "bing"
+    assert candidates == [BING_ANSWER]
+
+
+def test_failed_search_is_not_an_empty_answer(engines):
+    ddg, bing = engines
+    ddg.status = 202
+    bing.body = EMPTY_HTML
+
+    # 한 엔진이라도 답을 못 받았으면 "없음" 으로 확정하지 않는다 (캐시하지 않음)
+    assert _hedged([DuckDuckGoProvider(), BingProvider()], delay=0.1)[0] == (None, None)
+
+
+@override_settings(
+    SEARCH_PROVIDERS=["cache", "duckduckgo", "bing"],
+    SEARCH_CACHE_ENABLED=True,
+    SEARCH_CACHE_EMPTY_TTL_HOURS=2,
+    HOMEPAGE_DOMAIN_GUESS=False,
+    HOMEPAGE_VERIFY=False,
+    SEARCH_HEDGE_DELAY_SECONDS=0.1,
+)
+def test_negative_result_is_cached_and_reused(engines, cache):
+    ddg, bing = engines
+    ddg.body = bing.body = EMPTY_HTML
+    companies = [(1, "없는회사"), (2, "다른없는회사")]
+
+    assert resolve_homepages(companies) == {1: (None, None), 2: (None, None)}
+
+    query = search_cache.normalize_query(homepage_resolver.homepage_query("없는회사"))
+    assert search_cache.get_many([query]) == {query: []}
+    assert set(cache.ttl.values()) == {2 * 3600}
+
+    hits = ddg.hits + bing.hits
+    cache.mget_calls = 0
+    assert resolve_homepages(companies) == {1: (None, None), 2: (None, None)}
+    # 두 번째는 캐시(negative)로 끝나고, 배치 전체를 MGET 1번으로 읽는다
+    assert ddg.hits + bing.hits == hits
+    assert cache.mget_calls == 1
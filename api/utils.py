@@ -3,7 +3,6 @@ import time
 from urllib.parse import urlparse, parse_qs, unquote
 
 import requests
-from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
@@ -72,29 +71,30 @@ def _normalize_url(raw: str | None) -> str | None:
     scheme = p.scheme if p.scheme in ("http", "https") else "https"
     return f"{scheme}://{p.netloc}"
 
+def _unwrap_uddg(href: str) -> str | None:
+    """/l/?uddg=<실제 URL> 형태면 실제 URL 을 꺼낸다."""
+    if "uddg=" not in href:
+        return None
+    try:
+        qs = urlparse(href).query
+        return unquote(parse_qs(qs).get("uddg", [""])[0]) or None
+    except Exception:
+        return None
+
 def _extract_candidates_from_html(html: str) -> list[str]:
-    """DuckDuckGo HTML에서 가능한 홈페이지 후보 URL들을 추출."""
-    soup = BeautifulSoup(html, "html.parser")
+    """
+    DuckDuckGo HTML에서 가능한 홈페이지 후보 URL들을 추출.
+    필요한 <a> 만 뽑도록 api/html_parsing 백엔드(selectolax/lxml, 없으면 bs4)를 쓴다.
+    """
+    from .html_parsing import select_links
+
+    links = select_links(html, ("a.result__url", "a.result__a"))
     candidates: list[str] = []
 
     # 1) 초록 url (`a.result__url`) 우선
-    for a in soup.select("a.result__url"):
-        txt = (a.get_text() or "").strip()
-        href = a.get("href") or ""
-        target = None
-
-        # /l/?uddg= 실제 URL 형태
-        if "uddg=" in href:
-            try:
-                qs = urlparse(href).query
-                uddg = parse_qs(qs).get("uddg", [""])[0]
-                target = unquote(uddg)
-            except Exception:
-                target = None
-
-        if not target:
-            # 텍스트가 도메인처럼 생겼으면 그것도 후보
-            target = txt or href
+    for href, txt in links["a.result__url"]:
+        # /l/?uddg= 실제 URL 형태, 아니면 텍스트가 도메인처럼 생겼으면 그것도 후보
+        target = _unwrap_uddg(href) or txt.strip() or href
 
         norm = _normalize_url(target)
         if norm:
@@ -102,21 +102,11 @@ def _extract_candidates_from_html(html: str) -> list[str]:
 
     # 2) 제목 링크 (`a.result__a`)에서도 후보 수집 (부족할 때)
     if not candidates:
-        for a in soup.select("a.result__a"):
-            href = a.get("href") or ""
+        for href, _ in links["a.result__a"]:
             if not href:
                 continue
 
-            target = href
-            if "uddg=" in href:
-                try:
-                    qs = urlparse(href).query
-                    uddg = parse_qs(qs).get("uddg", [""])[0]
-                    target = unquote(uddg)
-                except Exception:
-                    pass
-
-            norm = _normalize_url(target)
+            norm = _normalize_url(_unwrap_uddg(href) or href)
             if norm:
                 candidates.append(norm)
 
@@ -0,0 +1,85 @@
+# api/validator_store.py
+"""
+URL 별 HTTP 검증값(ETag / Last-Modified) 저장소 (Redis).
+
+job_collector 는 사이클마다 listing / 상세 페이지를 전부 다시 받는다.
+대부분은 바뀌지 않았는데도 본문을 통째로 받아서 다시 파싱/분류/저장 비교까지 한다.
+그래서 200 응답의 ETag / Last-Modified 와 본문 크기를 URL 별로 저장해 두고,
+다음 요청에 If-None-Match / If-Modified-Since 를 붙인다 (crawler.middlewares.ConditionalRequestMiddleware).
+
+- 키: crawler:validator:<sha1(url)>  값: {"etag", "last_modified", "size", "stored_at"} JSON
+- 스파이더가 회사 하나를 끝까지(finish_reason "finished") 돌고 저장 실패도 없을 때만 한꺼번에 저장한다 (put_many).
+  중간에 끊겼는데 listing 검증값이 남으면 다음 사이클이 304 로 상세 페이지를 전부 건너뛰기 때문이다.
+  끊긴 실행에서 200 으로 받은 URL 은 예전 검증값도 지운다 (delete_many).
+- CONDITIONAL_VALIDATOR_TTL_HOURS 가 지나면 지워진다.
+  304 로는 만료를 연장하지 않으므로, 최소 TTL 마다 한 번은 본문을 새로 받는다
+  (listing 이 그대로라 상세 페이지를 안 보는 동안 생긴 변화도 그때는 잡힌다).
+Redis 오류는 호출하는 쪽에서 처리한다 (redis.RedisError).
+모두 블로킹 호출이라 reactor 에서는 스레드로 넘겨서 부르고, REDIS_SOCKET_TIMEOUT_SECONDS 안에 끝나지 않으면 오류가 된다.
+"""
+
+import hashlib
+import json
+import time
+
+import redis
+from django.conf import settings
+
+KEY_PREFIX = "crawler:validator:"
+
+_timeout = float(getattr(settings, "REDIS_SOCKET_TIMEOUT_SECONDS", 1))
+r = redis.from_url(
+    getattr(settings, "REDIS_URL", "redis://redis:6379/0"),
+    socket_timeout=_timeout,
+    socket_connect_timeout=_timeout,
+)
+
+
+def _key(url):
+    return KEY_PREFIX + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _ttl():
+    return max(60, int(float(getattr(settings, "CONDITIONAL_VALIDATOR_TTL_HOURS", 168)) * 3600))
+
+
+def get(url):
+    """저장된 검증값 dict, 없으면 None."""
+    raw = r.get(_key(url))
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def put(url, etag=None, last_modified=None, size=0):
+    """200 응답의 검증값 저장. 둘 다 없으면 예전 값을 지운다 (다음에는 조건 없이 받는다)."""
+    put_many({url: {"etag": etag, "last_modified": last_modified, "size": size}})
+
+
+def put_many(entries):
+    """entries: {url: {"etag", "last_modified", "size"}} 를 파이프라인 1번으로 저장."""
+    if not entries:
+        return
+    now = time.time()
+    pipe = r.pipeline()
+    for url, v in entries.items():
+        if not v.get("etag") and not v.get("last_modified"):
+            pipe.delete(_key(url))
+            continue
+        payload = {
+            "etag": v.get("etag"),
+            "last_modified": v.get("last_modified"),
+            "size": int(v.get("size") or 0),
+            "stored_at": now,
+        }
+        pipe.set(_key(url), json.dumps(payload), ex=_ttl())
+    pipe.execute()
+
+
+def delete_many(urls):
+    urls = list(urls)
+    if urls:
+        r.delete(*(_key(url) for url in urls))
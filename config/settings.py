@@ -102,8 +102,140 @@ CORS_ALLOW_ALL_ORIGINS = True
 API_INTERNAL_TOKEN = os.getenv("API_INTERNAL_TOKEN", "internal_token_8h_7Kifc0r")
 CRAWL_INTERVAL_HOURS = int(os.getenv("CRAWL_INTERVAL_HOURS", "8"))
 
+# === 크롤 러너 (api/crawl_runner.py) ===
+# subprocess: 회사마다 scrapy 프로세스 1개 / batch: 여러 회사를 scrapy 프로세스 1개에서 동시 실행
+CRAWL_RUNNER_MODE = os.getenv("CRAWL_RUNNER_MODE", "subprocess")
+CRAWL_BATCH_SIZE = int(os.getenv("CRAWL_BATCH_SIZE", "200"))
+CRAWL_COMPANIES_IN_FLIGHT = int(os.getenv("CRAWL_COMPANIES_IN_FLIGHT", "8"))
+# discover_careers 를 회사 N 개씩 스파이더 하나로 (multi-tenant, 0 = 끔 -> 위 러너 모드대로)
+DISCOVER_MULTI_TENANT_BATCH = int(os.getenv("DISCOVER_MULTI_TENANT_BATCH", "0"))
+# multi-tenant 스파이더의 전체 동시 요청 수 / 호스트당 동시 요청 수
+DISCOVER_MULTI_CONCURRENCY = int(os.getenv("DISCOVER_MULTI_CONCURRENCY", "64"))
+DISCOVER_MULTI_PER_DOMAIN = int(os.getenv("DISCOVER_MULTI_PER_DOMAIN", "2"))
+
+# 크롤 사이클 락(crawler:lock) 만료 시간. 진행 상황이 기록될 때마다 연장된다(heartbeat).
+CRAWL_LOCK_TTL_SECONDS = int(os.getenv("CRAWL_LOCK_TTL_SECONDS", "1800"))
+# 락이 만료됐어도 마지막 heartbeat 가 이 시간 안이면 예전 실행이 아직 도는 것으로 보고 이어받지 않는다.
+CRAWL_CYCLE_STALE_SECONDS = int(os.getenv("CRAWL_CYCLE_STALE_SECONDS", "3600"))
+# 중단된 사이클의 체크포인트(단계별 완료 회사 목록)를 얼마나 유지할지. 지나면 새 사이클로 시작.
+CRAWL_CHECKPOINT_TTL_HOURS = float(os.getenv("CRAWL_CHECKPOINT_TTL_HOURS", "48"))
+
+# === 적응형 재방문 (api/revisit.py) ===
+# 회사별 공고 변화율로 next_crawl_at 을 정하고, 수집 단계는 재방문 시점이 된 회사만 돈다.
+REVISIT_ADAPTIVE = os.getenv("REVISIT_ADAPTIVE", "1") == "1"
+REVISIT_MIN_HOURS = float(os.getenv("REVISIT_MIN_HOURS", "4"))
+REVISIT_MAX_HOURS = float(os.getenv("REVISIT_MAX_HOURS", "168"))
+REVISIT_EWMA_ALPHA = float(os.getenv("REVISIT_EWMA_ALPHA", "0.3"))
+
+# === 저장된 recruits_url 재확인 (api/recruits_revalidate.py) ===
+# 조건부 GET 1개로 채용 페이지가 그대로인지 보고, 없어졌거나(GONE) 구조가 바뀐(CHANGED) 회사만 discover 로 보낸다
+RECRUITS_REVALIDATE = os.getenv("RECRUITS_REVALIDATE", "1") == "1"
+# 마지막 확인 후 이 시간이 지난 회사만 다시 확인
+RECRUITS_REVALIDATE_HOURS = float(os.getenv("RECRUITS_REVALIDATE_HOURS", "24"))
+RECRUITS_REVALIDATE_BATCH_SIZE = int(os.getenv("RECRUITS_REVALIDATE_BATCH_SIZE", "200"))
+RECRUITS_REVALIDATE_CONCURRENCY = int(os.getenv("RECRUITS_REVALIDATE_CONCURRENCY", "32"))
+RECRUITS_REVALIDATE_TIMEOUT_SECONDS = float(os.getenv("RECRUITS_REVALIDATE_TIMEOUT_SECONDS", "10"))
+RECRUITS_REVALIDATE_MAX_BYTES = int(os.getenv("RECRUITS_REVALIDATE_MAX_BYTES", str(512 * 1024)))
+# 구조 지문(64bit simhash)이 이 비트 수보다 많이 다르면 CHANGED
+RECRUITS_REVALIDATE_SHAPE_BITS = int(os.getenv("RECRUITS_REVALIDATE_SHAPE_BITS", "12"))
+# 일시적 오류 1번에 깎는 점수 (0 이 되면 GONE)
+RECRUITS_REVALIDATE_ERROR_PENALTY = int(os.getenv("RECRUITS_REVALIDATE_ERROR_PENALTY", "25"))
+# GONE 으로 남은 회사(discover 가 새 페이지를 못 찾음)를 다시 확인하기까지 기다리는 시간
+RECRUITS_REVALIDATE_GONE_BACKOFF_HOURS = float(os.getenv("RECRUITS_REVALIDATE_GONE_BACKOFF_HOURS", "168"))
+
+# === 홈페이지 검색 (api/homepage_resolver.py) ===
+# 배치 1개 = 비동기로 동시에 검색하는 회사 묶음 (배치마다 bulk_update 1번)
+HOMEPAGE_RESOLVE_BATCH_SIZE = int(os.getenv("HOMEPAGE_RESOLVE_BATCH_SIZE", "50"))
+# 동시 검색 수 (너무 높이면 검색엔진이 202 로 막는다)
+HOMEPAGE_RESOLVE_CONCURRENCY = int(os.getenv("HOMEPAGE_RESOLVE_CONCURRENCY", "4"))
+HOMEPAGE_RESOLVE_RETRIES = int(os.getenv("HOMEPAGE_RESOLVE_RETRIES", "3"))
+HOMEPAGE_RESOLVE_BACKOFF_SECONDS = float(os.getenv("HOMEPAGE_RESOLVE_BACKOFF_SECONDS", "3"))
+HOMEPAGE_RESOLVE_TIMEOUT_SECONDS = float(os.getenv("HOMEPAGE_RESOLVE_TIMEOUT_SECONDS", "10"))
+
+# 검색 전에 회사 이름으로 도메인을 추측해서 확인 (api/domain_guess.py)
+HOMEPAGE_DOMAIN_GUESS = os.getenv("HOMEPAGE_DOMAIN_GUESS", "1") == "1"
+HOMEPAGE_GUESS_TLDS = os.getenv("HOMEPAGE_GUESS_TLDS", "co.kr,com,kr").split(",")
+HOMEPAGE_GUESS_MAX_LABELS = int(os.getenv("HOMEPAGE_GUESS_MAX_LABELS", "4"))
+HOMEPAGE_GUESS_CONCURRENCY = int(os.getenv("HOMEPAGE_GUESS_CONCURRENCY", "32"))
+HOMEPAGE_GUESS_TIMEOUT_SECONDS = float(os.getenv("HOMEPAGE_GUESS_TIMEOUT_SECONDS", "5"))
+
+# 홈페이지 검색 백엔드 (api/search_providers.py): 앞에서부터, 느리면 SEARCH_HEDGE_DELAY_SECONDS 뒤에 다음 것도 같이 호출
+SEARCH_PROVIDERS = os.getenv("SEARCH_PROVIDERS", "cache,registry,duckduckgo,bing").split(",")
+SEARCH_HEDGE_DELAY_SECONDS = float(os.getenv("SEARCH_HEDGE_DELAY_SECONDS", "2"))
+# registry provider 가 읽는 회사 목록 CSV (company_name, homepage_url 컬럼, 콤마로 여러 개)
+COMPANY_REGISTRY_CSV = [p for p in os.getenv("COMPANY_REGISTRY_CSV", "").split(",") if p]
+# 검색엔진 주소 (로컬 대체 서버로 돌릴 때만 바꾼다)
+SEARCH_DUCKDUCKGO_URL = os.getenv("SEARCH_DUCKDUCKGO_URL", "https://html.duckduckgo.com/html/")
+SEARCH_BING_URL = os.getenv("SEARCH_BING_URL", "https://www.bing.com/search")
+# 검색 결과 HTML 파서 (api/html_parsing.py): auto(selectolax -> lxml -> bs4) | selectolax | lxml | bs4
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto")
+
+# 검색 요청 속도 AIMD 스로틀 (api/search_throttle.py): 202 가 늘면 줄이고, 회복되면 조금씩 올린다 (초당 요청 수)
+SEARCH_THROTTLE_ENABLED = os.getenv("SEARCH_THROTTLE_ENABLED", "1") == "1"
+SEARCH_RATE_INITIAL = float(os.getenv("SEARCH_RATE_INITIAL", "0.5"))
+SEARCH_RATE_MIN = float(os.getenv("SEARCH_RATE_MIN", "0.05"))
+SEARCH_RATE_MAX = float(os.getenv("SEARCH_RATE_MAX", "5"))
+SEARCH_THROTTLE_WINDOW_SECONDS = float(os.getenv("SEARCH_THROTTLE_WINDOW_SECONDS", "60"))
+
+# 찾은 홈페이지 후보 검증 (api/homepage_verify.py): 상위 N 개를 열어보고 점수가 기준 미만이면 저장하지 않는다
+HOMEPAGE_VERIFY = os.getenv("HOMEPAGE_VERIFY", "1") == "1"
+HOMEPAGE_VERIFY_TOP_N = int(os.getenv("HOMEPAGE_VERIFY_TOP_N", "3"))
+HOMEPAGE_VERIFY_MIN_CONFIDENCE = float(os.getenv("HOMEPAGE_VERIFY_MIN_CONFIDENCE", "0.3"))
+HOMEPAGE_VERIFY_CONCURRENCY = int(os.getenv("HOMEPAGE_VERIFY_CONCURRENCY", "16"))
+
+# 검색 결과 캐시 (api/search_cache.py): 후보가 있던 검색 / 빈 결과(negative) 를 따로 만료
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "1") == "1"
+SEARCH_CACHE_TTL_HOURS = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "168"))
+SEARCH_CACHE_EMPTY_TTL_HOURS = float(os.getenv("SEARCH_CACHE_EMPTY_TTL_HOURS", "24"))
+
+# === 회사당 크롤 예산 (crawler/settings.py 에서 사용, 0 = 제한 없음) ===
+CRAWL_BUDGET_SECONDS = int(os.getenv("CRAWL_BUDGET_SECONDS", "600"))
+CRAWL_BUDGET_PAGES = int(os.getenv("CRAWL_BUDGET_PAGES", "300"))
+CRAWL_BUDGET_BYTES = int(os.getenv("CRAWL_BUDGET_BYTES", str(50 * 1024 * 1024)))
+# 공고 item 수 (저장 결과와 상관없이 스파이더가 내놓은 공고마다 센다)
+CRAWL_BUDGET_ITEMS = int(os.getenv("CRAWL_BUDGET_ITEMS", "500"))
+# job_collector 공고를 몇 개씩 모아서 저장할지 (crawler/crawler/pipelines.py, 배치마다 쿼리 3번)
+JOB_PIPELINE_BATCH_SIZE = int(os.getenv("JOB_PIPELINE_BATCH_SIZE", "100"))
+# job_collector listing/상세 페이지 조건부 요청 (api/validator_store.py + crawler ConditionalRequestMiddleware)
+# 304 면 파싱/저장을 건너뛴다. 검증값은 TTL 이 지나면 지워져서 그때는 본문을 새로 받는다
+CONDITIONAL_REQUESTS_ENABLED = os.getenv("CONDITIONAL_REQUESTS_ENABLED", "1") == "1"
+CONDITIONAL_VALIDATOR_TTL_HOURS = float(os.getenv("CONDITIONAL_VALIDATOR_TTL_HOURS", "168"))
+# discover_careers 는 채용 페이지 하나만 찾으면 되므로 페이지 상한을 따로 (더 작게) 둔다
+DISCOVER_MAX_PAGES = int(os.getenv("DISCOVER_MAX_PAGES", "40"))
+# discover_careers 가 링크 탐색 전에 먼저 보는 빠른 경로: robots.txt/sitemap.xml + 잘 알려진 채용 경로
+DISCOVER_PROBE_ENABLED = os.getenv("DISCOVER_PROBE_ENABLED", "1") == "1"
+DISCOVER_PROBE_PATHS = [p.strip() for p in os.getenv(
+    "DISCOVER_PROBE_PATHS",
+    "/careers,/career,/recruit,/recruitment,/jobs,/company/recruit,/kr/career,/about/careers,/recruit/list,/join",
+).split(",") if p.strip()]
+# sitemap 에서 채용스러운 URL 을 최대 몇 개까지 확인할지
+DISCOVER_SITEMAP_MAX_URLS = int(os.getenv("DISCOVER_SITEMAP_MAX_URLS", "3"))
+# onclick / javascript: / <script> 메뉴 JSON 안의 링크도 후보로 볼지 (crawler/crawler/script_links.py)
+CRAWL_SCRIPT_LINKS = os.getenv("CRAWL_SCRIPT_LINKS", "1") == "1"
+# 스파이더가 예산 종료에도 안 끝나면(행 걸림 등) 러너가 프로세스를 죽이기까지 추가로 기다리는 시간
+CRAWL_WATCHDOG_GRACE_SECONDS = int(os.getenv("CRAWL_WATCHDOG_GRACE_SECONDS", "120"))
+
+# === 전체 사이클 실행 방식 (api.tasks.run_full_crawling_cycle) ===
+# chain: 단계별 태스크 1개 / sharded: 단계마다 회사를 샤드로 나눠 워커들에 분산
+# streaming: 회사 단위로 homepage -> (revalidate) -> discover -> collect 를 바로바로 이어서 큐잉
+CRAWL_CYCLE_MODE = os.getenv("CRAWL_CYCLE_MODE", "chain")
+# 단계별 최대 샤드 수 = 그 단계에서 동시에 도는 태스크 수 상한
+# (homepages 는 검색엔진 차단(202) 때문에 낮게 잡는다)
+CRAWL_STAGE_MAX_SHARDS = {
+    "homepages": int(os.getenv("CRAWL_SHARDS_HOMEPAGES", "2")),
+    "revalidate": int(os.getenv("CRAWL_SHARDS_REVALIDATE", "1")),
+    "discover": int(os.getenv("CRAWL_SHARDS_DISCOVER", "4")),
+    "collect": int(os.getenv("CRAWL_SHARDS_COLLECT", "4")),
+}
+CRAWL_SHARD_MIN_SIZE = int(os.getenv("CRAWL_SHARD_MIN_SIZE", "20"))
+# streaming 모드에서 backlog 를 몇 개 회사씩 잘라 태스크로 뿌릴지
+CRAWL_STREAM_CHUNK_SIZE = int(os.getenv("CRAWL_STREAM_CHUNK_SIZE", "20"))
+
 # === Celery / Redis (추가) ===
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+# 크롤러 / 검색이 부르는 Redis(rate limit / 검증값 / 진행 카운터 / 검색 throttle) 연결·응답 제한 시간 (초)
+# Redis 가 멈춰도 이 시간 안에 오류로 끝나고 fail-open 으로 넘어간다 (스파이더가 Redis 때문에 멈추지 않게)
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "1"))
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_TASK_DEFAULT_QUEUE = "celery"
@@ -0,0 +1,39 @@
+"""
+pytest 공통 설정: Django 설정을 불러온다 (DB 는 로컬 SQLite, Redis 는 테스트마다 필요한 것만 바꿔 끼운다).
+DB 가 필요한 테스트는 db fixture 를 쓴다: 테스트용 SQLite(메모리)에 migrate 하고, 테스트마다 롤백한다.
+
+    python -m pytest
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import django
+import pytest
+from django.db import transaction
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("DJANGO_USE_SQLITE", "1")
+
+django.setup()
+
+# Scrapy 프로젝트(crawler/crawler)의 모듈도 스파이더 프로세스에서처럼 crawler.* 로 불러온다
+sys.path.insert(0, str(Path(__file__).resolve().parent / "crawler"))
+
+
+@pytest.fixture(scope="session")
+def django_db_setup():
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    yield
+    teardown_databases(old_config, verbosity=0)
+    teardown_test_environment()
+
+
+@pytest.fixture
+def db(django_db_setup):
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
@@ -0,0 +1,103 @@
+"""
+scrapy bench_keywords [페이지.html ...] [--repeat N]
+
+앵커 텍스트 키워드 검사의 앵커 1개당 비용을 잰다.
+  - loops   : 예전 방식 `any(kw.lower() in text for kw in KEYWORDS)` (키워드마다 한 번씩 훑기)
+  - matcher : crawler.keyword_matcher.KeywordMatcher (컴파일해 둔 것으로 한 번 훑기)
+discover_careers(PRIORITY_KEYWORDS 전부 찾기)와 job_collector(제외 -> 채용 키워드) 두 가지를 잰다.
+저장한 페이지를 주면 그 페이지들의 <a> 로, 없으면 메뉴 링크 위주의 가짜 앵커로 잰다.
+두 방식의 결과가 다르면 같이 알려준다.
+"""
+
+import time
+from pathlib import Path
+
+from parsel import Selector
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+SYNTHETIC_TEXTS = [
+    "회사소개", "ceo 인사말", "오시는 길", "제품 소개", "고객센터", "공지사항",
+    "채용공고 확인하기", "인재채용", "careers", "join us", "채용 절차 안내", "faq",
+    "신입 / 경력 개발자 모집", "개인정보처리방침", "news & press", "ir 정보",
+]
+
+
+def _anchor_texts(paths):
+    texts = []
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        for f in files:
+            if not f.exists():
+                raise UsageError(f"no such file: {raw}")
+            sel = Selector(text=f.read_text(encoding="utf-8", errors="replace"))
+            for a in sel.css("a"):
+                text = " ".join(a.css("::text").getall()).strip()
+                label = " ".join(filter(None, [a.attrib.get("title"), a.attrib.get("aria-label")]))
+                texts.append(f"{text} {label}".strip().lower())
+    return texts
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self):
+        return "[options] [page.html | dir ...]"
+
+    def short_desc(self):
+        return "Benchmark per-anchor keyword matching (loops vs compiled matcher)"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument(
+            "--repeat",
+            dest="repeat",
+            type=int,
+            default=200,
+            help="passes over all anchors (default: 200)",
+        )
+
+    def run(self, args, opts):
+        from crawler.spiders import discover_careers as dc
+        from crawler.spiders import job_collector as jc
+
+        texts = _anchor_texts(args) if args else SYNTHETIC_TEXTS * 25
+        if not texts:
+            raise UsageError("no <a> found in the given pages")
+        repeat = max(1, int(opts.repeat or 1))
+
+        def discover_loops(t):
+            return tuple(kw.lower() for kw in dc.PRIORITY_KEYWORDS if kw.lower() in t)
+
+        def discover_matcher(t):
+            return dc.PRIORITY_MATCHER.matched(t)
+
+        def collector_loops(t):
+            if any(bad in t for bad in jc.EXCLUDE_ANCHOR_SUBSTRINGS):
+                return False
+            return any(kw in t for kw in jc.JOB_ANCHOR_KEYWORDS)
+
+        def collector_matcher(t):
+            if jc.EXCLUDE_ANCHOR_MATCHER.search(t):
+                return False
+            return jc.JOB_ANCHOR_MATCHER.search(t)
+
+        print(f"{len(texts)} anchors, repeat={repeat}")
+        for label, loops, matcher in (
+            ("discover_careers", discover_loops, discover_matcher),
+            ("job_collector", collector_loops, collector_matcher),
+        ):
+            for name, fn in (("loops", loops), ("matcher", matcher)):
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    for t in texts:
+                        fn(t)
+                per_anchor = (time.perf_counter() - started) / (repeat * len(texts)) * 1e9
+                print(f"  {label:<17} {name:<8} {per_anchor:8.0f} ns/anchor")
+
+            diff = [t for t in texts if loops(t) != matcher(t)]
+            if diff:
+                print(f"  {label}: {len(diff)} anchors differ, e.g. {diff[0]!r}")
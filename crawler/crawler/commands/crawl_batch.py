@@ -0,0 +1,116 @@
+"""
+scrapy crawl_batch <spider> --targets <json 파일> [--concurrency N]
+
+회사 여러 개를 하나의 CrawlerProcess(= 하나의 Twisted reactor) 안에서 돌린다.
+`scrapy crawl` 을 회사마다 따로 띄우면 매번 인터프리터 기동 + django.setup()
++ llm_parser import + reactor 생성 비용이 드는데, 이 커맨드는 그 비용을 배치당 1번만 낸다.
+
+- targets 파일: 스파이더 인자(dict)의 JSON 배열. 각 dict 에 company_id 는 필수.
+- concurrency: 동시에 돌릴 회사(스파이더) 수.
+- 회사별 결과는 stdout 에 `CRAWL_RESULT {json}` 한 줄씩 출력한다.
+  (Scrapy 로그는 stderr 로 나가므로 stdout 은 결과 전용)
+"""
+
+import json
+import sys
+
+from twisted.internet import defer
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.utils.reactor import install_reactor
+
+RESULT_PREFIX = "CRAWL_RESULT "
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+
+    def syntax(self):
+        return "[options] <spider>"
+
+    def short_desc(self):
+        return "Run one spider for many companies inside a single process"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument(
+            "--targets",
+            dest="targets",
+            required=True,
+            help="JSON file with a list of spider kwargs (one dict per company)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            dest="concurrency",
+            type=int,
+            default=8,
+            help="number of companies crawled at the same time (default: 8)",
+        )
+
+    def run(self, args, opts):
+        if len(args) != 1:
+            raise UsageError("exactly one spider name is required")
+
+        spname = args[0]
+        with open(opts.targets, encoding="utf-8") as f:
+            targets = json.load(f)
+
+        if not isinstance(targets, list):
+            raise UsageError("--targets must contain a JSON list")
+
+        process = self.crawler_process
+        spidercls = process.spider_loader.load(spname)
+        sem = defer.DeferredSemaphore(max(1, int(opts.concurrency or 1)))
+
+        failed = []
+
+        def _report(result):
+            if result["exit"] != 0:
+                failed.append(result["company_id"])
+            sys.stdout.write(RESULT_PREFIX + json.dumps(result, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+        def _crawl_one(kwargs):
+            crawler = process.create_crawler(spidercls)
+            d = process.crawl(crawler, **kwargs)
+
+            def _ok(_):
+                stats = crawler.stats.get_stats() if crawler.stats else {}
+                _report({
+                    "company_id": kwargs.get("company_id"),
+                    "exit": 0,
+                    "reason": stats.get("finish_reason"),
+                })
+
+            def _err(failure):
+                _report({
+                    "company_id": kwargs.get("company_id"),
+                    "exit": 1,
+                    "reason": "error",
+                    "error": repr(failure.value)[:1000],
+                })
+
+            d.addCallbacks(_ok, _err)
+            return d
+
+        if not targets:
+            return
+
+        # 첫 crawler 가 만들어지기 전에 reactor 를 import 하면 기본 reactor 가 깔려버리므로
+        # 설정(TWISTED_REACTOR)에 맞는 reactor 를 먼저 설치해 둔다.
+        reactor_class = process.settings["TWISTED_REACTOR"]
+        if reactor_class:
+            install_reactor(reactor_class, process.settings["ASYNCIO_EVENT_LOOP"])
+        from twisted.internet import reactor
+
+        def _launch():
+            jobs = [sem.run(_crawl_one, dict(t)) for t in targets]
+            defer.DeferredList(jobs, consumeErrors=True).addBoth(lambda _: reactor.stop())
+
+        # crawl 이 semaphore 로 늦게 시작되므로 stop_after_crawl 에 맡기지 않고 직접 멈춘다.
+        reactor.callWhenRunning(_launch)
+        process.start(stop_after_crawl=False)
+
+        if failed:
+            self.exitcode = 1
@@ -0,0 +1,109 @@
+import logging
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from twisted.internet.threads import deferToThread
+
+from api import crawl_status
+from crawler.items import JobPostingItem
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlProgressExtension:
+    """
+    스파이더가 끝날 때 Scrapy stats 를 크롤 사이클 진행 카운터(api.crawl_status)에 더한다.
+    - pages_fetched    : 받은 응답 수
+    - postings_created : job_collector 가 새로 만든 JobPosting 수
+    - postings_updated : job_collector 가 갱신한 JobPosting 수
+    - pages_not_modified / bytes_saved : 조건부 요청이 304 로 끝난 페이지 수 / 그만큼 안 받은 본문 바이트
+    subprocess / batch 러너 어느 쪽이든 같은 방식으로 집계된다.
+    Redis 호출은 reactor 스레드를 막지 않도록 스레드 풀에서 돈다.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        ext = cls(crawler.stats)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_closed(self, spider, reason):
+        stats = self.stats.get_stats()
+        # 왜 끝났는지 (finished / closespider_timeout / budget_bytes ...) 별 회사 수
+        # 여러 회사를 도는 스파이더는 회사별 사유(company_close_reasons)를 센다
+        closed = {}
+        for company_reason in (getattr(spider, "company_close_reasons", None) or {}).values():
+            closed[f"closed.{company_reason}"] = closed.get(f"closed.{company_reason}", 0) + 1
+        if not closed:
+            closed[f"closed.{reason}"] = 1
+        d = deferToThread(crawl_status.add_counters, **{
+            "pages_fetched": stats.get("response_received_count", 0),
+            "postings_created": stats.get("job_collector/postings_created", 0),
+            "postings_updated": stats.get("job_collector/postings_updated", 0),
+            "pages_not_modified": stats.get("conditional/not_modified", 0),
+            "bytes_saved": stats.get("conditional/bytes_saved", 0),
+            **closed,
+        })
+        d.addErrback(lambda failure: logger.warning(
+            "crawl progress: failed to publish stats (%s)", failure.getErrorMessage(),
+        ))
+        return d
+
+
+class CrawlBudgetExtension:
+    """
+    회사(스파이더) 하나당 예산. 넘으면 스파이더를 정상 종료(close_spider)시킨다.
+    이미 저장한 결과는 그대로 남고, 종료 사유(finish_reason)에 어떤 예산인지 남는다.
+
+    - 시간/페이지 수는 Scrapy 기본 CloseSpider 확장(CLOSESPIDER_TIMEOUT / CLOSESPIDER_PAGECOUNT)이 담당
+    - 여기서는 그 외:
+        CRAWL_BUDGET_BYTES : 받은 응답 바이트 합계   -> reason "budget_bytes"
+        CRAWL_BUDGET_ITEMS : 스파이더가 내놓은 공고 item 수 -> reason "budget_items"
+          파이프라인의 저장 결과(생성+갱신)가 아니라 item 이 나올 때마다 센다.
+          그대로인 공고도 세야 변화 없는 큰 listing 에서도 예산이 걸린다 (304 로 건너뛴 페이지는 세지 않는다).
+    """
+
+    def __init__(self, crawler, max_bytes, max_items):
+        self.crawler = crawler
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.bytes = 0
+        self.items = 0
+        self.closing = False
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        max_bytes = crawler.settings.getint("CRAWL_BUDGET_BYTES")
+        max_items = crawler.settings.getint("CRAWL_BUDGET_ITEMS")
+        if not max_bytes and not max_items:
+            raise NotConfigured
+        ext = cls(crawler, max_bytes, max_items)
+        crawler.signals.connect(ext.response_received, signal=signals.response_received)
+        if max_items:
+            crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        return ext
+
+    def _close(self, spider, reason, value, limit):
+        if self.closing:
+            return
+        self.closing = True
+        logger.warning(
+            "crawl budget: close spider=%s company_id=%s reason=%s (%s >= %s)",
+            spider.name, getattr(spider, "company_id", None), reason, value, limit,
+        )
+        self.crawler.engine.close_spider(spider, reason)
+
+    def response_received(self, response, request, spider):
+        self.bytes += len(response.body or b"")
+        if self.max_bytes and self.bytes >= self.max_bytes:
+            self._close(spider, "budget_bytes", self.bytes, self.max_bytes)
+
+    def item_scraped(self, item, response, spider):
+        if not isinstance(item, JobPostingItem):
+            return
+        self.items += 1
+        if self.items >= self.max_items:
+            self._close(spider, "budget_items", self.items, self.max_items)
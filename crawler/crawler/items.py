@@ -0,0 +1,64 @@
+"""
+스파이더가 yield 하는 item 들.
+
+JobPostingItem: job_collector 가 만든 공고 1개. DB 저장은 crawler.pipelines.JobPostingBulkPipeline 이 모아서 한다.
+  - company_id, post_url, title 은 항상 있음
+  - 나머지 텍스트 필드는 값이 있을 때만 (앞뒤 공백 제거 + JOB_FIELD_LIMITS 길이로 자른 값)
+PostingsSeenItem: 페이지가 304(그대로)라 파싱하지 않은 공고들. 파이프라인이 last_seen_at 만 갱신한다.
+  - post_url 이 있으면 그 공고, None 이면 그 회사의 활성 공고 전부 (listing / one_page 가 그대로인 경우)
+"""
+
+import scrapy
+
+# 텍스트 필드 -> 최대 길이 (JobPosting 컬럼 길이 / 너무 긴 본문 자르기)
+JOB_FIELD_LIMITS = {
+    "job_description": 20000,
+    "qualifications": 10000,
+    "preferred_qualifications": 10000,
+    "hiring_process": 5000,
+    "benefits": 5000,
+    "hiring_message": 5000,
+    "location": 255,
+    "employment_type": 50,
+    "salary": 255,
+    "work_hours": 100,
+}
+TITLE_MAX_LENGTH = 255
+
+
+class JobPostingItem(scrapy.Item):
+    company_id = scrapy.Field()
+    post_url = scrapy.Field()
+    title = scrapy.Field()
+    job_description = scrapy.Field()
+    qualifications = scrapy.Field()
+    preferred_qualifications = scrapy.Field()
+    hiring_process = scrapy.Field()
+    benefits = scrapy.Field()
+    hiring_message = scrapy.Field()
+    location = scrapy.Field()
+    employment_type = scrapy.Field()
+    salary = scrapy.Field()
+    work_hours = scrapy.Field()
+
+    @classmethod
+    def from_data(cls, company_id, data):
+        """파싱 결과 dict -> item (post_url 이 없으면 None)."""
+        post_url = data.get("post_url")
+        if not post_url:
+            return None
+        item = cls(
+            company_id=company_id,
+            post_url=post_url,
+            title=(data.get("title") or "").strip()[:TITLE_MAX_LENGTH],
+        )
+        for field, max_len in JOB_FIELD_LIMITS.items():
+            value = str(data.get(field) or "").strip()
+            if value:
+                item[field] = value[:max_len]
+        return item
+
+
+class PostingsSeenItem(scrapy.Item):
+    company_id = scrapy.Field()
+    post_url = scrapy.Field()
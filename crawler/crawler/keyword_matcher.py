@@ -0,0 +1,103 @@
+"""
+키워드 리스트를 한 번만 컴파일해서, 텍스트 1번 훑기로 걸린 키워드를 전부(위치 포함) 찾는다.
+
+스파이더들이 `any(kw.lower() in text for kw in KEYWORDS)` 처럼
+키워드마다 텍스트를 다시 훑고, 호출할 때마다 키워드를 다시 소문자로 바꾸던 것을 대신한다.
+
+- 키워드는 만들 때 한 번 소문자로 바꾼다. 넘기는 텍스트는 호출하는 쪽에서 소문자로 바꿔서 넘긴다.
+- 키워드들을 trie 로 묶은 정규식 한 개(예: 채용(?:공고|안내)?|career(?:s)?)로
+  키워드가 시작하는 위치만 C 엔진으로 찾고,
+  그 위치에서 시작하는 키워드(첫 글자로 묶어둔 것)를 startswith 로 확인한다.
+  겹치는 키워드("채용" 과 "채용공고", "job" 과 "jobs")도 전부 잡는다 (Aho-Corasick 과 같은 결과).
+
+    m = KeywordMatcher(["채용", "채용공고", "career"])
+    m.search("채용공고 보기")        -> True
+    m.find_all("채용공고 보기")      -> [(0, "채용"), (0, "채용공고")]
+    m.matched("career 채용")        -> ("채용", "career")   # 키워드 리스트 순서, 중복 없음
+
+벤치마크: scrapy bench_keywords [저장한 페이지.html ...]
+"""
+
+import re
+
+
+def _trie_pattern(words):
+    """키워드들을 공통 접두어로 묶은 정규식 (키워드마다 처음부터 다시 비교하지 않게)."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    __slots__ = ("keywords", "_order", "_by_first", "_starts", "_any")
+
+    def __init__(self, keywords):
+        seen = []
+        for kw in keywords:
+            kw = (kw or "").lower()
+            if kw and kw not in seen:
+                seen.append(kw)
+        self.keywords = tuple(seen)
+        self._order = {kw: i for i, kw in enumerate(self.keywords)}
+
+        # 같은 위치에서 긴 키워드가 먼저 나오도록
+        by_length = sorted(self.keywords, key=len, reverse=True)
+        self._by_first = {}
+        for kw in by_length:
+            self._by_first.setdefault(kw[0], []).append(kw)
+
+        pattern = _trie_pattern(self.keywords)
+        if pattern:
+            self._any = re.compile(pattern)
+            self._starts = re.compile(f"(?=(?:{pattern}))")
+        else:
+            self._any = self._starts = None
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def search(self, text):
+        """키워드가 하나라도 있으면 True."""
+        return bool(text) and self._any is not None and self._any.search(text) is not None
+
+    def find_all(self, text):
+        """걸린 키워드 전부 [(위치, 키워드), ...] (위치 순, 겹치는 것도 포함)."""
+        if not text or self._any is None:
+            return []
+        # 대부분의 앵커는 아무 키워드도 없으니, 첫 위치를 먼저 찾고 없으면 바로 끝낸다
+        first = self._any.search(text)
+        if first is None:
+            return []
+        hits = []
+        for m in self._starts.finditer(text, first.start()):
+            pos = m.start()
+            for kw in self._by_first[text[pos]]:
+                if text.startswith(kw, pos):
+                    hits.append((pos, kw))
+        return hits
+
+    def matched(self, text):
+        """걸린 키워드들 (키워드 리스트 순서, 중복 없이)."""
+        hits = self.find_all(text)
+        if not hits:
+            return ()
+        found = {kw for _, kw in hits}
+        return tuple(sorted(found, key=self._order.__getitem__))
+
+    def count(self, text):
+        """걸린 서로 다른 키워드 개수."""
+        return len({kw for _, kw in self.find_all(text)})
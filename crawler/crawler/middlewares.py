@@ -0,0 +1,238 @@
+import logging
+import time
+
+from twisted.internet import defer
+from twisted.internet.threads import deferToThread
+
+from scrapy import signals
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.utils.httpobj import urlparse_cached
+
+from api import validator_store
+from api.ratelimit import RedisTokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class SkipFinishedCompanyMiddleware:
+    """
+    여러 회사를 한 스파이더에서 도는(multi-tenant) 경우,
+    이미 끝난 회사(채용 페이지 저장 등)의 대기 요청은 다운로드하지 않고 버린다.
+    스파이더에 is_request_finished(request) 가 없으면 아무것도 하지 않는다.
+    """
+
+    def process_request(self, request, spider):
+        is_finished = getattr(spider, "is_request_finished", None)
+        if is_finished and is_finished(request):
+            raise IgnoreRequest("company already finished")
+        return None
+
+
+class SharedRateLimitMiddleware:
+    """
+    모든 크롤러 프로세스가 공유하는 호스트/IP 단위 요청 속도 제한 (api.ratelimit 토큰 버킷).
+
+    DOWNLOAD_DELAY / CONCURRENT_REQUESTS 는 프로세스(스파이더) 안에서만 지켜지기 때문에,
+    회사들을 병렬로 돌리면 같은 호스팅 서버(같은 IP)나 같은 도메인을 여러 프로세스가 동시에 두드리게 된다.
+    이 미들웨어는 요청을 보내기 전에
+      - host 버킷  (RATE_LIMIT_HOST_RATE / RATE_LIMIT_HOST_BURST)
+      - IP 버킷    (RATE_LIMIT_IP_RATE / RATE_LIMIT_IP_BURST, 호스트를 DNS 로 푼 주소)
+    둘 다에서 토큰을 받을 때까지 (reactor 를 막지 않고) 기다린다.
+    Redis 호출(EVAL)은 reactor 스레드가 아니라 스레드 풀에서 돈다 (deferToThread).
+    Redis 에 문제가 있으면 제한 없이 통과시킨다 (크롤링 자체를 멈추지 않기 위해).
+    """
+
+    MAX_SLEEP = 5.0
+    # Redis 오류 후 이 시간(초) 동안은 Redis 를 건너뛴다
+    REDIS_RETRY_AFTER = 60.0
+
+    def __init__(self, settings):
+        self.bucket = RedisTokenBucket()
+        self.host_rate = settings.getfloat("RATE_LIMIT_HOST_RATE")
+        self.host_burst = settings.getfloat("RATE_LIMIT_HOST_BURST")
+        self.ip_rate = settings.getfloat("RATE_LIMIT_IP_RATE")
+        self.ip_burst = settings.getfloat("RATE_LIMIT_IP_BURST")
+        self._ips = {}
+        self._redis_failed_at = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("RATE_LIMIT_ENABLED"):
+            raise NotConfigured
+        return cls(crawler.settings)
+
+    def process_request(self, request, spider):
+        host = urlparse_cached(request).hostname
+        if not host:
+            return None
+        d = self._resolve(host)
+        d.addCallback(lambda ip: self._wait_for_token(host, ip, spider))
+        return d
+
+    def _resolve(self, host):
+        if host in self._ips:
+            return defer.succeed(self._ips[host])
+
+        from twisted.internet import reactor
+
+        d = reactor.resolve(host)
+
+        def _ok(ip):
+            self._ips[host] = ip
+            return ip
+
+        def _fail(_):
+            # DNS 실패는 다운로더가 알아서 에러로 처리하므로 여기서는 호스트 버킷만 쓴다
+            self._ips[host] = None
+            return None
+
+        d.addCallbacks(_ok, _fail)
+        return d
+
+    def _wait_for_token(self, host, ip, spider):
+        buckets = [(f"host:{host}", self.host_rate, self.host_burst)]
+        if ip:
+            buckets.append((f"ip:{ip}", self.ip_rate, self.ip_burst))
+
+        if self._redis_failed_at and time.monotonic() - self._redis_failed_at < self.REDIS_RETRY_AFTER:
+            return None
+
+        d = deferToThread(self.bucket.try_acquire, buckets)
+        d.addCallbacks(self._acquired, self._redis_error, callbackArgs=(host, ip, spider))
+        return d
+
+    def _acquired(self, wait, host, ip, spider):
+        from twisted.internet import reactor
+        from twisted.internet.task import deferLater
+
+        self._redis_failed_at = None
+        if wait <= 0:
+            return None
+
+        spider.crawler.stats.inc_value("ratelimit/waits")
+        return deferLater(reactor, min(wait, self.MAX_SLEEP), self._wait_for_token, host, ip, spider)
+
+    def _redis_error(self, failure):
+        logger.warning("rate limit: redis unavailable, requests are not throttled for %ss (%s)",
+                       int(self.REDIS_RETRY_AFTER), failure.getErrorMessage())
+        self._redis_failed_at = time.monotonic()
+        return None
+
+
+class ConditionalRequestMiddleware:
+    """
+    meta["conditional"] 가 있는 GET 요청에 저장해 둔 검증값(api.validator_store)으로
+    If-None-Match / If-Modified-Since 를 붙이고, 200 응답의 ETag / Last-Modified 를 모아 둔다.
+
+    검증값은 최종(리다이렉트 뒤) URL 과 원래 요청 URL 둘 다에 저장한다.
+    모은 검증값은 스파이더가 닫힐 때 저장한다.
+      - finish_reason 이 "finished" 이고 파이프라인 저장 실패(job_collector/postings_failed)가 없을 때만 저장
+      - 그 외(예산/외부 플랫폼/예외로 끊김, 배치 저장 실패)에는 저장하지 않고, 이번에 200 으로 받은 URL 의
+        예전 검증값도 지운다. 파싱/저장이 끝나기 전에 listing 검증값이 남으면 다음 사이클이 304 를 받고
+        상세 페이지를 CONDITIONAL_VALIDATOR_TTL_HOURS 동안 건너뛰게 된다.
+
+    304 는 HttpErrorMiddleware 에 걸러지지 않도록 handle_httpstatus_list 에 넣어서 그대로 콜백으로 보낸다.
+    콜백은 response.status == 304 면 "그대로" 로 보고 파싱/분류/저장을 건너뛴다 (job_collector 참고).
+    stats: conditional/requests, conditional/not_modified, conditional/bytes_saved (지난번 본문 크기 합)
+    Redis 호출은 스레드 풀에서 돈다 (deferToThread). Redis 에 문제가 있으면 조건 없이 보낸다
+    (크롤링 자체를 멈추지 않기 위해).
+    """
+
+    HEADERS = (b"If-None-Match", b"If-Modified-Since")
+    # Redis 오류 후 이 시간(초) 동안은 Redis 를 건너뛴다
+    REDIS_RETRY_AFTER = 60.0
+
+    def __init__(self, stats):
+        self.stats = stats
+        self._redis_failed_at = None
+        # 이번 실행에서 200 으로 받은 URL -> 검증값 (스파이더가 닫힐 때 저장 / 삭제)
+        self.fetched = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("CONDITIONAL_REQUESTS_ENABLED"):
+            raise NotConfigured
+        mw = cls(crawler.stats)
+        crawler.signals.connect(mw.spider_closed, signal=signals.spider_closed)
+        return mw
+
+    def _store(self, fn, *args):
+        """validator_store 호출을 스레드 풀에서 돌린다. 리턴: 결과(Redis 오류면 None)를 주는 Deferred."""
+        if self._redis_failed_at and time.monotonic() - self._redis_failed_at < self.REDIS_RETRY_AFTER:
+            return defer.succeed(None)
+        d = deferToThread(fn, *args)
+        d.addCallbacks(self._store_ok, self._store_failed)
+        return d
+
+    def _store_ok(self, result):
+        self._redis_failed_at = None
+        return result
+
+    def _store_failed(self, failure):
+        logger.warning("conditional: redis unavailable, sending plain requests for %ss (%s)",
+                       int(self.REDIS_RETRY_AFTER), failure.getErrorMessage())
+        self._redis_failed_at = time.monotonic()
+        return None
+
+    def process_request(self, request, spider):
+        if not request.meta.get("conditional") or request.method != "GET":
+            return None
+        if request.meta.get("conditional_url") == request.url:
+            return None
+        # 리다이렉트로 새로 만들어진 요청이면 원래 URL 의 검증값은 떼어낸다
+        for header in self.HEADERS:
+            request.headers.pop(header, None)
+        request.meta["conditional_url"] = request.url
+        request.meta.pop("conditional_validators", None)
+
+        d = self._store(validator_store.get, request.url)
+        d.addCallback(self._apply_validators, request)
+        return d
+
+    def _apply_validators(self, stored, request):
+        if not stored:
+            return None
+        if stored.get("etag"):
+            request.headers[b"If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            request.headers[b"If-Modified-Since"] = stored["last_modified"]
+        request.meta["conditional_validators"] = stored
+        allowed = request.meta.get("handle_httpstatus_list") or []
+        if 304 not in allowed:
+            request.meta["handle_httpstatus_list"] = [*allowed, 304]
+        self.stats.inc_value("conditional/requests")
+        return None
+
+    def process_response(self, request, response, spider):
+        if not request.meta.get("conditional"):
+            return response
+        if response.status == 304:
+            stored = request.meta.get("conditional_validators") or {}
+            self.stats.inc_value("conditional/not_modified")
+            self.stats.inc_value("conditional/bytes_saved", int(stored.get("size") or 0))
+            return response
+        if response.status == 200:
+            etag = response.headers.get(b"ETag")
+            last_modified = response.headers.get(b"Last-Modified")
+            validators = {
+                "etag": etag.decode("latin-1") if etag else None,
+                "last_modified": last_modified.decode("latin-1") if last_modified else None,
+                "size": len(response.body or b""),
+            }
+            # 리다이렉트를 거쳤으면 스파이더가 다음에 요청할 원래 URL 에도 저장한다
+            for url in {request.url, (request.meta.get("redirect_urls") or [request.url])[0]}:
+                self.fetched[url] = validators
+        return response
+
+    def spider_closed(self, spider, reason):
+        # 파이프라인 close_spider(마지막 배치 저장)가 끝난 뒤에 불린다
+        if not self.fetched:
+            return
+        failed = self.stats.get_value("job_collector/postings_failed") or 0
+        if reason == "finished" and not failed:
+            return self._store(validator_store.put_many, self.fetched)
+        logger.info(
+            "conditional: %s validators dropped company_id=%s (reason=%s failed=%s)",
+            len(self.fetched), getattr(spider, "company_id", None), reason, failed,
+        )
+        return self._store(validator_store.delete_many, list(self.fetched))
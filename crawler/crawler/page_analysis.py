@@ -0,0 +1,114 @@
+"""
+페이지 1개를 한 번만 훑어서 discover_careers 판단 로직들이 같이 쓰는 정보를 모아둔다.
+
+예전에는 find_direct_recruit_link / contains_external_job_link / looks_like_listing /
+select_candidate_links 가 각자 response.css("a") 를 다시 돌면서
+텍스트를 합치고, 소문자로 바꾸고, PRIORITY_KEYWORDS 를 전부 다시 검사했다.
+메뉴 링크가 수백 개인 홈페이지에서는 이게 페이지당 CPU 의 대부분이었다.
+
+PageAnalysis(response, keywords, external_domains, is_same_domain)
+  keywords / external_domains 는 crawler.keyword_matcher.KeywordMatcher (한 번 컴파일해 둔 것)
+  - anchors       : href 있는 <a> 마다 Anchor (url, text, label, hits, same_domain, external)
+                    same_domain 은 키워드가 걸린 링크만 계산한다 (나머지는 None)
+  - job_anchors   : 키워드가 하나라도 걸린 Anchor
+  - script_job_anchors : onclick / javascript: / <script> 안의 링크 중 키워드가 걸린 Anchor
+                    (crawler.script_links, 처음 쓸 때 한 번만 만든다. path_clusters / 외부 링크 판단에는 넣지 않는다)
+  - path_clusters : job_anchors 의 상위 path 별 개수 (listing 판단용)
+  - text          : 페이지 전체 텍스트 (소문자, 처음 쓸 때 한 번만 만든다)
+  - headings      : <title>, h1~h3 텍스트 (소문자)
+"""
+
+from collections import Counter
+from functools import cached_property
+from urllib.parse import urlparse
+
+from crawler.script_links import extract_script_links
+
+
+class Anchor:
+    __slots__ = ("url", "text", "label", "hits", "same_domain", "external")
+
+    def __init__(self, url, text, label, hits, same_domain, external):
+        self.url = url
+        self.text = text
+        self.label = label
+        self.hits = hits
+        self.same_domain = same_domain
+        self.external = external
+
+    @property
+    def score(self):
+        # 걸린 키워드 1개당 10점 (URL path 가중치는 쓰지 않는다)
+        return 10 * len(self.hits)
+
+
+class PageAnalysis:
+    def __init__(self, response, keywords, external_domains, is_same_domain):
+        self.response = response
+        self.keywords = keywords
+        self.external_domains = external_domains
+        self.is_same_domain = is_same_domain
+        self.anchors = self._collect_anchors()
+
+    def _collect_anchors(self):
+        anchors = []
+        seen_same_domain = {}
+        # parsel 셀렉터를 anchor 마다 만들지 않고 lxml 트리를 직접 돈다
+        for el in self.response.selector.root.iter("a"):
+            href = (el.get("href") or "").strip()
+            if not href:
+                continue
+
+            text = " ".join(el.itertext()).strip().lower()
+            label = " ".join(filter(None, [el.get("title"), el.get("aria-label")])).strip().lower()
+            combined = f"{text} {label}"
+            hits = self.keywords.matched(combined)
+
+            url = self.response.urljoin(href)
+            external = self.external_domains.search(url.lower())
+
+            same = None
+            if hits:
+                host = urlparse(url).netloc
+                same = seen_same_domain.get(host)
+                if same is None:
+                    same = seen_same_domain[host] = self.is_same_domain(url)
+
+            anchors.append(Anchor(url, text, label, hits, same, external))
+        return anchors
+
+    @cached_property
+    def job_anchors(self):
+        return [a for a in self.anchors if a.hits]
+
+    @cached_property
+    def script_job_anchors(self):
+        anchors = []
+        for url, text in extract_script_links(self.response):
+            hits = self.keywords.matched(text)
+            if hits:
+                external = self.external_domains.search(url.lower())
+                anchors.append(Anchor(url, text, "", hits, self.is_same_domain(url), external))
+        return anchors
+
+    @cached_property
+    def has_external_link(self):
+        return any(a.external for a in self.anchors)
+
+    @cached_property
+    def path_clusters(self):
+        """채용 관련 링크를 쿼리/fragment 없이 상위 path 기준으로 묶은 개수."""
+        return Counter(urlparse(a.url).path.rsplit("/", 2)[0] for a in self.job_anchors)
+
+    @cached_property
+    def text(self):
+        # response.css("body ::text") 와 같은 텍스트 (script/style 포함)
+        body = self.response.selector.root.find("body")
+        return " ".join(body.itertext()).lower() if body is not None else ""
+
+    @cached_property
+    def headings(self):
+        root = self.response.selector.root
+        return " ".join(
+            " ".join(el.itertext()) for el in root.iter("title", "h1", "h2", "h3")
+        ).lower()
@@ -0,0 +1,279 @@
+"""
+job_collector 가 yield 하는 JobPostingItem 을 모아서 한 번에 저장한다.
+
+예전에는 공고 1개마다 Twisted 콜백 안에서 get_or_create -> 필드 비교 -> obj.save() 를 동기로 돌려서
+공고당 DB 왕복이 여러 번이고, 그동안 reactor 가 멈춰 있었다.
+
+JobPostingBulkPipeline
+  - item 을 JOB_PIPELINE_BATCH_SIZE 개씩 모은다 (스파이더가 끝날 때 남은 것도 저장)
+  - 배치마다 reactor 스레드 밖(deferToThread)에서, 트랜잭션 하나로
+      SELECT ... WHERE post_url IN (...)  1번
+      bulk_create(새 공고)                1번 (다른 프로세스가 먼저 만든 post_url 은 다시 읽어서 비교)
+      bulk_update(바뀐 공고, 바뀐 필드만) 1번
+      UPDATE last_seen_at (그대로인 공고 + 304 로 건너뛴 공고) 1번
+  - 배치 저장은 DeferredLock 으로 한 번에 하나씩 (같은 post_url 이 두 배치에 걸쳐도 순서대로)
+  - 비교 규칙은 예전 upsert 와 같다: 값이 있는 필드만, 기존 값과 다르면 갱신 + status 는 active 로.
+    다만 텍스트 컬럼 대신 JobPosting.content_hash / field_hashes 로 비교한다 (write_postings 참고).
+    bulk_update 는 auto_now 를 채우지 않으므로 crawled_at 은 직접 넣는다 (api/revisit.py 가 변화 판단에 쓴다).
+  - 스파이더가 깨끗하게 끝나면(finish_reason=finished, 실패한 배치 없음, 공고를 하나라도 봄)
+    이번 수집에서 한 번도 보지 못한 그 회사의 활성 공고를 내린다 (close_unseen: is_active=False, status=closed).
+    공고를 하나도 못 봤으면 파싱이 깨졌을 수도 있어서 내리지 않는다.
+  - stats: job_collector/postings_created, job_collector/postings_updated, job_collector/postings_closed
+"""
+
+import hashlib
+import logging
+import re
+
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from scrapy import signals
+from twisted.internet.defer import DeferredLock
+from twisted.internet.threads import deferToThread
+
+from api.models import JobPosting
+from crawler.items import JOB_FIELD_LIMITS, JobPostingItem, PostingsSeenItem
+
+logger = logging.getLogger(__name__)
+
+COMPARE_FIELDS = ["title", *JOB_FIELD_LIMITS]
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(value):
+    # 공백만 바뀐 것은 변경으로 보지 않는다
+    return _SPACE_RE.sub(" ", str(value or "")).strip()
+
+
+def field_hash(value):
+    return hashlib.blake2b(_normalize(value).encode(), digest_size=8).hexdigest()
+
+
+def content_hash(item):
+    """item 전체(COMPARE_FIELDS, 빈 값 포함)의 정규화 해시."""
+    h = hashlib.blake2b(digest_size=16)
+    for f in COMPARE_FIELDS:
+        h.update(_normalize(item.get(f)).encode())
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _fill_legacy_hashes(objs):
+    """해시가 아직 없는 예전 행은 텍스트 컬럼을 한 번 읽어서 field_hashes 를 채운다 (저장은 호출하는 쪽에서)."""
+    legacy = {obj.id: obj for obj in objs if not obj.content_hash}
+    if legacy:
+        for row in JobPosting.objects.filter(id__in=list(legacy)).values("id", *COMPARE_FIELDS):
+            legacy[row["id"]].field_hashes = {
+                f: field_hash(row[f]) for f in COMPARE_FIELDS if row[f]
+            }
+
+
+def write_postings(items):
+    """
+    item 배치를 저장한다 (워커 스레드에서 호출). 리턴: (생성 수, 갱신 수)
+    같은 post_url 이 배치 안에 여러 번 있으면 마지막 것을 쓴다.
+    PostingsSeenItem(304 로 파싱하지 않은 페이지)은 last_seen_at 만 갱신한다.
+
+    기존 공고는 텍스트 컬럼을 읽지 않고 content_hash / field_hashes 만 읽는다.
+      - content_hash 가 같고 active   -> 그대로: last_seen_at 만 (배치 전체를 UPDATE 1번)
+      - 다르면 field_hashes 로 바뀐 필드만 찾아서 그 필드만 bulk_update (+ crawled_at)
+      - 해시가 아직 없는 예전 행은 그 행들만 텍스트 컬럼을 한 번 읽어서 해시를 채운다
+    새 공고 중 그사이 다른 프로세스가 먼저 만든 post_url 은 bulk_create 가 건너뛰므로,
+    그 행들을 다시 읽어서 기존 공고와 같은 규칙으로 비교한다 (생성 수에는 넣지 않는다).
+    """
+    by_url = {item["post_url"]: item for item in items if isinstance(item, JobPostingItem)}
+    seen = [item for item in items if isinstance(item, PostingsSeenItem)]
+    seen_urls = [item["post_url"] for item in seen if item.get("post_url")]
+    seen_companies = {item["company_id"] for item in seen if not item.get("post_url")}
+    close_old_connections()
+    try:
+        with transaction.atomic():
+            existing = {
+                obj.post_url: obj
+                for obj in JobPosting.objects.filter(post_url__in=list(by_url)).only(
+                    "id", "post_url", "status", "is_active", "content_hash", "field_hashes",
+                )
+            }
+            _fill_legacy_hashes(existing.values())
+
+            now = timezone.now()
+            new = []
+            unchanged = []
+            changed = []
+            changed_fields = set()
+            rehashed = []
+
+            def _compare(obj, item):
+                item_hash = content_hash(item)
+                hashes = {f: field_hash(item[f]) for f in COMPARE_FIELDS if item.get(f)}
+                if obj.content_hash == item_hash and obj.status == "active" and obj.is_active:
+                    unchanged.append(obj.id)
+                    return
+
+                # 값이 있는 필드만, 해시가 다르면 갱신 (빈 값으로 기존 값을 지우지는 않는다)
+                fields = [f for f, h in hashes.items() if (obj.field_hashes or {}).get(f) != h]
+                for f in fields:
+                    setattr(obj, f, item[f])
+                if obj.status != "active":
+                    obj.status = "active"
+                    fields.append("status")
+                if not obj.is_active:
+                    # 내려갔던 공고가 다시 올라옴
+                    obj.is_active = True
+                    fields.append("is_active")
+                obj.field_hashes = {**(obj.field_hashes or {}), **hashes}
+                obj.content_hash = item_hash
+                obj.last_seen_at = now
+                if fields:
+                    obj.crawled_at = now
+                    changed.append(obj)
+                    changed_fields.update(fields)
+                else:
+                    # 비어 있던 필드만 달라졌거나 예전 행이라 해시만 새로 씀 (변경으로 세지 않는다)
+                    rehashed.append(obj)
+
+            for url, item in by_url.items():
+                obj = existing.get(url)
+                if obj is None:
+                    new.append(JobPosting(
+                        company_id=item["company_id"],
+                        post_url=url,
+                        status="active",
+                        content_hash=content_hash(item),
+                        field_hashes={f: field_hash(item[f]) for f in COMPARE_FIELDS if item.get(f)},
+                        last_seen_at=now,
+                        **{f: item.get(f) for f in COMPARE_FIELDS if f in item},
+                    ))
+                else:
+                    _compare(obj, item)
+
+            conflicts = []
+            if new:
+                # 다른 프로세스가 먼저 만든 post_url 은 건너뛴다 (배치 전체를 되돌리지 않게).
+                # 이번에 넣은 행은 last_seen_at 이 now 이므로, 아닌 행이 건너뛴 것이다.
+                JobPosting.objects.bulk_create(new, ignore_conflicts=True)
+                conflicts = list(
+                    JobPosting.objects.filter(post_url__in=[obj.post_url for obj in new])
+                    .exclude(last_seen_at=now)
+                    .only("id", "post_url", "status", "is_active", "content_hash", "field_hashes")
+                )
+                _fill_legacy_hashes(conflicts)
+                for obj in conflicts:
+                    _compare(obj, by_url[obj.post_url])
+
+            hash_fields = ["content_hash", "field_hashes", "last_seen_at"]
+            touch = Q(id__in=unchanged) | Q(post_url__in=seen_urls)
+            if seen_companies:
+                touch |= Q(company_id__in=seen_companies, is_active=True)
+            if unchanged or seen:
+                JobPosting.objects.filter(touch).update(last_seen_at=now)
+            if changed:
+                JobPosting.objects.bulk_update(changed, [*sorted(changed_fields), *hash_fields, "crawled_at"])
+            if rehashed:
+                JobPosting.objects.bulk_update(rehashed, hash_fields)
+    finally:
+        close_old_connections()
+    return len(new) - len(conflicts), len(changed)
+
+
+def close_unseen(company_id, since):
+    """
+    since(스파이더 시작 시각) 이후 한 번도 보지 못한 company_id 의 활성 공고를 내린다 (워커 스레드에서 호출).
+    리턴: 내린 공고 수. crawled_at 도 같이 넣어서 api/revisit.py 가 비활성화를 변화로 센다.
+    """
+    close_old_connections()
+    try:
+        return JobPosting.objects.filter(
+            Q(last_seen_at__lt=since) | Q(last_seen_at__isnull=True),
+            company_id=company_id,
+            is_active=True,
+        ).update(is_active=False, status="closed", crawled_at=timezone.now())
+    finally:
+        close_old_connections()
+
+
+class JobPostingBulkPipeline:
+    def __init__(self, stats, batch_size):
+        self.stats = stats
+        self.batch_size = max(1, batch_size)
+        self.buffer = []
+        self.lock = DeferredLock()
+        self.started_at = None
+        self.seen_any = False
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        pipeline = cls(crawler.stats, crawler.settings.getint("JOB_PIPELINE_BATCH_SIZE", 100))
+        crawler.signals.connect(pipeline.spider_closed, signal=signals.spider_closed)
+        return pipeline
+
+    def open_spider(self, spider):
+        self.started_at = timezone.now()
+
+    def process_item(self, item, spider):
+        if not isinstance(item, (JobPostingItem, PostingsSeenItem)):
+            return item
+        self.seen_any = True
+        self.buffer.append(item)
+        if len(self.buffer) < self.batch_size:
+            return item
+        # 배치가 찼으면 저장이 끝날 때까지 이 item 을 붙잡아 둔다 (저장이 밀리면 수집도 같이 늦춘다)
+        d = self._flush(spider)
+        d.addCallback(lambda _: item)
+        return d
+
+    def close_spider(self, spider):
+        return self._flush(spider)
+
+    def spider_closed(self, spider, reason):
+        # close_spider(마지막 배치 저장) 다음에 온다
+        company_id = getattr(spider, "company_id", None)
+        if (
+            reason != "finished"
+            or company_id is None
+            or not self.seen_any
+            or self.stats.get_value("job_collector/postings_failed", 0)
+        ):
+            return None
+        d = self.lock.run(deferToThread, close_unseen, company_id, self.started_at)
+        d.addCallbacks(self._closed, self._close_failed, callbackArgs=(company_id,), errbackArgs=(company_id,))
+        return d
+
+    def _flush(self, spider):
+        batch, self.buffer = self.buffer, []
+        if not batch:
+            return self.lock.run(lambda: None)
+        d = self.lock.run(deferToThread, write_postings, batch)
+        d.addCallbacks(self._saved, self._failed, callbackArgs=(batch, spider), errbackArgs=(batch, spider))
+        return d
+
+    def _saved(self, result, batch, spider):
+        created, updated = result
+        skipped = sum(1 for item in batch if isinstance(item, PostingsSeenItem))
+        self.stats.inc_value("job_collector/postings_created", created)
+        self.stats.inc_value("job_collector/postings_updated", updated)
+        logger.info(
+            "job_collector: saved batch company_id=%s items=%s created=%s updated=%s unchanged=%s not_modified=%s",
+            getattr(spider, "company_id", None), len(batch), created, updated,
+            len(batch) - skipped - created - updated, skipped,
+        )
+
+    def _failed(self, failure, batch, spider):
+        # 한 배치가 실패해도 스파이더는 계속 돈다 (예전 upsert 가 예외로 콜백 하나만 잃던 것과 같은 범위)
+        self.stats.inc_value("job_collector/postings_failed", len(batch))
+        logger.error(
+            "job_collector: failed to save batch company_id=%s items=%s: %s",
+            getattr(spider, "company_id", None), len(batch), failure.getErrorMessage(),
+        )
+
+    def _closed(self, closed, company_id):
+        self.stats.inc_value("job_collector/postings_closed", closed)
+        if closed:
+            logger.info("job_collector: closed unseen postings company_id=%s closed=%s", company_id, closed)
+
+    def _close_failed(self, failure, company_id):
+        logger.error(
+            "job_collector: failed to close unseen postings company_id=%s: %s",
+            company_id, failure.getErrorMessage(),
+        )
@@ -0,0 +1,131 @@
+"""
+<a href> 가 아닌 곳에 숨어 있는 링크를 꺼낸다 (헤드리스 브라우저 없이).
+
+중소기업 홈페이지는 "채용" 메뉴를 이런 식으로만 노출하는 경우가 많다.
+  <li onclick="location.href='/recruit/list.php'">채용</li>
+  <a href="javascript:goMenu('/sub05/recruit.asp')">인재채용</a>
+  <a href="#" onclick="window.open('https://recruit.example.co.kr')">채용사이트</a>
+  <script>var menu = [{"name": "채용안내", "url": "/company/recruit"}, ...]</script>
+select_candidate_links / extract_job_links 는 <a href> 만 보므로 이런 링크는 전부 놓친다.
+
+extract_script_links(response) -> [(절대 URL, 텍스트), ...]
+  - inline 핸들러(onclick, href="javascript:...") : location.href / location.assign / location.replace /
+    window.open 대상, 없으면 핸들러 안의 URL 처럼 보이는 문자열. 텍스트는 그 요소의 텍스트 + title/aria-label.
+  - <script> 본문(src 없는 것) : URL 처럼 보이는 문자열 리터럴. 텍스트는 같은 {...} (없으면 같은 줄/문장)
+    안의 다른 문자열 리터럴 (메뉴 JSON 의 이름 필드). \\uXXXX 이스케이프는 풀어서 비교한다.
+텍스트는 소문자. 키워드 판단은 호출하는 쪽이 <a> 와 같은 규칙(KeywordMatcher)으로 한다.
+"""
+
+import re
+
+# 스크립트 하나에서 이 이상은 보지 않는다 (번들 JS 가 통째로 inline 된 페이지 대비)
+MAX_SCRIPT_CHARS = 256 * 1024
+# 페이지 하나에서 꺼내는 링크 수 상한
+MAX_LINKS = 300
+# 메뉴 JSON 에서 URL 앞뒤로 이름을 찾는 범위
+CONTEXT_CHARS = 160
+
+_NAV_RE = re.compile(
+    r"""(?:location(?:\.href)?\s*=|location\.(?:assign|replace)\s*\(|window\.open\s*\(|\.href\s*=)"""
+    r"""\s*(['"`])(.+?)\1"""
+)
+_LITERAL_RE = re.compile(r"""(['"`])((?:\\.|(?!\1)[^\\\n])*)\1""")
+_URLISH_RE = re.compile(
+    r"""^(?:https?://[^\s'"<>]+|/[\w\-./%?=&~:;,+#]*|\.{1,2}/[\w\-./%?=&~:;,+#]*"""
+    r"""|[\w\-./]+\.(?:php|jsp|asp|aspx|html?|do)(?:\?[^\s'"<>]*)?)$""",
+    re.I,
+)
+# 링크가 아닌 리소스
+_ASSET_RE = re.compile(
+    r"\.(?:js|mjs|css|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|eot|mp4|webm|mp3|pdf|zip|json|map)(?:[?#]|$)",
+    re.I,
+)
+_UNICODE_ESCAPE_RE = re.compile(r"\\u([0-9a-fA-F]{4})")
+
+
+def _unescape(s):
+    s = _UNICODE_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)), s)
+    return s.replace("\\/", "/").replace("\\'", "'").replace('\\"', '"')
+
+
+def _is_link(value):
+    if len(value) < 2 or value in ("//", "./", "../") or value.startswith("//"):
+        return False
+    return bool(_URLISH_RE.match(value)) and not _ASSET_RE.search(value)
+
+
+def _handler_targets(code):
+    """inline 핸들러 코드에서 이동 대상 URL 들."""
+    code = _unescape(code)
+    targets = [m.group(2).strip() for m in _NAV_RE.finditer(code)]
+    if not targets:
+        # goMenu('/recruit/list.do') 처럼 직접 만든 함수로 이동하는 경우
+        targets = [m.group(2).strip() for m in _LITERAL_RE.finditer(code)]
+    return [t for t in targets if _is_link(t)]
+
+
+def _context_label(script, start, end):
+    """URL 리터럴과 같은 {...} (없으면 같은 줄/문장) 안의 다른 문자열 리터럴들."""
+    before = script[max(0, start - CONTEXT_CHARS):start]
+    after = script[end:end + CONTEXT_CHARS]
+    cut = max(before.rfind(c) for c in "{};\n")
+    before = before[cut + 1:]
+    cuts = [i for i in (after.find(c) for c in "{};\n") if i >= 0]
+    after = after[:min(cuts)] if cuts else after
+    words = []
+    for m in _LITERAL_RE.finditer(before + " " + after):
+        value = _unescape(m.group(2)).strip()
+        if value and not _is_link(value):
+            words.append(value)
+    return " ".join(words)
+
+
+def _script_links(script):
+    script = script[:MAX_SCRIPT_CHARS]
+    for m in _LITERAL_RE.finditer(script):
+        value = _unescape(m.group(2)).strip()
+        if _is_link(value):
+            yield value, _context_label(script, m.start(), m.end())
+
+
+def extract_script_links(response):
+    """
+    inline 핸들러 / <script> 본문에 있는 링크들 [(절대 URL, 텍스트 소문자), ...] (문서 순, URL 중복 없음).
+    """
+    root = response.selector.root
+    found = []
+    seen = set()
+
+    def _add(target, text):
+        url = response.urljoin(target)
+        if url in seen or not url.startswith(("http://", "https://")):
+            return
+        seen.add(url)
+        found.append((url, text.lower()))
+
+    for el in root.iter():
+        if len(found) >= MAX_LINKS:
+            break
+        if not isinstance(el.tag, str):
+            # 주석 / processing instruction
+            continue
+        if el.tag == "script":
+            if el.get("src") is None and el.text:
+                for target, label in _script_links(el.text):
+                    _add(target, label)
+            continue
+
+        code = el.get("onclick") or ""
+        href = (el.get("href") or "").strip()
+        if href.lower().startswith("javascript:"):
+            code = f"{code};{href[len('javascript:'):]}"
+        if not code:
+            continue
+        targets = _handler_targets(code)
+        if targets:
+            text = " ".join(el.itertext()).strip()
+            label = " ".join(filter(None, [el.get("title"), el.get("aria-label")]))
+            for target in targets:
+                _add(target, f"{text} {label}".strip())
+
+    return found[:MAX_LINKS]
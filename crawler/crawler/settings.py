@@ -29,6 +29,9 @@ BOT_NAME = "crawler"
 SPIDER_MODULES = ["crawler.spiders"]
 NEWSPIDER_MODULE = "crawler.spiders"
 
+# 커스텀 커맨드 (scrapy crawl_batch: 여러 회사를 한 프로세스에서 실행)
+COMMANDS_MODULE = "crawler.commands"
+
 # 로봇 배제 규약: 크롤링 정책에 맞게 조정 (개발용이라면 False 유지)
 ROBOTSTXT_OBEY = False
 
@@ -47,5 +50,47 @@ DEFAULT_REQUEST_HEADERS = {
     "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
 }
 
+# 모든 크롤러 프로세스가 공유하는 호스트/IP 단위 속도 제한 (Redis 토큰 버킷, crawler/middlewares.py)
+# rate = 초당 요청 수, burst = 한 번에 몰아서 보낼 수 있는 최대 요청 수
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+RATE_LIMIT_HOST_RATE = float(os.getenv("RATE_LIMIT_HOST_RATE", "2"))
+RATE_LIMIT_HOST_BURST = float(os.getenv("RATE_LIMIT_HOST_BURST", "4"))
+RATE_LIMIT_IP_RATE = float(os.getenv("RATE_LIMIT_IP_RATE", "5"))
+RATE_LIMIT_IP_BURST = float(os.getenv("RATE_LIMIT_IP_BURST", "10"))
+
+DOWNLOADER_MIDDLEWARES = {
+    # 끝난 회사의 요청은 속도 제한 토큰을 쓰기 전에 버린다
+    "crawler.middlewares.SkipFinishedCompanyMiddleware": 40,
+    "crawler.middlewares.SharedRateLimitMiddleware": 50,
+    # meta["conditional"] 요청에 If-None-Match / If-Modified-Since (304 면 콜백이 파싱을 건너뛴다)
+    "crawler.middlewares.ConditionalRequestMiddleware": 60,
+}
+
+# job_collector 공고 item 을 배치로 모아서 저장 (SELECT 1번 + bulk_create + bulk_update, reactor 스레드 밖)
+ITEM_PIPELINES = {
+    "crawler.pipelines.JobPostingBulkPipeline": 300,
+}
+
+# 크롤 사이클 진행 상황(/api/crawl/status/)에 페이지/공고 수 집계 + 회사당 예산
+EXTENSIONS = {
+    "crawler.extensions.CrawlProgressExtension": 500,
+    "crawler.extensions.CrawlBudgetExtension": 500,
+}
+
+# 회사(스파이더) 하나당 예산 (0 = 제한 없음). 값은 Django settings 에서 가져온다.
+# 예산을 넘으면 스파이더는 그때까지 저장한 것은 두고 정상 종료하며, finish_reason 에 사유가 남는다.
+from django.conf import settings as django_settings  # noqa: E402
+
+CLOSESPIDER_TIMEOUT = django_settings.CRAWL_BUDGET_SECONDS
+CLOSESPIDER_PAGECOUNT = django_settings.CRAWL_BUDGET_PAGES
+CRAWL_BUDGET_BYTES = django_settings.CRAWL_BUDGET_BYTES
+CRAWL_BUDGET_ITEMS = django_settings.CRAWL_BUDGET_ITEMS
+JOB_PIPELINE_BATCH_SIZE = django_settings.JOB_PIPELINE_BATCH_SIZE
+CONDITIONAL_REQUESTS_ENABLED = django_settings.CONDITIONAL_REQUESTS_ENABLED
+
+# 응답 1개 단위 안전장치 (거대한 페이지 / 느리게 흘리는 서버)
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_MAXSIZE = 10 * 1024 * 1024
+
 # 로그 레벨 (개발 중이면 'INFO' 또는 'DEBUG')
 LOG_LEVEL = "INFO"
@@ -461,14 +461,20 @@
 
 
 import os
+import json
 import logging
-from urllib.parse import urlparse
+import sys
+from functools import partial
+from urllib.parse import unquote, urljoin, urlparse
 
 import django
 from django.db import connections
 from django.db.utils import OperationalError
 
 from scrapy import Spider, Request
+from scrapy.exceptions import CloseSpider
+from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils.sitemap import Sitemap, sitemap_urls_from_robots
 
 # ===== Django 초기화 =====
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -477,7 +483,12 @@ os.environ.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
 
 django.setup()
 
+from django.conf import settings as django_settings  # noqa: E402
+
 from api.models import Company  # noqa: E402
+from crawler.keyword_matcher import KeywordMatcher  # noqa: E402
+from crawler.commands.crawl_batch import RESULT_PREFIX  # noqa: E402
+from crawler.page_analysis import PageAnalysis  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -495,8 +506,53 @@ EXTERNAL_JOB_DOMAINS = [
     "jobkorea.co.kr",
 ]
 
+# 키워드 리스트는 모듈 로드 때 한 번만 컴파일 (crawler/keyword_matcher.py)
+PRIORITY_MATCHER = KeywordMatcher(PRIORITY_KEYWORDS)
+EXTERNAL_DOMAIN_MATCHER = KeywordMatcher(EXTERNAL_JOB_DOMAINS)
+# listing / one_page 판단 전에 페이지 텍스트에 있어야 하는 단어
+LISTING_TEXT_MATCHER = KeywordMatcher(["채용", "recruit", "career", "jobs", "job", "employment"])
+ONEPAGE_TEXT_MATCHER = KeywordMatcher(["채용", "recruit", "career", "입사지원", "지원방법"])
+# sitemap 의 URL 중 채용 페이지일 법한 path
+CAREER_PATH_MATCHER = KeywordMatcher(["career", "recruit", "job", "hiring", "join", "채용", "인재"])
+
+
+class CompanyCrawl:
+    """회사 1개의 탐색 상태. multi-tenant 모드에서는 회사마다 하나씩 들고 있다."""
+
+    def __init__(self, company_id, company_name, homepage_url):
+        self.company_id = int(company_id)
+        self.company_name = company_name or ""
+        self.start_url = homepage_url
+        self.start_domain = urlparse(homepage_url).netloc
+        self.visited = set()
+        # sitemap / 잘 알려진 경로로 미리 확인한 URL (링크 탐색의 visited 와 따로 둔다)
+        self.probed = set()
+        self.found = False
+        # 끝났으면 종료 사유 (recruits_url_found / finished / page_cap)
+        self.done_reason = None
+        # 페이지 상한에 닿아서 새 요청은 더 예약하지 않음 (이미 예약한 요청은 끝까지 받는다)
+        self.capped = False
+        # 예약했지만 아직 응답(또는 실패)을 못 받은 요청 수
+        self.pending = 0
+        # 예약한 요청 수 (회사당 페이지 상한용)
+        self.scheduled = 0
+
 
 class DiscoverCareersSpider(Spider):
+    """
+    회사 1개:   scrapy crawl discover_careers -a company_id=1 -a homepage_url=https://...
+    회사 여러 개(multi-tenant):
+                scrapy crawl discover_careers -a company_ids=1,2,3
+      - start_requests 에서 DB 로 회사들을 읽고, 회사마다 CompanyCrawl(방문 집합/조기 종료 등)을 둔다.
+      - 요청마다 meta["company_id"] 로 어느 회사 것인지 표시한다.
+      - 한 회사가 끝나면(저장/더 볼 링크 없음) stdout 에 `CRAWL_RESULT {json}` 한 줄을 찍고,
+        그 회사의 대기 요청은 SkipFinishedCompanyMiddleware 가 다운로드 전에 버린다.
+      - 회사당 페이지 상한에 닿으면 새 요청만 멈추고, 이미 예약한 요청이 다 끝나면 "page_cap" 으로 보고한다.
+      - 시간 예산(CLOSESPIDER_TIMEOUT)도 회사 수만큼 늘린다. 그래도 스파이더가 먼저 닫히면
+        못 끝낸 회사는 실패(exit 1, 닫힌 사유)로 보고해서 체크포인트되지 않게 한다.
+      - 동시 요청 수는 DISCOVER_MULTI_CONCURRENCY, 호스트당은 CONCURRENT_REQUESTS_PER_DOMAIN 으로 제한.
+    """
+
     name = "discover_careers"
 
     custom_settings = {
@@ -505,84 +561,291 @@ class DiscoverCareersSpider(Spider):
         "CONCURRENT_REQUESTS": 4,
     }
 
-    def __init__(self, company_id=None, company_name=None, homepage_url=None, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if not company_id or not homepage_url:
-            raise ValueError("company_id and homepage_url are required")
-
-        self.company_id = int(company_id)
-        self.company_name = company_name or ""
-        self.start_url = homepage_url
-
-        parsed = urlparse(homepage_url)
-        self.start_domain = parsed.netloc
+    # best-first: 링크 점수가 높고 얕은 요청부터 (Scrapy priority 는 클수록 먼저)
+    DEPTH_PENALTY = 5
+    # 빠른 경로(robots.txt / sitemap / 잘 알려진 채용 경로)는 홈페이지 링크 탐색보다 먼저
+    PROBE_PRIORITY = 1000
+    # sitemap index 에서 따라갈 하위 sitemap 수
+    MAX_CHILD_SITEMAPS = 3
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        # 설정은 스파이더를 만든 뒤에 freeze 되므로, 회사 수에 맞춰 여기서 조정한다
+        settings = crawler.settings
+        cap = spider.max_pages
+        budget = settings.getint("CLOSESPIDER_PAGECOUNT")
+        if spider.multi:
+            n = max(1, len(spider.company_ids))
+            # 회사당 예산은 스파이더 안에서 회사별로 지키고, 스파이더 전체는 회사 수만큼 늘린다
+            if budget:
+                settings.set("CLOSESPIDER_PAGECOUNT", budget * n, priority="spider")
+            max_bytes = settings.getint("CRAWL_BUDGET_BYTES")
+            if max_bytes:
+                settings.set("CRAWL_BUDGET_BYTES", max_bytes * n, priority="spider")
+            timeout = settings.getfloat("CLOSESPIDER_TIMEOUT")
+            if timeout:
+                settings.set("CLOSESPIDER_TIMEOUT", timeout * n, priority="spider")
+            settings.set(
+                "CONCURRENT_REQUESTS",
+                getattr(django_settings, "DISCOVER_MULTI_CONCURRENCY", 64),
+                priority="spider",
+            )
+            settings.set(
+                "CONCURRENT_REQUESTS_PER_DOMAIN",
+                getattr(django_settings, "DISCOVER_MULTI_PER_DOMAIN", 2),
+                priority="spider",
+            )
+        elif cap and (not budget or cap < budget):
+            # 회사당 페이지 상한: 전체 예산(CLOSESPIDER_PAGECOUNT)과 DISCOVER_MAX_PAGES 중 작은 쪽
+            settings.set("CLOSESPIDER_PAGECOUNT", cap, priority="spider")
+        return spider
 
+    def __init__(self, company_id=None, company_name=None, homepage_url=None,
+                 company_ids=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.max_depth = 3
-        self.visited = set()
+        self.companies = {}
+        # 회사별 종료 사유 (CrawlProgressExtension 이 close_reasons 에 회사 단위로 더한다)
+        self.company_close_reasons = {}
+
+        self.probe_enabled = getattr(django_settings, "DISCOVER_PROBE_ENABLED", True)
+        self.probe_paths = list(getattr(django_settings, "DISCOVER_PROBE_PATHS", []))
+        self.sitemap_max_urls = int(getattr(django_settings, "DISCOVER_SITEMAP_MAX_URLS", 3))
+        self.script_links = getattr(django_settings, "CRAWL_SCRIPT_LINKS", True)
+
+        cap = int(getattr(django_settings, "DISCOVER_MAX_PAGES", 0) or 0)
+        budget = int(getattr(django_settings, "CRAWL_BUDGET_PAGES", 0) or 0)
+        self.max_pages = min(p for p in (cap, budget) if p) if (cap or budget) else 0
+
+        if company_ids:
+            self.multi = True
+            self.company_ids = [int(c) for c in str(company_ids).split(",") if c.strip()]
+            return
+
+        if not company_id or not homepage_url:
+            raise ValueError("company_id and homepage_url (or company_ids) are required")
+        self.multi = False
+        company = CompanyCrawl(company_id, company_name, homepage_url)
+        self.companies[company.company_id] = company
+        self.company_ids = [company.company_id]
+        # 예전 단일 회사 속성 (확장/로그에서 사용)
+        self.company_id = company.company_id
+        self.company_name = company.company_name
+        self.start_url = company.start_url
+        self.start_domain = company.start_domain
 
     # Scrapy 2.13 경고 회피 위해 start_requests 유지 (하위호환),
     # 필요시 start() 도입 가능.
     def start_requests(self):
-        yield Request(
-            url=self.start_url,
-            callback=self.parse_page,
-            meta={"depth": 0},
+        if self.multi:
+            self._load_companies()
+
+        for company in list(self.companies.values()):
+            if self.probe_enabled:
+                yield from self.probe_requests(company)
+            yield self._request(company, company.start_url, depth=0)
+
+    def _load_companies(self):
+        rows = (
+            Company.objects.filter(id__in=self.company_ids)
+            .exclude(homepage_url__isnull=True)
+            .exclude(homepage_url="")
+            .values_list("id", "name", "homepage_url")
+        )
+        for company_id, name, homepage_url in rows:
+            self.companies[company_id] = CompanyCrawl(company_id, name, homepage_url)
+
+        for company_id in self.company_ids:
+            if company_id not in self.companies:
+                logger.warning("[discover] company_id=%s not found or has no homepage_url", company_id)
+                self.report(company_id, "company_not_found", exit_code=1)
+        logger.info("[discover] multi-tenant: %s companies", len(self.companies))
+
+    def _request(self, company, url, depth, priority=0, callback=None):
+        company.pending += 1
+        company.scheduled += 1
+        return Request(
+            url=url,
+            callback=callback or self.parse_page,
+            errback=self.page_failed,
+            meta={"depth": depth, "company_id": company.company_id},
+            priority=priority,
             dont_filter=True,
         )
 
+    # ===== 빠른 경로: robots.txt / sitemap / 잘 알려진 채용 경로 =====
+
+    def probe_requests(self, company):
+        """
+        링크 탐색 전에 싸게 먼저 볼 요청들.
+        - robots.txt 의 Sitemap: 항목과 /sitemap.xml -> 채용스러운 path 의 URL 몇 개
+        - DISCOVER_PROBE_PATHS (/careers, /recruit, ...) 를 한꺼번에
+        찾은 페이지는 링크 탐색과 같은 판단 로직(looks_like_listing / looks_like_onepage)을 거친다.
+        """
+        root = urljoin(company.start_url, "/")
+        yield self._request(
+            company, urljoin(root, "/robots.txt"), depth=1,
+            priority=self.PROBE_PRIORITY, callback=self.parse_robots,
+        )
+        yield from self._sitemap_request(company, urljoin(root, "/sitemap.xml"))
+        for path in self.probe_paths:
+            yield from self._probe_request(company, urljoin(root, path), self.PROBE_PRIORITY - 1)
+
+    def _sitemap_request(self, company, url):
+        if url in company.probed:
+            return
+        company.probed.add(url)
+        yield self._request(
+            company, url, depth=1,
+            priority=self.PROBE_PRIORITY, callback=self.parse_sitemap,
+        )
+
+    def _probe_request(self, company, url, priority):
+        if url in company.probed or (self.max_pages and company.scheduled >= self.max_pages):
+            return
+        company.probed.add(url)
+        yield self._request(company, url, depth=1, priority=priority, callback=self.parse_probe)
+
+    def parse_robots(self, response):
+        company = self.company_for(response.request)
+        company.pending -= 1
+        try:
+            if company.done_reason is None:
+                body = response.body.decode("utf-8", "ignore")
+                for url in sitemap_urls_from_robots(body, base_url=response.url):
+                    yield from self._sitemap_request(company, url)
+        finally:
+            self._check_idle(company)
+
+    def parse_sitemap(self, response):
+        company = self.company_for(response.request)
+        company.pending -= 1
+        try:
+            if company.done_reason is None:
+                yield from self._parse_company_sitemap(response, company)
+        finally:
+            self._check_idle(company)
+
+    def _parse_company_sitemap(self, response, company):
+        body = response.body
+        if gzip_magic_number(response):
+            try:
+                body = gunzip(body, max_size=10 * 1024 * 1024)
+            except Exception:
+                return
+        try:
+            sitemap = Sitemap(body)
+        except Exception:
+            return
+
+        if sitemap.type == "sitemapindex":
+            locs = [entry["loc"] for entry in sitemap]
+            # 채용스러운 이름의 하위 sitemap 먼저
+            locs.sort(key=lambda loc: not CAREER_PATH_MATCHER.search(unquote(loc).lower()))
+            for loc in locs[: self.MAX_CHILD_SITEMAPS]:
+                yield from self._sitemap_request(company, loc)
+            return
+
+        if sitemap.type != "urlset":
+            return
+
+        matched = []
+        for entry in sitemap:
+            loc = entry["loc"]
+            path = unquote(urlparse(loc).path).lower()
+            if CAREER_PATH_MATCHER.search(path) and self.is_same_domain(loc, company.start_domain):
+                matched.append((len(path), loc))
+        # 짧은 path(= 목록/안내 페이지일 가능성이 큰 것)부터
+        matched.sort()
+        for _, loc in matched[: self.sitemap_max_urls]:
+            yield from self._probe_request(company, loc, self.PROBE_PRIORITY - 1)
+
+    def parse_probe(self, response):
+        company = self.company_for(response.request)
+        company.pending -= 1
+        try:
+            if company.done_reason is None:
+                self._check_probe(response, company)
+        finally:
+            self._check_idle(company)
+        return []
+
+    def _check_probe(self, response, company):
+        # 없는 경로를 홈페이지로 돌려보내는 사이트가 많다 -> 루트로 간 응답은 무시
+        if urlparse(response.url).path in ("", "/") or not hasattr(response, "text"):
+            return
+        page = self.analyze(response, company)
+        # 200 으로 주는 soft 404 (홈페이지와 같은 내용) 를 거르기 위해 제목/헤딩에도 채용 키워드가 있어야 한다
+        if not PRIORITY_MATCHER.search(page.headings):
+            return
+        result = self.classify(page, depth=1)
+        if result:
+            logger.info("[discover] company_id=%s probe hit %s", company.company_id, response.url)
+            self.finish(company, page_url=response.url, page_type=result[0], post_type=result[1])
+
+    def company_for(self, request):
+        company_id = request.meta.get("company_id")
+        if company_id is None and not self.multi:
+            company_id = self.company_ids[0]
+        return self.companies[company_id]
+
+    def is_request_finished(self, request):
+        """이미 끝난 회사의 요청인지 (SkipFinishedCompanyMiddleware 가 다운로드 전에 확인)."""
+        company = self.companies.get(request.meta.get("company_id"))
+        return company is not None and company.done_reason is not None
+
     # ===== 핵심 로직 =====
 
     def parse_page(self, response):
+        company = self.company_for(response.request)
+        company.pending -= 1
+        try:
+            # 이미 저장했거나 끝난 회사면 남은 응답은 버린다
+            if company.done_reason is None:
+                yield from self._parse_company_page(response, company)
+        finally:
+            self._check_idle(company)
+
+    def page_failed(self, failure):
+        company = self.company_for(failure.request)
+        company.pending -= 1
+        self._check_idle(company)
+
+    def _check_idle(self, company):
+        # 더 기다릴 요청이 없으면 이 회사는 끝 (찾지 못함)
+        if company.pending <= 0 and company.done_reason is None:
+            self.company_done(company, "page_cap" if company.capped else "finished")
+
+    def _parse_company_page(self, response, company):
         depth = response.meta.get("depth", 0)
         url = response.url
-        self.visited.add(url)
+        company.visited.add(url)
+
+        logger.info("[discover] company_id=%s depth=%s url=%s", company.company_id, depth, url)
 
-        logger.info("[discover] depth=%s url=%s", depth, url)
+        # <a> 들은 여기서 한 번만 훑고, 아래 판단 로직들은 전부 이 결과를 읽는다
+        page = self.analyze(response, company)
 
         # depth=0(홈페이지)에서는,
         # '채용' 등 명시적인 링크가 있으면 최우선으로 한 번 따라가 본다.
         if depth == 0:
-            direct = self.find_direct_recruit_link(response)
-            if direct and direct not in self.visited:
+            direct = self.find_direct_recruit_link(page)
+            if direct and direct not in company.visited:
                 logger.info("[discover] depth=0 direct recruit link -> %s", direct)
-                self.visited.add(direct)
-                yield Request(
-                    url=direct,
-                    callback=self.parse_page,
-                    meta={"depth": depth + 1},
-                    dont_filter=True,
-                )
+                company.visited.add(direct)
+                yield self._request(company, direct, depth=depth + 1)
                 return
 
-
-        # 1) 외부 채용 플랫폼 링크가 이 페이지 안에 하나라도 있으면:
-        #    - 이 페이지를 외부 채용 연동 페이지로 인정하고 종료
-        if self.contains_external_job_link(response):
-            self.save_result(
-                page_url=url,
-                page_type="external",
-                post_type="external_link",
-            )
-            return
-
-        text = self._get_text(response)
-
-        # 2) listing 형태 추정
-        if self.looks_like_listing(response, text):
-            self.save_result(
-                page_url=url,
-                page_type="listing",
-                post_type="text",
-            )
-            return
-
-        # 3) one_page / main 형태 추정
-        if self.looks_like_onepage(response, text, depth):
-            page_type = "main" if depth == 0 else "one_page"
-            self.save_result(
+        # 1) ~ 3) 외부 연동 / listing / one_page(main) 판단
+        result = self.classify(page, depth)
+        if result:
+            page_type, post_type = result
+            self.finish(
+                company,
                 page_url=url,
                 page_type=page_type,
-                post_type="text",
+                post_type=post_type,
             )
             return
 
@@ -591,120 +854,137 @@ class DiscoverCareersSpider(Spider):
             return
 
         # 5) 우선순위 키워드 기반 후보 링크 탐색 (URL 가중치 제외)
-        for next_url in self.select_candidate_links(response):
-            if next_url in self.visited:
+        #    점수/깊이로 priority 를 줘서 스케줄러가 가장 그럴듯한 링크부터 받게 한다
+        for score, next_url in self.select_candidate_links(page, company):
+            if next_url in company.visited:
                 continue
-            # 동일 회사 도메인만 탐색 (외부 채용 도메인은 위에서 이미 처리)
-            if not self.is_same_domain(next_url):
-                continue
-            yield Request(
-                url=next_url,
-                callback=self.parse_page,
-                meta={"depth": depth + 1},
-                dont_filter=True,
+            # 회사 1개 모드의 상한은 CLOSESPIDER_PAGECOUNT 가 지킨다
+            if self.multi and self.max_pages and company.scheduled >= self.max_pages:
+                # 새 요청만 멈춘다: 이미 예약한 요청은 받고, 다 끝나면 _check_idle 이 page_cap 으로 보고
+                if not company.capped:
+                    logger.info("[discover] company_id=%s page cap %s reached", company.company_id, self.max_pages)
+                company.capped = True
+                break
+            # 다른 페이지에서 같은 링크를 또 예약하지 않도록
+            company.visited.add(next_url)
+            yield self._request(
+                company, next_url, depth=depth + 1,
+                priority=self.request_priority(score, depth + 1),
             )
 
-    # ===== 선택 엔진 =====
+    def classify(self, page, depth):
+        """채용 페이지로 볼 수 있으면 (page_type, post_type), 아니면 None."""
+        # 1) 외부 채용 플랫폼 링크가 이 페이지 안에 하나라도 있으면:
+        #    - 이 페이지를 외부 채용 연동 페이지로 인정
+        if self.contains_external_job_link(page):
+            return "external", "external_link"
 
-    def select_candidate_links(self, response):
-        """
-        PRIORITY_KEYWORDS 가 텍스트/레이블에 포함된 링크만 후보로 사용.
-        URL path 기반 가중치는 사용하지 않는다 (요청사항).
-        """
-        candidates = []
+        # 2) listing 형태 추정
+        if self.looks_like_listing(page, depth):
+            return "listing", "text"
 
-        for link in response.css("a"):
-            href = (link.attrib.get("href") or "").strip()
-            if not href:
-                continue
+        # 3) one_page / main 형태 추정
+        if self.looks_like_onepage(page, depth):
+            return ("main" if depth == 0 else "one_page"), "text"
 
-            text = " ".join(link.css("::text").getall()).strip()
-            label_parts = [
-                link.attrib.get("title"),
-                link.attrib.get("aria-label"),
-            ]
-            label = " ".join(filter(None, label_parts)).strip()
+        return None
 
-            score = self.score_link_text(text, label)
-            if score <= 0:
-                continue
+    def request_priority(self, score, depth):
+        return score - self.DEPTH_PENALTY * depth
 
-            full_url = response.urljoin(href)
-            if full_url in self.visited:
+    def finish(self, company, page_url, page_type, post_type):
+        """
+        결과를 저장하고, 저장됐으면 그 회사 탐색을 바로 끝낸다.
+        회사 1개 모드에서는 스파이더를 닫는다 (대기 중인 요청은 취소되고 finish_reason 은 "recruits_url_found").
+        """
+        if self.save_result(company.company_id, page_url=page_url, page_type=page_type, post_type=post_type):
+            company.found = True
+            self.company_done(company, "recruits_url_found")
+            if not self.multi:
+                raise CloseSpider("recruits_url_found")
+
+    def company_done(self, company, reason):
+        if company.company_id in self.company_close_reasons:
+            return
+        company.done_reason = reason
+        if self.multi:
+            self.report(company.company_id, reason)
+        else:
+            self.company_close_reasons[company.company_id] = reason
+
+    def report(self, company_id, reason, exit_code=0):
+        """multi-tenant 모드: 회사 하나가 끝날 때마다 러너가 읽을 결과 한 줄."""
+        self.company_close_reasons[company_id] = reason
+        sys.stdout.write(RESULT_PREFIX + json.dumps({
+            "company_id": company_id,
+            "exit": exit_code,
+            "reason": reason,
+        }) + "\n")
+        sys.stdout.flush()
+
+    def closed(self, reason):
+        # 스파이더가 먼저 닫힌 경우(시간/바이트 예산 등), 아직 안 끝난 회사는 그 사유로 보고.
+        # multi-tenant 에서는 실패로 보고한다 (exit 0 이면 체크포인트돼서 다음 사이클까지 건너뛰게 된다)
+        for company in self.companies.values():
+            if company.company_id in self.company_close_reasons:
                 continue
+            if self.multi:
+                self.report(company.company_id, reason, exit_code=1)
+            else:
+                self.company_close_reasons[company.company_id] = reason
+
+    # ===== 선택 엔진 =====
 
-            candidates.append((score, full_url))
+    def analyze(self, response, company):
+        return PageAnalysis(
+            response,
+            keywords=PRIORITY_MATCHER,
+            external_domains=EXTERNAL_DOMAIN_MATCHER,
+            is_same_domain=partial(self.is_same_domain, origin=company.start_domain),
+        )
+
+    def select_candidate_links(self, page, company):
+        """
+        PRIORITY_KEYWORDS 가 텍스트/레이블에 포함된, 같은 회사 도메인 링크만 후보로 사용.
+        리턴: [(점수, URL), ...] 점수 내림차순.
+        (외부 채용 도메인은 contains_external_job_link 에서 이미 처리)
+        URL path 기반 가중치는 사용하지 않는다 (요청사항).
+        onclick / javascript: / <script> 메뉴 JSON 안의 링크도 같은 규칙으로 후보에 넣는다 (crawler/script_links.py).
+        """
+        candidates = [
+            (a.score, a.url)
+            for a in self.job_anchors(page)
+            if a.same_domain and a.url not in company.visited
+        ]
 
         # 텍스트 기반 점수 내림차순 정렬
         candidates.sort(key=lambda x: x[0], reverse=True)
-        return [u for _, u in candidates]
-
-    def score_link_text(self, text, label):
-        text = (text or "").lower()
-        label = (label or "").lower()
-        combined = f"{text} {label}"
-        score = 0
-        for kw in PRIORITY_KEYWORDS:
-            if kw.lower() in combined:
-                score += 10
-        return score
+        return candidates
 
     # ===== 판단 엔진 =====
 
-    def contains_external_job_link(self, response):
+    def contains_external_job_link(self, page):
         """
         wanted/saramin/jobkorea 등으로 향하는 링크가 하나라도 있으면 True.
         그 경우: '탐색 대상 아님' → 현재 페이지를 외부 연동 채용 페이지로 간주.
         """
-        for href in response.css("a::attr(href)").getall():
-            href = (href or "").strip()
-            if not href:
-                continue
-            lower = href.lower()
-            if any(domain in lower for domain in EXTERNAL_JOB_DOMAINS):
-                return True
-        return False
+        return page.has_external_link
 
-    def looks_like_listing(self, response, text, depth):
+    def looks_like_listing(self, page, depth):
         """
         게시판형 목록 판단 로직 (오판 줄이기 버전)
         - 전제: '채용/커리어' 등 키워드가 페이지에 있어야 함
         - 핵심: 채용 관련 텍스트를 가진 링크가 '여러 개' 반복되어야 listing으로 인정
         - depth=0(홈페이지)에서는 더 강한 조건을 요구 (네비게이션 오판 방지)
         """
-        t = (text or "").lower()
-        if not any(k in t for k in ["채용", "recruit", "career", "jobs", "job", "employment"]):
+        if not LISTING_TEXT_MATCHER.search(page.text):
             return False
 
-        from collections import Counter
-
-        job_links = []
-
-        for a in response.css("a"):
-            href = (a.attrib.get("href") or "").strip()
-            if not href:
-                continue
-
-            link_text = " ".join(a.css("::text").getall()).strip().lower()
-            label = " ".join(filter(None, [
-                a.attrib.get("title"),
-                a.attrib.get("aria-label"),
-            ])).strip().lower()
-
-            combined = f"{link_text} {label}"
-
-            # PRIORITY_KEYWORDS 중 하나라도 포함된 링크만 "채용 관련 링크"로 본다
-            if any(kw.lower() in combined for kw in PRIORITY_KEYWORDS):
-                full = urlparse(response.urljoin(href))
-                # 쿼리/fragment 제거한 상위 path 기준으로 패턴 묶기
-                norm_path = full.path.rsplit("/", 2)[0]
-                job_links.append(norm_path)
-
-        if not job_links:
+        # PRIORITY_KEYWORDS 가 걸린 링크들을 상위 path 기준으로 묶은 개수
+        if not page.path_clusters:
             return False
 
-        counts = Counter(job_links)
-        max_count = counts.most_common(1)[0][1]
+        max_count = page.path_clusters.most_common(1)[0][1]
 
         # 홈페이지(depth=0)는 네비게이션 때문에 중복 path가 쉽게 생기므로
         # 더 엄격하게: 채용 관련 링크 path가 최소 5개 이상일 때만 listing 인정
@@ -715,22 +995,21 @@ class DiscoverCareersSpider(Spider):
         return max_count >= 3
 
 
-    def looks_like_onepage(self, response, text, depth):
+    def looks_like_onepage(self, page, depth):
         """
         단일 공고/안내 페이지:
         - 채용 관련 키워드 + 회사 소개/지원 안내 문구.
         """
-        t = (text or "").lower()
-        if not any(k in t for k in ["채용", "recruit", "career", "입사지원", "지원방법"]):
+        if not ONEPAGE_TEXT_MATCHER.search(page.text):
             return False
         # depth 0 이면 main 으로 처리, 그 외는 one_page
         return True
 
     # ===== 헬퍼 =====
 
-    def save_result(self, page_url, page_type, post_type):
+    def save_result(self, company_id, page_url, page_type, post_type):
         """
-        Company 레코드에 채용 페이지 정보 저장.
+        Company 레코드에 채용 페이지 정보 저장. 저장됐으면 True.
         Scrapy 비동기 컨텍스트에서 호출되므로,
         DJANGO_ALLOW_ASYNC_UNSAFE=true 전제 하에 동작.
         """
@@ -742,44 +1021,52 @@ class DiscoverCareersSpider(Spider):
                 except OperationalError:
                     conn.close()
 
-            updated = Company.objects.filter(id=self.company_id).update(
+            # 새로 찾은 페이지라 재확인 상태/검증값은 비운다 (api/recruits_revalidate.py 가 다시 기준을 잡는다)
+            updated = Company.objects.filter(id=company_id).update(
                 recruits_url=page_url,
                 page_type=page_type,
                 post_type=post_type,
+                recruits_url_status=None,
+                recruits_url_score=None,
+                recruits_url_checked_at=None,
+                recruits_url_redirect=None,
+                recruits_url_etag=None,
+                recruits_url_last_modified=None,
+                recruits_url_fingerprint=None,
             )
             if updated:
                 logger.info(
                     "[discover] SAVED company_id=%s url=%s page_type=%s post_type=%s",
-                    self.company_id,
+                    company_id,
                     page_url,
                     page_type,
                     post_type,
                 )
+                return True
             else:
                 logger.warning(
                     "[discover] FAILED TO UPDATE company_id=%s (no rows)",
-                    self.company_id,
+                    company_id,
                 )
         except Exception as e:
             logger.error(
                 "[discover] FAILED TO SAVE company_id=%s url=%s: %s",
-                self.company_id,
+                company_id,
                 page_url,
                 e,
             )
+        return False
 
-    def _get_text(self, response):
-        return " ".join(response.css("body ::text").getall())
-
-    def is_same_domain(self, url: str) -> bool:
+    def is_same_domain(self, url: str, origin: str = None) -> bool:
         """
         시작 도메인과 같은 회사 도메인인지 판정.
         - 정확히 같은 도메인 허용
         - 같은 최상위 도메인(eTLD+1)에 속한 서브도메인 허용
           (예: www.class101.net, jobs.class101.net, class101.net 모두 OK)
+        origin: 회사 시작 도메인 (없으면 회사 1개 모드의 start_domain)
         """
         target = urlparse(url).netloc.split(":")[0]
-        origin = self.start_domain.split(":")[0]
+        origin = (origin or self.start_domain).split(":")[0]
 
         if not target or not origin:
             return False
@@ -800,38 +1087,21 @@ class DiscoverCareersSpider(Spider):
 
         return False
 
-    def find_direct_recruit_link(self, response):
+    def find_direct_recruit_link(self, page):
         """
         depth=0 전용:
         메인 페이지에서 '채용' 계열 텍스트를 가진 a 태그를 찾아,
         같은 회사 도메인의 링크가 있으면 그 URL을 반환.
         (wanted/saramin/jobkorea 등 외부 플랫폼은 여기서 제외)
         """
-        for a in response.css("a"):
-            href = (a.attrib.get("href") or "").strip()
-            if not href:
-                continue
-
-            text = " ".join(a.css("::text").getall()).strip().lower()
-            label = " ".join(filter(None, [
-                a.attrib.get("title"),
-                a.attrib.get("aria-label"),
-            ])).strip().lower()
-            combined = f"{text} {label}"
-
-            # 채용 관련 명시적 텍스트가 있을 때만
-            if not any(kw.lower() in combined for kw in PRIORITY_KEYWORDS):
-                continue
-
-            full_url = response.urljoin(href)
-            lower = full_url.lower()
-
-            # 외부 채용 플랫폼(정책상 여기선 제외)
-            if any(domain in lower for domain in EXTERNAL_JOB_DOMAINS):
-                continue
-
-            # 같은 회사 도메인(서브도메인 포함)만 허용
-            if self.is_same_domain(full_url):
-                return full_url
-
-        return None
\ No newline at end of file
+        for a in self.job_anchors(page):
+            if not a.external and a.same_domain:
+                return a.url
+        return None
+
+    def job_anchors(self, page):
+        """<a href> 의 채용 링크 뒤에 스크립트/핸들러 안의 채용 링크 (CRAWL_SCRIPT_LINKS 일 때)."""
+        if not self.script_links:
+            return page.job_anchors
+        seen = {a.url for a in page.job_anchors}
+        return page.job_anchors + [a for a in page.script_job_anchors if a.url not in seen]
@@ -12,7 +12,12 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 os.environ.setdefault("DJANGO_ALLOW_ASYNC_UNSAFE", "true")
 django.setup()
 
-from api.models import Company, JobPosting  # noqa: E402
+from django.conf import settings as django_settings  # noqa: E402
+
+from api.models import Company  # noqa: E402
+from crawler.items import JobPostingItem, PostingsSeenItem  # noqa: E402
+from crawler.keyword_matcher import KeywordMatcher  # noqa: E402
+from crawler.script_links import extract_script_links  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +57,22 @@ BENEFIT_KEYWORDS = [
     "운동비", "도서구입비", "경조사비", "경조휴가", "스톡옵션", "자율출퇴근제",
 ]
 
+# _accept_as_job 로컬 룰: 이 중 2개 이상이면 채용공고로 본다
+JOB_TEXT_KEYWORDS = ["채용", "모집", "지원", "입사지원", "jobs", "recruit", "position", "경력", "신입"]
+
+LOCATION_KEYWORDS = [
+    "서울", "경기", "인천", "부산", "대구", "대전", "광주", "울산", "세종",
+    "충북", "충남", "전북", "전남", "경북", "경남", "강원", "제주",
+]
+
+# 키워드 리스트는 모듈 로드 때 한 번만 컴파일 (crawler/keyword_matcher.py)
+JOB_ANCHOR_MATCHER = KeywordMatcher(JOB_ANCHOR_KEYWORDS)
+EXCLUDE_ANCHOR_MATCHER = KeywordMatcher(EXCLUDE_ANCHOR_SUBSTRINGS)
+EXTERNAL_DOMAIN_MATCHER = KeywordMatcher(EXTERNAL_JOB_DOMAINS)
+BENEFIT_MATCHER = KeywordMatcher(BENEFIT_KEYWORDS)
+JOB_TEXT_MATCHER = KeywordMatcher(JOB_TEXT_KEYWORDS)
+LOCATION_MATCHER = KeywordMatcher(LOCATION_KEYWORDS)
+
 
 def _has_digit(s: str) -> bool:
     return any(ch.isdigit() for ch in s)
@@ -69,6 +90,7 @@ class JobCollectorSpider(Spider):
     """
     Company.recruits_url / page_type / post_type 기반으로
     실제 JobPosting 레코드를 생성/업데이트하는 스파이더.
+    (공고는 JobPostingItem 으로 yield 하고, 저장은 crawler.pipelines.JobPostingBulkPipeline 이 배치로 한다)
 
     정책 요약:
     - post_type='text' 만 대상 (유지)
@@ -113,6 +135,8 @@ class JobCollectorSpider(Spider):
 
         # 이미 처리한 상세 URL 중복 방지용
         self.seen_urls = set()
+        # onclick / javascript: / <script> 안의 링크도 후보로 볼지 (crawler/script_links.py)
+        self.script_links = getattr(django_settings, "CRAWL_SCRIPT_LINKS", True)
 
     # ============== 시작 ==============
 
@@ -145,19 +169,36 @@ class JobCollectorSpider(Spider):
             self.recruits_url,
         )
 
+        # conditional: 지난번 ETag/Last-Modified 로 조건부 요청 (crawler.middlewares.ConditionalRequestMiddleware)
         if target_type == "listing":
             yield Request(
                 url=self.recruits_url,
                 callback=self.parse_listing,
                 dont_filter=True,
+                meta={"conditional": True},
             )
         else:
             yield Request(
                 url=self.recruits_url,
                 callback=self.parse_onepage,
                 dont_filter=True,
+                meta={"conditional": True},
             )
 
+    def _not_modified(self, response, post_url=None):
+        """
+        304(그대로)면 파싱/분류/저장을 건너뛰고 last_seen_at 만 갱신할 item 을 돌려준다. 아니면 None.
+        post_url 이 None 이면 이 회사의 활성 공고 전부 (listing / one_page 가 그대로).
+        """
+        if response.status != 304:
+            return None
+        logger.info(
+            "job_collector: not modified company_id=%s url=%s -> skip parsing",
+            self.company_id,
+            response.url,
+        )
+        return PostingsSeenItem(company_id=self.company_id, post_url=post_url)
+
     # ============== 공통: 외부 플랫폼 감지 ==============
 
     def _check_external_platform(self, response):
@@ -165,8 +206,7 @@ class JobCollectorSpider(Spider):
             if not href:
                 continue
             url = response.urljoin(href.strip())
-            lower = url.lower()
-            if any(d in lower for d in EXTERNAL_JOB_DOMAINS):
+            if EXTERNAL_DOMAIN_MATCHER.search(url.lower()):
                 logger.warning(
                     "job_collector: external platform link detected "
                     "company_id=%s page=%s target=%s -> abort",
@@ -179,6 +219,11 @@ class JobCollectorSpider(Spider):
     # ============== listing 처리 ==============
 
     def parse_listing(self, response):
+        seen = self._not_modified(response)
+        if seen:
+            yield seen
+            return
+
         self._check_external_platform(response)
 
         links = self.extract_job_links(response)
@@ -187,7 +232,7 @@ class JobCollectorSpider(Spider):
                 "job_collector: found 0 candidate detail links on listing; fallback to one_page parser"
             )
             # listing 페이지 전체를 one_page처럼 해석 시도
-            self.parse_onepage(response)
+            yield from self.parse_onepage(response)
             return
 
         for url in links:
@@ -196,6 +241,7 @@ class JobCollectorSpider(Spider):
                 callback=self.parse_job_detail,
                 cb_kwargs={"from_listing": True},
                 dont_filter=True,
+                meta={"conditional": True},
             )
 
     def extract_job_links(self, response):
@@ -204,6 +250,7 @@ class JobCollectorSpider(Spider):
         - URL 패턴은 최소한만 사용 (같은 회사 도메인 여부 + 외부 플랫폼 필터)
         - 핵심은 앵커 텍스트의 채용 관련 키워드.
         - 전형절차/지원서/FAQ는 앵커 텍스트로 제거.
+        - onclick / javascript: / <script> 메뉴 JSON 안의 링크도 같은 텍스트 규칙으로 본다.
         """
         base = urlparse(response.url)
         base_domain = base.netloc
@@ -222,7 +269,7 @@ class JobCollectorSpider(Spider):
             parsed = urlparse(full)
 
             # 외부 플랫폼 -> 정책상 크롤링 안 함
-            if any(d in parsed.netloc.lower() for d in EXTERNAL_JOB_DOMAINS):
+            if EXTERNAL_DOMAIN_MATCHER.search(parsed.netloc.lower()):
                 logger.warning(
                     "job_collector: external platform link on listing "
                     "company_id=%s target=%s -> abort",
@@ -242,11 +289,11 @@ class JobCollectorSpider(Spider):
             anchor_text = anchor_text_raw.lower()
 
             # 모집절차/FAQ/지원서 등은 제외
-            if any(bad in anchor_text for bad in EXCLUDE_ANCHOR_SUBSTRINGS):
+            if EXCLUDE_ANCHOR_MATCHER.search(anchor_text):
                 continue
 
             # 채용/모집/인턴/경력/신입/구인/구합니다 등 포함되면 후보 인정
-            if any(kw in anchor_text for kw in JOB_ANCHOR_KEYWORDS):
+            if JOB_ANCHOR_MATCHER.search(anchor_text):
                 if full_clean not in seen:
                     seen.add(full_clean)
                     candidates.append(full_clean)
@@ -257,6 +304,27 @@ class JobCollectorSpider(Spider):
                         anchor_text_raw[:80],
                     )
 
+        if self.script_links:
+            for full, text in extract_script_links(response):
+                full_clean = full.rstrip("/")
+                parsed = urlparse(full)
+                # 스크립트 안의 외부 플랫폼 주소는 위젯/추적용일 수 있어서 중단하지 않고 건너뛴다
+                if EXTERNAL_DOMAIN_MATCHER.search(parsed.netloc.lower()):
+                    continue
+                if not self._same_org(base_domain, parsed.netloc):
+                    continue
+                if not text or EXCLUDE_ANCHOR_MATCHER.search(text):
+                    continue
+                if JOB_ANCHOR_MATCHER.search(text) and full_clean not in seen:
+                    seen.add(full_clean)
+                    candidates.append(full_clean)
+                    logger.info(
+                        "job_collector: listing candidate by script company_id=%s url=%s text=%s",
+                        self.company_id,
+                        full_clean,
+                        text[:80],
+                    )
+
         logger.info(
             "job_collector: found %s candidate detail links on listing page",
             len(candidates),
@@ -266,6 +334,11 @@ class JobCollectorSpider(Spider):
     # ============== one_page / main 처리 ==============
 
     def parse_onepage(self, response):
+        seen = self._not_modified(response)
+        if seen:
+            yield seen
+            return
+
         self._check_external_platform(response)
 
         url = response.url
@@ -321,23 +394,32 @@ class JobCollectorSpider(Spider):
         )
 
         for data in jobs:
-            self.upsert_jobposting(data)
+            item = self.build_item(data)
+            if item:
+                yield item
 
     # ============== 상세 페이지 처리 ==============
 
     def parse_job_detail(self, response, from_listing=False):
-        self._check_external_platform(response)
-
         url = response.url.rstrip("/")
         if url in self.seen_urls:
             return
         self.seen_urls.add(url)
 
+        seen = self._not_modified(response, post_url=url)
+        if seen:
+            yield seen
+            return
+
+        self._check_external_platform(response)
+
         data = self.extract_job_from_detail(response, from_listing=from_listing)
         if not data:
             return
 
-        self.upsert_jobposting(data)
+        item = self.build_item(data)
+        if item:
+            yield item
 
     def extract_job_from_detail(self, response, from_listing=False):
         url = response.url.rstrip("/")
@@ -469,13 +551,7 @@ class JobCollectorSpider(Spider):
                     e,
                 )
 
-        lowered = snippet.lower()
-        hits = 0
-        for kw in ["채용", "모집", "지원", "입사지원", "jobs", "recruit", "position", "경력", "신입"]:
-            if kw in lowered:
-                hits += 1
-
-        return hits >= 2
+        return JOB_TEXT_MATCHER.count(snippet.lower()) >= 2
 
     # ============== 텍스트 파싱 헬퍼 ==============
 
@@ -492,17 +568,11 @@ class JobCollectorSpider(Spider):
         return ""
 
     def extract_benefits(self, text: str) -> str:
-        found = [b for b in BENEFIT_KEYWORDS if b in text]
-        return ", ".join(sorted(set(found)))
+        return ", ".join(sorted(BENEFIT_MATCHER.matched(text)))
 
     def extract_location(self, text: str) -> str:
-        for kw in [
-            "서울", "경기", "인천", "부산", "대구", "대전", "광주", "울산", "세종",
-            "충북", "충남", "전북", "전남", "경북", "경남", "강원", "제주",
-        ]:
-            if kw in text:
-                return kw
-        return ""
+        found = LOCATION_MATCHER.matched(text)
+        return found[0] if found else ""
 
     def extract_employment_type(self, text: str) -> str:
         if "정규직" in text:
@@ -523,83 +593,21 @@ class JobCollectorSpider(Spider):
             return "협의"
         return ""
 
-    # ============== DB upsert ==============
-
-    def upsert_jobposting(self, data: dict):
-        post_url = data.get("post_url")
-        if not post_url:
-            return
+    # ============== item ==============
 
-        defaults = {
-            "company": self.company,
-            "title": (data.get("title") or "")[:255],
-            "status": "active",
-        }
-
-        field_limits = {
-            "job_description": 20000,
-            "qualifications": 10000,
-            "preferred_qualifications": 10000,
-            "hiring_process": 5000,
-            "benefits": 5000,
-            "hiring_message": 5000,
-            "location": 255,
-            "employment_type": 50,
-            "salary": 255,
-            "work_hours": 100,
-        }
-
-        for field, max_len in field_limits.items():
-            if hasattr(JobPosting, field) and data.get(field):
-                defaults[field] = str(data[field])[:max_len]
-
-        obj, created = JobPosting.objects.get_or_create(
-            post_url=post_url,
-            defaults=defaults,
-        )
-
-        logger.info(
-            "job_collector: upsert attempt company_id=%s url=%s created=%s",
-            self.company_id,
-            post_url,
-            created,
-        )
-
-        if created:
+    def build_item(self, data: dict):
+        """
+        파싱 결과 -> JobPostingItem.
+        DB 저장은 crawler.pipelines.JobPostingBulkPipeline 이 배치로 한다 (reactor 스레드 밖에서).
+        """
+        item = JobPostingItem.from_data(self.company_id, data)
+        if item:
             logger.info(
-                "job_collector: created JobPosting company_id=%s id=%s url=%s",
+                "job_collector: posting company_id=%s url=%s",
                 self.company_id,
-                obj.id,
-                post_url,
-            )
-            return
-
-        changed = False
-
-        new_title = (data.get("title") or "").strip()
-        if new_title and obj.title != new_title[:255]:
-            obj.title = new_title[:255]
-            changed = True
-
-        for field, max_len in field_limits.items():
-            if not hasattr(obj, field):
-                continue
-            new_val = (data.get(field) or "").strip()
-            if new_val and getattr(obj, field) != new_val[:max_len]:
-                setattr(obj, field, new_val[:max_len])
-                changed = True
-
-        if obj.status != "active":
-            obj.status = "active"
-            changed = True
-
-        if changed:
-            obj.save()
-            logger.info(
-                "job_collector: updated JobPosting id=%s url=%s",
-                obj.id,
-                post_url,
+                item["post_url"],
             )
+        return item
 
     # ============== 종료 ==============
 